@@ -6,6 +6,7 @@ from app.api.routes_admin_settings import router as admin_settings_router
 from app.api.routes_categories import router as categories_router
 from app.api.routes_channel_lookup import router as channel_lookup_router
 from app.api.routes_channels import router as channels_router
+from app.api.routes_dashboard import router as dashboard_router
 from app.api.routes_feed import router as feed_router
 from app.api.routes_kids import router as kids_router
 from app.api.routes_logs import router as logs_router
@@ -22,6 +23,7 @@ api_router.include_router(channels_router, prefix="/api/channels", tags=["channe
 api_router.include_router(channel_lookup_router, prefix="/api/channel-lookup", tags=["channels"])
 api_router.include_router(categories_router, prefix="/api/categories", tags=["categories"])
 api_router.include_router(feed_router, prefix="/api/feed", tags=["feed"])
+api_router.include_router(dashboard_router, prefix="/api/dashboard", tags=["feed"])
 api_router.include_router(kids_router, prefix="/api/kids", tags=["kids"])
 api_router.include_router(logs_router, prefix="/api/logs", tags=["logs"])
 api_router.include_router(playback_router, prefix="/api/playback", tags=["playback"])
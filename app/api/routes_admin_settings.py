@@ -3,10 +3,11 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 from pydantic import BaseModel
 
 from app.core.config import settings
+from app.services.youtube_quota import quota_report
 
 router = APIRouter()
 SETTINGS_FILE = Path('/data/notification_settings.json')
@@ -49,3 +50,8 @@ def save_notification_settings(payload: NotificationSettingsPayload) -> dict[str
     settings.discord_approval_webhook_url = data['discord_approval_webhook_url']
 
     return {'ok': True}
+
+
+@router.get('/quota')
+def get_youtube_quota(days: int = Query(default=7, ge=1, le=90)) -> dict[str, object]:
+    return quota_report(days)
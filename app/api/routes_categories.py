@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
@@ -8,6 +8,7 @@ from sqlmodel import Session, select
 
 from app.db.models import Category
 from app.db.session import get_session
+from app.services import content_version, policy_cache
 
 router = APIRouter()
 
@@ -36,9 +37,13 @@ class CategoryRead(BaseModel):
 
 @router.get("", response_model=list[CategoryRead])
 def list_categories(
+    request: Request,
+    response: Response,
     session: Session = Depends(get_session),
     include_disabled: bool = Query(default=False),
-) -> list[Category]:
+) -> list[Category] | Response:
+    if cached := content_version.not_modified(request, response):
+        return cached
     query = select(Category)
     if not include_disabled:
         query = query.where(Category.enabled.is_(True))
@@ -62,6 +67,8 @@ def create_category(payload: CategoryCreate, session: Session = Depends(get_sess
     except IntegrityError:
         session.rollback()
         raise HTTPException(status_code=409, detail="Category name must be unique") from None
+    policy_cache.invalidate_all()
+    content_version.bump()
     session.refresh(category)
     return category
 
@@ -98,6 +105,8 @@ def patch_category(
     except IntegrityError:
         session.rollback()
         raise HTTPException(status_code=409, detail="Category name must be unique") from None
+    policy_cache.invalidate_all()
+    content_version.bump()
     session.refresh(category)
     return category
 
@@ -130,6 +139,8 @@ def disable_category(
     if hard_delete and not in_use:
         session.delete(category)
         session.commit()
+        policy_cache.invalidate_all()
+        content_version.bump()
         return CategoryRead.model_validate(
             {
                 "id": category_id,
@@ -143,5 +154,7 @@ def disable_category(
     category.enabled = False
     session.add(category)
     session.commit()
+    policy_cache.invalidate_all()
+    content_version.bump()
     session.refresh(category)
     return category
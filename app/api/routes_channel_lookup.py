@@ -64,7 +64,11 @@ async def channel_lookup(query: str = Query(min_length=1, max_length=500)) -> Ch
         return _not_found_response(normalized)
 
     try:
-        sample = await fetch_latest_videos(channel_id, max_results=6)
+        sample = await fetch_latest_videos(
+            channel_id,
+            max_results=6,
+            uploads_playlist_id=metadata.get("uploads_playlist_id"),
+        )
 
         channel = ChannelLookupPreview(
             youtube_id=channel_id,
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from pydantic import BaseModel
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
@@ -11,7 +11,14 @@ from sqlmodel import Session, select
 
 from app.db.models import Channel
 from app.db.session import get_session
-from app.services.limits import check_access
+from app.services import content_version
+from app.services.limits import check_access, without_blocked_titles
+from app.services.pagination import (
+    NEXT_CURSOR_HEADER,
+    cursor_params,
+    encode_cursor,
+    keyset_condition,
+)
 from app.services.sync import store_videos
 from app.services.youtube import fetch_latest_videos, resolve_channel
 
@@ -83,6 +90,7 @@ async def create_channel(
         channel.banner_url = metadata.get("banner_url")
         channel.description = metadata.get("description")
         channel.subscriber_count = metadata.get("subscriber_count")
+        channel.uploads_playlist_id = metadata.get("uploads_playlist_id")
         channel.resolve_status = "ok"
         channel.resolve_error = None
         channel.resolved_at = datetime.now(timezone.utc)  # noqa: UP017
@@ -96,16 +104,20 @@ async def create_channel(
     except IntegrityError as exc:
         session.rollback()
         raise HTTPException(status_code=409, detail="Channel already exists") from exc
+    content_version.bump()
 
     session.refresh(channel)
 
     if channel.resolve_status == "ok" and channel.allowed and not channel.blocked:
         try:
-            videos = await fetch_latest_videos(channel.youtube_id)
+            videos = await fetch_latest_videos(
+                channel.youtube_id, uploads_playlist_id=channel.uploads_playlist_id
+            )
             store_videos(session, channel.id, videos)
             channel.last_sync = datetime.now(timezone.utc)  # noqa: UP017
             session.add(channel)
             session.commit()
+            content_version.bump()
             session.refresh(channel)
         except Exception as exc:
             channel.resolve_error = str(exc)
@@ -141,6 +153,7 @@ def patch_channel(
 
     session.add(channel)
     session.commit()
+    content_version.bump()
     session.refresh(channel)
     return channel
 
@@ -157,14 +170,11 @@ def delete_channel(channel_id: int, session: Session = Depends(get_session)) ->
     )
     session.delete(channel)
     session.commit()
+    content_version.bump()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-@router.get('/allowed')
-def list_allowed_channels(
-    kid_id: int | None = Query(default=None),
-    session: Session = Depends(get_session),
-) -> list[dict[str, object | None]]:
+def allowed_channel_rows(session: Session) -> list[dict[str, object | None]]:
     rows = session.execute(
         text(
             """
@@ -178,6 +188,18 @@ def list_allowed_channels(
     return [dict(row) for row in rows]
 
 
+@router.get('/allowed')
+def list_allowed_channels(
+    request: Request,
+    response: Response,
+    kid_id: int | None = Query(default=None),
+    session: Session = Depends(get_session),
+) -> list[dict[str, object | None]]:
+    if cached := content_version.not_modified(request, response):
+        return cached
+    return allowed_channel_rows(session)
+
+
 
 
 @router.get('/youtube/{channel_youtube_id}')
@@ -227,15 +249,19 @@ def channel_detail(
 @router.get('/{channel_youtube_id}/videos')
 def channel_videos(
     channel_youtube_id: str,
+    response: Response,
     kid_id: int | None = Query(default=None),
     limit: int = Query(default=24, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
     content_type: str = Query(default="all", pattern="^(all|videos|shorts)$"),
     session: Session = Depends(get_session),
 ) -> list[dict[str, object | None]]:
+    page_params = cursor_params(cursor)
+    keyset = f"AND {keyset_condition()}" if cursor else ""
     rows = session.execute(
         text(
-            """
+            f"""
             SELECT
                 v.youtube_id AS video_youtube_id,
                 v.title AS video_title,
@@ -243,7 +269,8 @@ def channel_videos(
                 v.published_at AS video_published_at,
                 v.duration_seconds AS video_duration_seconds,
                 v.is_short AS video_is_short,
-                v.view_count AS video_view_count
+                v.view_count AS video_view_count,
+                v.id AS video_id
             FROM videos v
             JOIN channels c ON c.id = v.channel_id
             WHERE c.youtube_id = :channel_youtube_id
@@ -255,15 +282,23 @@ def channel_videos(
                 OR (:content_type = 'videos' AND v.is_short = 0)
                 OR (:content_type = 'shorts' AND v.is_short = 1)
               )
-            ORDER BY v.published_at DESC
+              {keyset}
+            ORDER BY v.published_at DESC, v.id DESC
             LIMIT :limit OFFSET :offset
             """
         ),
                 {
             "channel_youtube_id": channel_youtube_id,
             "limit": limit,
-            "offset": offset,
+            "offset": 0 if cursor else offset,
             "content_type": content_type,
+            **page_params,
         },
     ).mappings().all()
-    return [dict(row) for row in rows]
+    if len(rows) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            rows[-1]["video_published_at"], rows[-1]["video_id"]
+        )
+    if kid_id is not None:
+        rows = without_blocked_titles(session, rows, "video_title")
+    return [{key: value for key, value in row.items() if key != "video_id"} for row in rows]
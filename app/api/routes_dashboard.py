@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query, Request
+from pydantic import BaseModel
+from sqlmodel import Session, select
+
+from app.api.routes_categories import CategoryRead
+from app.api.routes_channels import allowed_channel_rows
+from app.api.routes_feed import FeedItem, latest_per_channel_rows, shorts_rows
+from app.db.models import Category
+from app.db.session import get_session
+from app.services import content_version, dashboard_cache
+from app.services.limits import evaluate_access, load_policy_snapshot
+
+router = APIRouter()
+
+DASHBOARD_SHORTS_LIMIT = 20
+
+
+class DashboardBundle(BaseModel):
+    kid_id: int | None
+    pending_kid_id: int | None
+    categories: list[CategoryRead]
+    allowed_channels: list[dict[str, object | None]]
+    latest_per_channel: list[FeedItem]
+    shorts: list[FeedItem]
+
+
+def _load_shared(session: Session) -> dict[str, Any]:
+    categories = session.exec(
+        select(Category).where(Category.enabled.is_(True)).order_by(Category.id)
+    ).all()
+    return {
+        "categories": [CategoryRead.model_validate(category) for category in categories],
+        "allowed_channels": allowed_channel_rows(session),
+        "latest_per_channel": latest_per_channel_rows(session),
+        "shorts": shorts_rows(session, DASHBOARD_SHORTS_LIMIT),
+    }
+
+
+@router.get("", response_model=DashboardBundle)
+def dashboard(
+    request: Request,
+    kid_id: int | None = Query(default=None),
+    session: Session = Depends(get_session),
+) -> dict[str, Any]:
+    """Everything the dashboard needs on first paint, in one round trip.
+
+    Defaults to the kid selected in the session. The shared lists come from the dashboard
+    cache; the kid's access gate and blocked words are applied per request.
+    """
+    if kid_id is None:
+        kid_id = request.session.get("kid_id")
+
+    shared = dashboard_cache.get()
+    if shared is None:
+        loaded_version = content_version.current()
+        shared = _load_shared(session)
+        dashboard_cache.put(loaded_version, shared)
+
+    latest_per_channel = shared["latest_per_channel"]
+    shorts = shared["shorts"]
+    if kid_id is not None:
+        now = datetime.now(timezone.utc)  # noqa: UP017
+        snapshot = load_policy_snapshot(session, kid_id, now)
+        matcher = snapshot.word_matcher
+        if evaluate_access(snapshot, None, now=now)[0]:
+            latest_per_channel = [
+                item
+                for item in latest_per_channel
+                if matcher.first_match(item["video_title"]) is None
+            ]
+        else:
+            latest_per_channel = []
+        if evaluate_access(snapshot, None, is_shorts=True, now=now)[0]:
+            shorts = [item for item in shorts if matcher.first_match(item["video_title"]) is None]
+        else:
+            shorts = []
+
+    return {
+        "kid_id": request.session.get("kid_id"),
+        "pending_kid_id": request.session.get("pending_kid_id"),
+        "categories": shared["categories"],
+        "allowed_channels": shared["allowed_channels"],
+        "latest_per_channel": latest_per_channel,
+        "shorts": shorts,
+    }
@@ -14,6 +14,7 @@ from app.core.config import settings
 from app.db.models import KidBonusTime, VideoApproval
 from app.db.models import Request as ApprovalRequest
 from app.db.session import get_session
+from app.services import content_version, kid_events
 
 router = APIRouter(prefix="/discord", tags=["discord"])
 logger = logging.getLogger(__name__)
@@ -115,6 +116,10 @@ def _resolve_request_action(session: Session, request_id: int, action: str) -> N
 
     session.add(request_row)
     session.commit()
+    if request_row.type == "channel":
+        content_version.bump()
+    elif request_row.type == "bonus" and request_row.kid_id:
+        kid_events.notify(request_row.kid_id)
 
 
 @router.post("/interactions")
@@ -154,5 +159,6 @@ async def discord_interactions(
             minutes = _bonus_minutes_from_code(parts[2])
             session.add(KidBonusTime(kid_id=int(parts[1]), minutes=minutes, expires_at=None))
             session.commit()
+            kid_events.notify(int(parts[1]))
 
     return {"type": 4, "data": {"content": "Action processed", "flags": 64}}
@@ -2,16 +2,33 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from pydantic import BaseModel
 from sqlalchemy import text
 from sqlmodel import Session
 
 from app.db.session import get_session
-from app.services.limits import check_access
+from app.services import content_version
+from app.services.limits import check_access, without_blocked_titles
+from app.services.pagination import (
+    NEXT_CURSOR_HEADER,
+    cursor_params,
+    encode_cursor,
+    keyset_condition,
+)
 
 router = APIRouter()
 
+# channels.latest_video_id is kept on the channel's newest non-short feed item by the 0022
+# triggers, so this is one primary key lookup per channel. Ineligible channels have no feed
+# items and therefore a NULL pointer.
+LATEST_PER_CHANNEL_SQL = """
+SELECT f.*
+FROM channels c
+JOIN feed_items f ON f.video_id = c.latest_video_id
+ORDER BY f.video_published_at DESC, f.video_id DESC
+"""
+
 
 class FeedItem(BaseModel):
     channel_id: int
@@ -30,8 +47,30 @@ class FeedItem(BaseModel):
     video_view_count: int | None = None
 
 
+def latest_per_channel_rows(session: Session) -> list[dict[str, object]]:
+    return [dict(row) for row in session.execute(text(LATEST_PER_CHANNEL_SQL)).mappings()]
+
+
+def shorts_rows(session: Session, limit: int) -> list[dict[str, object]]:
+    rows = session.execute(
+        text(
+            """
+            SELECT f.*
+            FROM feed_items f
+            WHERE f.video_is_short = 1
+            ORDER BY f.video_published_at DESC, f.video_id DESC
+            LIMIT :limit
+            """
+        ),
+        {"limit": limit},
+    ).mappings()
+    return [dict(row) for row in rows]
+
+
 @router.get("", response_model=list[FeedItem])
 def list_feed(
+    request: Request,
+    response: Response,
     session: Session = Depends(get_session),
     limit: int = Query(default=30, ge=1, le=100),
     channel_id: int | None = Query(default=None),
@@ -39,9 +78,11 @@ def list_feed(
     kid_id: int | None = Query(default=None),
     offset: int = Query(default=0, ge=0),
     cursor: str | None = Query(default=None),
-) -> list[FeedItem]:
-    del cursor
+) -> list[FeedItem] | Response:
+    if kid_id is None and (cached := content_version.not_modified(request, response)):
+        return cached
     category_id: int | None = None
+    page_params = cursor_params(cursor)
 
     if category is not None:
         category_row = session.execute(
@@ -67,40 +108,21 @@ def list_feed(
         )
         if not allowed:
             return []
+        if cached := content_version.not_modified(request, response, kid_scoped=True):
+            return cached
+    filters = ["f.video_is_short = 0"]
+    if channel_id is not None:
+        filters.append("f.channel_id = :channel_id")
+    if category is not None:
+        filters.append("f.category_key = :category")
+    if cursor:
+        filters.append(keyset_condition("f.video_published_at", "f.video_id"))
     query = text(
-        """
-        SELECT
-            c.id AS channel_id,
-            c.youtube_id AS channel_youtube_id,
-            c.title AS channel_title,
-            c.avatar_url AS channel_avatar_url,
-            c.category AS channel_category,
-            c.category_id AS channel_category_id,
-            cat.name AS channel_category_name,
-            v.youtube_id AS video_youtube_id,
-            v.title AS video_title,
-            v.thumbnail_url AS video_thumbnail_url,
-            v.published_at AS video_published_at,
-            v.duration_seconds AS video_duration_seconds,
-            v.is_short AS video_is_short,
-            v.view_count AS video_view_count
-        FROM videos v
-        JOIN channels c ON c.id = v.channel_id
-        LEFT JOIN categories cat ON cat.id = c.category_id
-        WHERE c.enabled = 1
-          AND c.allowed = 1
-          AND c.blocked = 0
-          AND (c.category_id IS NULL OR cat.enabled = 1)
-          AND (:channel_id IS NULL OR c.id = :channel_id)
-          AND (
-            :category IS NULL
-            OR (
-              (c.category_id IS NOT NULL AND cat.name = :category AND cat.enabled = 1)
-              OR (c.category_id IS NULL AND c.category = :category)
-            )
-          )
-          AND v.is_short = 0
-        ORDER BY v.published_at DESC
+        f"""
+        SELECT f.*
+        FROM feed_items f
+        WHERE {" AND ".join(filters)}
+        ORDER BY f.video_published_at DESC, f.video_id DESC
         LIMIT :limit OFFSET :offset
         """
     )
@@ -110,17 +132,28 @@ def list_feed(
             "channel_id": channel_id,
             "category": category,
             "limit": limit,
-            "offset": offset,
+            "offset": 0 if cursor else offset,
+            **page_params,
         },
     ).mappings().all()
+    if len(rows) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            rows[-1]["video_published_at"], rows[-1]["video_id"]
+        )
+    if kid_id is not None:
+        rows = without_blocked_titles(session, rows, "video_title")
     return [FeedItem.model_validate(row) for row in rows]
 
 
 @router.get("/latest-per-channel", response_model=list[FeedItem])
 def latest_per_channel(
+    request: Request,
+    response: Response,
     kid_id: int | None = Query(default=None),
     session: Session = Depends(get_session),
-) -> list[FeedItem]:
+) -> list[FeedItem] | Response:
+    if kid_id is None and (cached := content_version.not_modified(request, response)):
+        return cached
     now = datetime.now(timezone.utc)  # noqa: UP017
     if kid_id is not None:
         allowed, _reason, _details = check_access(
@@ -128,85 +161,34 @@ def latest_per_channel(
         )
         if not allowed:
             return []
-    query = text(
-        """
-        SELECT
-            c.id AS channel_id,
-            c.youtube_id AS channel_youtube_id,
-            c.title AS channel_title,
-            c.avatar_url AS channel_avatar_url,
-            c.category AS channel_category,
-            c.category_id AS channel_category_id,
-            cat.name AS channel_category_name,
-            v.youtube_id AS video_youtube_id,
-            v.title AS video_title,
-            v.thumbnail_url AS video_thumbnail_url,
-            v.published_at AS video_published_at,
-            v.duration_seconds AS video_duration_seconds,
-            v.is_short AS video_is_short,
-            v.view_count AS video_view_count
-        FROM channels c
-        JOIN videos v ON v.channel_id = c.id
-        LEFT JOIN categories cat ON cat.id = c.category_id
-        WHERE c.enabled = 1
-          AND c.allowed = 1
-          AND c.blocked = 0
-          AND (c.category_id IS NULL OR cat.enabled = 1)
-          AND v.is_short = 0
-          AND v.id = (
-            SELECT vv.id
-            FROM videos vv
-            WHERE vv.channel_id = c.id
-              AND vv.is_short = 0
-            ORDER BY vv.published_at DESC
-            LIMIT 1
-          )
-        ORDER BY v.published_at DESC
-        """
-    )
-    rows = session.execute(query).mappings().all()
+        if cached := content_version.not_modified(request, response, kid_scoped=True):
+            return cached
+    rows = latest_per_channel_rows(session)
+    if kid_id is not None:
+        rows = without_blocked_titles(session, rows, "video_title")
     return [FeedItem.model_validate(row) for row in rows]
 
 
 @router.get('/shorts', response_model=list[FeedItem])
 def list_shorts(
+    request: Request,
+    response: Response,
     limit: int = Query(default=20, ge=1, le=50),
     kid_id: int | None = Query(default=None),
     session: Session = Depends(get_session),
-) -> list[FeedItem]:
+) -> list[FeedItem] | Response:
+    if kid_id is None and (cached := content_version.not_modified(request, response)):
+        return cached
     now = datetime.now(timezone.utc)  # noqa: UP017
     if kid_id is not None:
         allowed, _reason, _details = check_access(
-            session, kid_id=kid_id, now=now
+            session, kid_id=kid_id, is_shorts=True, now=now
         )
         if not allowed:
             return []
-    rows = session.execute(
-        text(
-            """
-            SELECT
-                c.id AS channel_id,
-                c.youtube_id AS channel_youtube_id,
-                c.title AS channel_title,
-                c.avatar_url AS channel_avatar_url,
-                c.category AS channel_category,
-                c.category_id AS channel_category_id,
-                cat.name AS channel_category_name,
-                v.youtube_id AS video_youtube_id,
-                v.title AS video_title,
-                v.thumbnail_url AS video_thumbnail_url,
-                v.published_at AS video_published_at,
-                v.duration_seconds AS video_duration_seconds,
-                v.is_short AS video_is_short,
-                v.view_count AS video_view_count
-            FROM videos v
-            JOIN channels c ON c.id = v.channel_id
-            LEFT JOIN categories cat ON cat.id = c.category_id
-            WHERE c.enabled = 1 AND c.allowed = 1 AND c.blocked = 0 AND v.is_short = 1
-            ORDER BY v.published_at DESC
-            LIMIT :limit
-            """
-        ),
-        {"limit": limit},
-    ).mappings().all()
+        if cached := content_version.not_modified(request, response, kid_scoped=True):
+            return cached
+    rows = shorts_rows(session, limit)
+    if kid_id is not None:
+        rows = without_blocked_titles(session, rows, "video_title")
     return [FeedItem.model_validate(row) for row in rows]
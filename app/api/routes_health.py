@@ -6,7 +6,14 @@ from sqlalchemy import text
 from sqlmodel import Session
 
 from app.core.config import settings
+from app.core.http_client import http_pool_metrics
 from app.db.session import get_session
+from app.services.dashboard_cache import dashboard_cache_metrics
+from app.services.heartbeat_dedup import heartbeat_dedup_metrics
+from app.services.kid_events import kid_events_metrics
+from app.services.policy_cache import policy_cache_metrics
+from app.services.watch_buffer import watch_buffer_metrics
+from app.services.youtube_cache import youtube_cache_metrics
 
 router = APIRouter()
 
@@ -23,7 +30,7 @@ def ready(session: Session = Depends(get_session)) -> dict[str, bool]:
 
 
 @router.get("/api/system")
-def system_details(request: Request) -> dict[str, int | bool | str | None]:
+def system_details(request: Request) -> dict[str, object]:
     db_path = settings.sqlite_path
     db_exists = bool(db_path and db_path.exists())
     db_size_bytes = db_path.stat().st_size if db_path and db_path.exists() else 0
@@ -40,4 +47,11 @@ def system_details(request: Request) -> dict[str, int | bool | str | None]:
         "db_size_bytes": db_size_bytes,
         "uptime_seconds": uptime_seconds,
         "app_version": settings.app_version,
+        "http_pool": http_pool_metrics(),
+        "youtube_cache": youtube_cache_metrics(),
+        "policy_cache": policy_cache_metrics(),
+        "dashboard_cache": dashboard_cache_metrics(),
+        "watch_buffer": watch_buffer_metrics(),
+        "heartbeat_dedup": heartbeat_dedup_metrics(),
+        "kid_events": kid_events_metrics(),
     }
@@ -9,6 +9,12 @@ from sqlmodel import Session, select
 from app.core.config import settings
 from app.db.models import Kid, KidBonusTime, KidSchedule
 from app.db.session import get_session
+from app.services import kid_events, policy_cache
+from app.services.limits import (
+    ACCESS_REASON_BEDTIME,
+    ACCESS_REASON_SCHEDULE,
+    load_kid_timeline,
+)
 from app.services.security import hash_pin
 
 router = APIRouter()
@@ -79,6 +85,14 @@ class KidScheduleRead(BaseModel):
     created_at: datetime
 
 
+class KidScheduleStatus(BaseModel):
+    kid_id: int
+    allowed: bool
+    reason: str | None
+    next_unlock_at: datetime | None
+    next_lock_at: datetime | None
+
+
 class KidCategoryLimitUpdate(BaseModel):
     daily_limit_minutes: int = Field(ge=0)
 
@@ -147,6 +161,7 @@ def patch_kid(kid_id: int, payload: KidUpdate, session: Session = Depends(get_se
 
     session.add(kid)
     session.commit()
+    policy_cache.invalidate_kid(kid_id)
     session.refresh(kid)
     return KidRead.model_validate(
         {
@@ -204,6 +219,7 @@ def create_kid_schedule(
     schedule = KidSchedule(kid_id=kid_id, **payload.model_dump())
     session.add(schedule)
     session.commit()
+    policy_cache.invalidate_kid(kid_id)
     session.refresh(schedule)
     return schedule
 
@@ -219,9 +235,34 @@ def delete_kid_schedule(
 
     session.delete(schedule)
     session.commit()
+    policy_cache.invalidate_kid(kid_id)
     return {"ok": True}
 
 
+@router.get("/{kid_id}/schedule-status", response_model=KidScheduleStatus)
+def get_kid_schedule_status(
+    kid_id: int, session: Session = Depends(get_session)
+) -> KidScheduleStatus:
+    """Whether schedules and bedtime allow watching now, and when that next changes (UTC)."""
+    now = datetime.now(timezone.utc)  # noqa: UP017
+    timeline = load_kid_timeline(session, kid_id)
+    segment = timeline.segment_at(now)
+    next_change = timeline.next_change(now)
+    if not segment.in_schedule:
+        reason: str | None = ACCESS_REASON_SCHEDULE
+    elif segment.in_bedtime:
+        reason = ACCESS_REASON_BEDTIME
+    else:
+        reason = None
+    return KidScheduleStatus(
+        kid_id=kid_id,
+        allowed=segment.allowed,
+        reason=reason,
+        next_unlock_at=None if segment.allowed else next_change,
+        next_lock_at=next_change if segment.allowed else None,
+    )
+
+
 @router.get("/{kid_id}/category-limits")
 def list_kid_category_limits(
     kid_id: int, session: Session = Depends(get_session)
@@ -300,6 +341,7 @@ def upsert_kid_category_limit(
         )
 
     session.commit()
+    policy_cache.invalidate_kid(kid_id)
     return {"ok": True}
 
 
@@ -318,6 +360,7 @@ def delete_kid_category_limit(
         {"kid_id": kid_id, "category_id": category_id},
     )
     session.commit()
+    policy_cache.invalidate_kid(kid_id)
     return {"ok": True}
 
 
@@ -349,6 +392,7 @@ def create_kid_bonus_time(
     session.add(bonus_time)
     session.commit()
     session.refresh(bonus_time)
+    kid_events.notify(kid_id)
     return bonus_time
 
 
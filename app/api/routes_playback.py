@@ -1,18 +1,31 @@
 from __future__ import annotations
 
+import asyncio
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy import text
+from sqlalchemy.engine import Engine
 from sqlmodel import Session
 
-from app.db.models import WatchLog
+from app.db.models import Kid, WatchLog
 from app.db.session import get_session
-from app.services.limits import check_access
+from app.services import heartbeat_dedup, kid_events, watch_buffer
+from app.services.limits import (
+    check_access,
+    evaluate_access,
+    load_access_inputs,
+    remaining_seconds_in,
+)
 
 router = APIRouter()
 
+STREAM_RECHECK_SECONDS = 60
+
 _LEGACY_REASON_DETAILS = {
     "daily_limit": "Daily watch limit reached",
     "category_limit": "Daily watch limit reached",
@@ -127,42 +140,127 @@ def log_watch_heartbeat(
     if not payload.is_playing:
         return {"ok": True}
 
-    most_recent = session.execute(
-        text(
-            """
-            SELECT created_at
-            FROM watch_log
-            WHERE kid_id = :kid_id AND video_id = :video_id
-            ORDER BY id DESC
-            LIMIT 1
-            """
-        ),
-        {"kid_id": payload.kid_id, "video_id": video["video_id"]},
-    ).first()
-    if most_recent and most_recent[0]:
-        raw_then = most_recent[0]
+    def last_logged_heartbeat() -> datetime | None:
+        # Un-flushed heartbeats are newer than anything in watch_log for this kid and video.
+        buffered = watch_buffer.last_seen(session, payload.kid_id, video["video_id"])
+        if buffered is not None:
+            return buffered
+        row = session.execute(
+            text(
+                """
+                SELECT COALESCE(last_heartbeat_at, created_at)
+                FROM watch_log
+                WHERE kid_id = :kid_id AND video_id = :video_id
+                ORDER BY id DESC
+                LIMIT 1
+                """
+            ),
+            {"kid_id": payload.kid_id, "video_id": video["video_id"]},
+        ).first()
+        if not row or not row[0]:
+            return None
+        raw_then = row[0]
         if isinstance(raw_then, datetime):
             then = raw_then
         else:
             then = datetime.fromisoformat(str(raw_then).replace("Z", "+00:00"))
         if then.tzinfo is None:
-            then = then.replace(tzinfo=timezone.utc)  # noqa: UP017
-        else:
-            then = then.astimezone(timezone.utc)  # noqa: UP017
-        if (now - then).total_seconds() < 8:
-            return {"ok": True}
+            return then.replace(tzinfo=timezone.utc)  # noqa: UP017
+        return then.astimezone(timezone.utc)  # noqa: UP017
+
+    if not heartbeat_dedup.admit(
+        session, payload.kid_id, video["video_id"], now, last_logged_heartbeat
+    ):
+        return {"ok": True}
 
     seconds_delta = payload.seconds_delta if payload.seconds_delta is not None else 10
 
-    watch_log = WatchLog(
+    watch_buffer.add(
+        session,
         kid_id=payload.kid_id,
         video_id=video["video_id"],
-        seconds_watched=seconds_delta,
         category_id=(
             payload.category_id if payload.category_id is not None else video["category_id"]
         ),
+        seconds=seconds_delta,
         started_at=payload.started_at or now,
+        now=now,
     )
-    session.add(watch_log)
-    session.commit()
     return {"ok": True}
+
+
+def remaining_time_state(
+    bind: Engine, kid_id: int, video_id: str | None, now: datetime
+) -> dict[str, object]:
+    with Session(bind) as session:
+        snapshot, facts = load_access_inputs(session, kid_id, now, video_id=video_id)
+    allowed, reason, _details = evaluate_access(snapshot, facts, video_id=video_id, now=now)
+    category_id = facts.category_id if facts and facts.resolved else None
+    next_change = snapshot.timeline.next_change(now)
+    return {
+        "kid_id": kid_id,
+        "allowed": allowed,
+        "reason": reason,
+        "detail": _detail_for_reason(reason) if reason else None,
+        "remaining_seconds": remaining_seconds_in(snapshot, category_id),
+        "bonus_seconds": snapshot.bonus_seconds,
+        "next_change_at": next_change.isoformat() if next_change else None,
+    }
+
+
+def _seconds_until_recheck(state: dict[str, object], now: datetime) -> float:
+    # Wake exactly at the next schedule/bedtime transition, and at least once a minute so
+    # flushed watch time is reflected. The small offset lands safely past the boundary.
+    timeout = float(STREAM_RECHECK_SECONDS)
+    next_change_at = state["next_change_at"]
+    if isinstance(next_change_at, str):
+        until_change = (datetime.fromisoformat(next_change_at) - now).total_seconds() + 0.05
+        timeout = min(timeout, until_change)
+    return timeout
+
+
+async def remaining_time_events(
+    bind: Engine,
+    kid_id: int,
+    video_id: str | None,
+    is_disconnected: Callable[[], Awaitable[bool]],
+) -> AsyncIterator[str]:
+    state: dict[str, object] | None = None
+    while not await is_disconnected():
+        seen_version = kid_events.version(kid_id)
+        now = datetime.now(timezone.utc)  # noqa: UP017
+        try:
+            latest = await asyncio.to_thread(remaining_time_state, bind, kid_id, video_id, now)
+        except HTTPException:
+            # The kid was deleted while the page was open.
+            return
+        if latest != state:
+            state = latest
+            yield f"event: remaining\ndata: {json.dumps(latest)}\n\n"
+        else:
+            yield ": keep-alive\n\n"
+        await kid_events.wait(kid_id, seen_version, _seconds_until_recheck(latest, now))
+
+
+@router.get("/stream")
+def remaining_time_stream(
+    request: Request,
+    kid_id: int = Query(),
+    video_id: str | None = Query(default=None),
+    session: Session = Depends(get_session),
+) -> StreamingResponse:
+    """Push the kid's remaining time and access state to the watch page as Server-Sent Events.
+
+    A ``remaining`` event is sent on connect, whenever a bonus grant or policy edit for the kid
+    lands, at the kid's next schedule/bedtime transition (``next_change_at``), and on the
+    once-a-minute re-check when watch time changed. Unchanged re-checks send a keep-alive
+    comment instead.
+    """
+    if session.get(Kid, kid_id) is None:
+        raise HTTPException(status_code=404, detail="Kid not found")
+    bind = session.get_bind()
+    return StreamingResponse(
+        remaining_time_events(bind, kid_id, video_id, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
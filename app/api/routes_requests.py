@@ -12,8 +12,10 @@ from sqlmodel import Session
 
 from app.api.routes_discord import build_approval_embed_payload
 from app.core.config import settings
+from app.core.http_client import http_client
 from app.db.models import Request
 from app.db.session import get_session
+from app.services import content_version
 from app.services.email_notify import send_approval_request_email
 
 router = APIRouter()
@@ -103,7 +105,7 @@ async def _send_request_notifications(request_row: Request, session: Session) ->
     )
 
     try:
-        async with httpx.AsyncClient(timeout=settings.http_timeout_seconds) as client:
+        async with http_client() as client:
             response = await client.post(webhook_url, json=payload)
             if response.status_code >= 400:
                 logger.error(
@@ -216,6 +218,8 @@ def _apply_request_action(session: Session, request_row: Request, action: str) -
 
     session.add(request_row)
     session.commit()
+    if request_row.type == "channel":
+        content_version.bump()
     session.refresh(request_row)
     return request_row
 
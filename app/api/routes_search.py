@@ -9,6 +9,9 @@ from sqlmodel import Session
 
 from app.db.models import Kid, SearchLog
 from app.db.session import get_session
+from app.services import search_cache
+from app.services.access_status import resolve_access_statuses
+from app.services.limits import without_blocked_titles
 from app.services.youtube import search_videos
 
 router = APIRouter()
@@ -38,59 +41,26 @@ async def search(
     if not kid:
         raise HTTPException(status_code=404, detail="Kid not found")
 
-    try:
-        results = await search_videos(normalized)
-    except Exception:
-        logger.debug("search_backend=api_failed", exc_info=True)
-        return []
+    results = search_cache.get(session, normalized)
+    if results is None:
+        try:
+            results = await search_videos(normalized)
+        except Exception:
+            logger.debug("search_backend=api_failed", exc_info=True)
+            return []
+        search_cache.put(session, normalized, results)
 
     session.add(SearchLog(kid_id=kid_id, query=normalized))
     session.commit()
+    results = without_blocked_titles(session, results)
+    statuses = resolve_access_statuses(session, kid_id, results)
     payload: list[dict[str, object]] = []
-    for item in results:
-        video_id = item.get("video_id")
-        channel_id = item.get("channel_id")
-
-        channel_row = None
-        if channel_id:
-            channel_row = session.execute(
-                text(
-                    """
-                    SELECT allowed, blocked, enabled
-                    FROM channels
-                    WHERE youtube_id = :youtube_id
-                    LIMIT 1
-                    """
-                ),
-                {"youtube_id": channel_id},
-            ).first()
-
-        channel_allowed = bool(
-            channel_row and channel_row[0] and not channel_row[1] and channel_row[2]
-        )
-        if channel_allowed:
-            access_status = "allowed"
-        else:
-            pending = session.execute(
-                text(
-                    """
-                    SELECT 1
-                    FROM requests
-                    WHERE kid_id = :kid_id
-                      AND status = 'pending'
-                      AND youtube_id IN (:video_id, :channel_id)
-                    LIMIT 1
-                    """
-                ),
-                {"kid_id": kid_id, "video_id": video_id, "channel_id": channel_id or ""},
-            ).first()
-            access_status = "pending" if pending else "needs_request"
-
+    for item, access_status in zip(results, statuses, strict=True):
         payload.append(
             {
-                "video_id": video_id,
+                "video_id": item.get("video_id"),
                 "title": item.get("title"),
-                "channel_id": channel_id,
+                "channel_id": item.get("channel_id"),
                 "channel_title": item.get("channel_title"),
                 "thumbnail_url": item.get("thumbnail_url"),
                 "published_at": item.get("published_at"),
@@ -8,6 +8,8 @@ from sqlalchemy import text
 from sqlmodel import Session
 
 from app.db.session import get_session
+from app.services import policy_cache
+from app.services.search_cache import search_cache_metrics
 
 router = APIRouter()
 
@@ -21,33 +23,28 @@ def watch_stats(
     kid_id: int | None = Query(default=None),
     session: Session = Depends(get_session),
 ) -> dict[str, object]:
-    now = datetime.now(timezone.utc)  # noqa: UP017
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    today = datetime.now(timezone.utc).date().isoformat()  # noqa: UP017
 
     by_category = session.execute(
         text(
             """
             SELECT
-                wl.kid_id AS kid_id,
+                du.kid_id AS kid_id,
                 k.name AS kid_name,
-                wl.category_id AS category_id,
+                du.category_id AS category_id,
                 cat.name AS category_name,
-                COALESCE(SUM(wl.seconds_watched), 0) AS lifetime_seconds,
-                COALESCE(SUM(
-                    CASE
-                        WHEN wl.created_at >= :today_start THEN wl.seconds_watched
-                        ELSE 0
-                    END
-                ), 0) AS today_seconds
-            FROM watch_log wl
-            JOIN kids k ON k.id = wl.kid_id
-            LEFT JOIN categories cat ON cat.id = wl.category_id
-            WHERE (:kid_id IS NULL OR wl.kid_id = :kid_id)
-            GROUP BY wl.kid_id, k.name, wl.category_id, cat.name
+                COALESCE(SUM(du.seconds), 0) AS lifetime_seconds,
+                COALESCE(SUM(CASE WHEN du.day = :today THEN du.seconds ELSE 0 END), 0)
+                    AS today_seconds
+            FROM kid_daily_usage du
+            JOIN kids k ON k.id = du.kid_id
+            LEFT JOIN categories cat ON cat.id = du.category_id
+            WHERE (:kid_id IS NULL OR du.kid_id = :kid_id)
+            GROUP BY du.kid_id, k.name, du.category_id, cat.name
             ORDER BY lifetime_seconds DESC
             """
         ),
-        {'kid_id': kid_id, 'today_start': today_start},
+        {'kid_id': kid_id, 'today': today},
     ).mappings().all()
 
     totals = session.execute(
@@ -55,19 +52,15 @@ def watch_stats(
             """
             SELECT
                 MAX(k.name) AS kid_name,
-                COALESCE(SUM(wl.seconds_watched), 0) AS lifetime_seconds,
-                COALESCE(SUM(
-                    CASE
-                        WHEN wl.created_at >= :today_start THEN wl.seconds_watched
-                        ELSE 0
-                    END
-                ), 0) AS today_seconds
-            FROM watch_log wl
-            JOIN kids k ON k.id = wl.kid_id
-            WHERE (:kid_id IS NULL OR wl.kid_id = :kid_id)
+                COALESCE(SUM(du.seconds), 0) AS lifetime_seconds,
+                COALESCE(SUM(CASE WHEN du.day = :today THEN du.seconds ELSE 0 END), 0)
+                    AS today_seconds
+            FROM kid_daily_usage du
+            JOIN kids k ON k.id = du.kid_id
+            WHERE (:kid_id IS NULL OR du.kid_id = :kid_id)
             """
         ),
-        {'kid_id': kid_id, 'today_start': today_start},
+        {'kid_id': kid_id, 'today': today},
     ).mappings().first()
 
     return {
@@ -86,6 +79,7 @@ def watch_stats(
             }
             for row in by_category
         ],
+        'search_cache': search_cache_metrics(),
     }
 
 
@@ -102,12 +96,12 @@ def daily_summary(session: Session = Depends(get_session)) -> list[dict[str, obj
         text(
             """
             SELECT
-                wl.kid_id,
-                COALESCE(SUM(wl.seconds_watched), 0) AS total_seconds,
+                du.kid_id,
+                COALESCE(SUM(du.seconds), 0) AS total_seconds,
                 COALESCE(
                     SUM(
                         CASE
-                            WHEN lower(COALESCE(cat.name, '')) = 'education' THEN wl.seconds_watched
+                            WHEN lower(COALESCE(cat.name, '')) = 'education' THEN du.seconds
                             ELSE 0
                         END
                     ),
@@ -116,19 +110,19 @@ def daily_summary(session: Session = Depends(get_session)) -> list[dict[str, obj
                 COALESCE(
                     SUM(
                         CASE
-                            WHEN lower(COALESCE(cat.name, '')) = 'fun' THEN wl.seconds_watched
+                            WHEN lower(COALESCE(cat.name, '')) = 'fun' THEN du.seconds
                             ELSE 0
                         END
                     ),
                     0
                 ) AS fun_seconds
-            FROM watch_log wl
-            LEFT JOIN categories cat ON cat.id = wl.category_id
-            WHERE wl.created_at >= :today_start
-            GROUP BY wl.kid_id
+            FROM kid_daily_usage du
+            LEFT JOIN categories cat ON cat.id = du.category_id
+            WHERE du.day = :today
+            GROUP BY du.kid_id
             """
         ),
-        {'today_start': today_start},
+        {'today': today_start.date().isoformat()},
     ).mappings().all()
     split_by_kid = {int(row['kid_id']): row for row in split_rows}
 
@@ -239,4 +233,5 @@ def set_shorts_setting(
         {'enabled': 1 if payload.enabled else 0},
     )
     session.commit()
+    policy_cache.invalidate_parent()
     return {'enabled': payload.enabled}
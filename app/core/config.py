@@ -48,6 +48,25 @@ class Settings(BaseSettings):
         default=None, alias="DISCORD_APPROVAL_WEBHOOK_URL"
     )
     youtube_api_key: str | None = Field(default=None, alias="YOUTUBE_API_KEY")
+    youtube_etag_cache_enabled: bool = Field(default=True, alias="YOUTUBE_ETAG_CACHE_ENABLED")
+    youtube_etag_cache_max_age_days: int = Field(
+        default=7, alias="YOUTUBE_ETAG_CACHE_MAX_AGE_DAYS"
+    )
+    youtube_daily_quota: int = Field(default=10000, alias="YOUTUBE_DAILY_QUOTA")
+    youtube_quota_interactive_reserve: int = Field(
+        default=2000, alias="YOUTUBE_QUOTA_INTERACTIVE_RESERVE"
+    )
+    youtube_quota_burst: int = Field(default=500, alias="YOUTUBE_QUOTA_BURST")
+    youtube_quota_max_wait_seconds: float = Field(
+        default=30.0, alias="YOUTUBE_QUOTA_MAX_WAIT_SECONDS"
+    )
+    search_cache_ttl_seconds: int = Field(default=3600, alias="SEARCH_CACHE_TTL_SECONDS")
+    search_cache_max_entries: int = Field(default=256, alias="SEARCH_CACHE_MAX_ENTRIES")
+    search_cache_persist: bool = Field(default=True, alias="SEARCH_CACHE_PERSIST")
+    policy_cache_ttl_seconds: int = Field(default=300, alias="POLICY_CACHE_TTL_SECONDS")
+    heartbeat_flush_seconds: float = Field(default=5.0, alias="HEARTBEAT_FLUSH_SECONDS")
+    watch_session_idle_seconds: int = Field(default=300, alias="WATCH_SESSION_IDLE_SECONDS")
+    heartbeat_dedup_max_entries: int = Field(default=4096, alias="HEARTBEAT_DEDUP_MAX_ENTRIES")
     sync_enabled: bool = Field(
         default=True,
         validation_alias=AliasChoices("KIDTUBE_SYNC_ENABLED", "SYNC_ENABLED"),
@@ -57,9 +76,21 @@ class Settings(BaseSettings):
         validation_alias=AliasChoices("KIDTUBE_SYNC_INTERVAL_SECONDS", "SYNC_INTERVAL_SECONDS"),
     )
     sync_max_videos_per_channel: int = Field(default=50, alias="SYNC_MAX_VIDEOS_PER_CHANNEL")
+    sync_concurrency: int = Field(default=4, alias="SYNC_CONCURRENCY")
+    sync_incremental: bool = Field(default=True, alias="SYNC_INCREMENTAL")
+    sync_adaptive: bool = Field(default=True, alias="SYNC_ADAPTIVE")
+    sync_max_interval_seconds: int = Field(default=86400, alias="SYNC_MAX_INTERVAL_SECONDS")
     deep_sync_enabled: bool = Field(default=False, alias="DEEP_SYNC_ENABLED")
     stats_hour: int = Field(default=20, alias="STATS_HOUR")
     http_timeout_seconds: float = Field(default=10.0, alias="HTTP_TIMEOUT_SECONDS")
+    http_max_connections: int = Field(default=20, alias="HTTP_MAX_CONNECTIONS")
+    http_max_keepalive_connections: int = Field(
+        default=10, alias="HTTP_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    http_keepalive_expiry_seconds: float = Field(
+        default=30.0, alias="HTTP_KEEPALIVE_EXPIRY_SECONDS"
+    )
+    http2_enabled: bool = Field(default=True, alias="HTTP2_ENABLED")
     # IMPORTANT: override in production with a strong random value.
     secret_key: str = Field(default="dev-only-change-me", alias="SECRET_KEY")
     app_base_url: str = Field(default="http://localhost:2018", alias="KIDTUBE_BASE_URL")
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import importlib.util
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: httpx.AsyncClient | None = None
+_counters = {"requests": 0, "connections_opened": 0, "connections_reused": 0}
+
+
+class _RequestTrace:
+    def __init__(self) -> None:
+        self.connected = False
+
+    async def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        del info
+        if event_name.endswith("connect_tcp.complete"):
+            self.connected = True
+
+
+async def _on_request(request: httpx.Request) -> None:
+    request.extensions["trace"] = _RequestTrace()
+
+
+async def _on_response(response: httpx.Response) -> None:
+    _counters["requests"] += 1
+    trace = response.request.extensions.get("trace")
+    if isinstance(trace, _RequestTrace) and trace.connected:
+        _counters["connections_opened"] += 1
+    else:
+        _counters["connections_reused"] += 1
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _http2_enabled() -> bool:
+    return settings.http2_enabled and http2_available()
+
+
+def _timeout() -> httpx.Timeout:
+    return httpx.Timeout(settings.http_timeout_seconds)
+
+
+def build_http_client(transport: httpx.AsyncBaseTransport | None = None) -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry_seconds,
+    )
+    return httpx.AsyncClient(
+        timeout=_timeout(),
+        limits=limits,
+        http2=_http2_enabled(),
+        transport=transport,
+        event_hooks={"request": [_on_request], "response": [_on_response]},
+    )
+
+
+async def start_http_client(
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = build_http_client(transport)
+        logger.info(
+            "http_client_started",
+            extra={
+                "http2": _http2_enabled(),
+                "max_connections": settings.http_max_connections,
+            },
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
+
+
+def get_http_client() -> httpx.AsyncClient | None:
+    return _client
+
+
+@asynccontextmanager
+async def http_client() -> AsyncIterator[httpx.AsyncClient]:
+    if _client is not None:
+        yield _client
+        return
+
+    async with httpx.AsyncClient(timeout=_timeout()) as client:
+        yield client
+
+
+def http_pool_metrics() -> dict[str, int | bool]:
+    connections_open = 0
+    connections_idle = 0
+    requests_waiting = 0
+    pool = getattr(getattr(_client, "_transport", None), "_pool", None)
+    if pool is not None:
+        connections = list(getattr(pool, "connections", []))
+        connections_open = len(connections)
+        connections_idle = sum(1 for connection in connections if connection.is_idle())
+        requests_waiting = sum(
+            1 for pool_request in getattr(pool, "_requests", []) if pool_request.is_queued()
+        )
+
+    return {
+        "active": _client is not None,
+        "http2": _client is not None and _http2_enabled(),
+        "connections_open": connections_open,
+        "connections_idle": connections_idle,
+        "requests_waiting": requests_waiting,
+        "requests_total": _counters["requests"],
+        "connections_opened": _counters["connections_opened"],
+        "connections_reused": _counters["connections_reused"],
+    }
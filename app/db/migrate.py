@@ -1,10 +1,25 @@
 from __future__ import annotations
 
+import sqlite3
 from pathlib import Path
 
 from sqlalchemy import text
 
 
+def _split_statements(sql: str) -> list[str]:
+    # Accumulate whole statements so trigger bodies keep their inner semicolons.
+    statements: list[str] = []
+    buffer = ""
+    for line in sql.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statements.append(buffer.strip())
+            buffer = ""
+    if buffer.strip():
+        statements.append(buffer.strip())
+    return statements
+
+
 def run_migrations(engine, migrations_dir: Path) -> None:  # type: ignore[no-untyped-def]
     migrations = sorted(migrations_dir.glob("*.sql"))
     if not migrations:
@@ -28,8 +43,7 @@ def run_migrations(engine, migrations_dir: Path) -> None:  # type: ignore[no-unt
                 continue
 
             sql = migration.read_text(encoding="utf-8")
-            statements = [stmt.strip() for stmt in sql.split(";") if stmt.strip()]
-            for statement in statements:
+            for statement in _split_statements(sql):
                 conn.exec_driver_sql(statement)
 
             conn.execute(
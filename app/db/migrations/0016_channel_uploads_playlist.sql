@@ -0,0 +1 @@
+ALTER TABLE channels ADD COLUMN uploads_playlist_id TEXT;
@@ -0,0 +1,8 @@
+CREATE TABLE IF NOT EXISTS youtube_etag_cache (
+    cache_key TEXT PRIMARY KEY,
+    etag TEXT NOT NULL,
+    body TEXT NOT NULL,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_youtube_etag_cache_updated_at ON youtube_etag_cache(updated_at);
@@ -0,0 +1,7 @@
+CREATE TABLE IF NOT EXISTS youtube_quota_usage (
+    day TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    units INTEGER NOT NULL DEFAULT 0,
+    calls INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, endpoint)
+);
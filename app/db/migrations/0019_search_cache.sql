@@ -0,0 +1,7 @@
+CREATE TABLE IF NOT EXISTS search_cache (
+    query TEXT PRIMARY KEY,
+    results TEXT NOT NULL,
+    cached_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_search_cache_cached_at ON search_cache(cached_at);
@@ -0,0 +1,37 @@
+CREATE TABLE IF NOT EXISTS kid_daily_usage (
+    kid_id INTEGER NOT NULL REFERENCES kids(id),
+    day TEXT NOT NULL,
+    category_id INTEGER REFERENCES categories(id),
+    seconds INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_kid_daily_usage_key
+ON kid_daily_usage(kid_id, day, COALESCE(category_id, 0));
+
+CREATE INDEX IF NOT EXISTS idx_kid_daily_usage_day ON kid_daily_usage(day);
+
+-- Every watch_log insert (playback log, heartbeat) adds to the kid's UTC-day total.
+CREATE TRIGGER IF NOT EXISTS trg_watch_log_daily_usage
+AFTER INSERT ON watch_log
+WHEN date(COALESCE(NEW.started_at, NEW.created_at)) IS NOT NULL
+BEGIN
+    INSERT INTO kid_daily_usage(kid_id, day, category_id, seconds)
+    VALUES (
+        NEW.kid_id,
+        date(COALESCE(NEW.started_at, NEW.created_at)),
+        NEW.category_id,
+        COALESCE(NEW.seconds_watched, 0)
+    )
+    ON CONFLICT(kid_id, day, COALESCE(category_id, 0))
+    DO UPDATE SET seconds = seconds + excluded.seconds;
+END;
+
+INSERT INTO kid_daily_usage(kid_id, day, category_id, seconds)
+SELECT
+    kid_id,
+    date(COALESCE(started_at, created_at)) AS usage_day,
+    category_id,
+    COALESCE(SUM(seconds_watched), 0)
+FROM watch_log
+WHERE date(COALESCE(started_at, created_at)) IS NOT NULL
+GROUP BY kid_id, usage_day, category_id;
@@ -0,0 +1,130 @@
+-- Videos a kid may see in the feed, pre-joined with their channel and category.
+CREATE VIEW IF NOT EXISTS eligible_feed_items AS
+SELECT
+    v.id AS video_id,
+    c.id AS channel_id,
+    c.youtube_id AS channel_youtube_id,
+    c.title AS channel_title,
+    c.avatar_url AS channel_avatar_url,
+    c.category AS channel_category,
+    c.category_id AS channel_category_id,
+    cat.name AS channel_category_name,
+    CASE WHEN c.category_id IS NOT NULL THEN cat.name ELSE c.category END AS category_key,
+    v.youtube_id AS video_youtube_id,
+    v.title AS video_title,
+    v.thumbnail_url AS video_thumbnail_url,
+    v.published_at AS video_published_at,
+    v.duration_seconds AS video_duration_seconds,
+    v.is_short AS video_is_short,
+    v.view_count AS video_view_count
+FROM videos v
+JOIN channels c ON c.id = v.channel_id
+LEFT JOIN categories cat ON cat.id = c.category_id
+WHERE c.enabled = 1
+  AND c.allowed = 1
+  AND c.blocked = 0
+  AND (c.category_id IS NULL OR cat.enabled = 1);
+
+CREATE TABLE IF NOT EXISTS feed_items (
+    video_id INTEGER PRIMARY KEY,
+    channel_id INTEGER NOT NULL,
+    channel_youtube_id TEXT,
+    channel_title TEXT,
+    channel_avatar_url TEXT,
+    channel_category TEXT,
+    channel_category_id INTEGER,
+    channel_category_name TEXT,
+    category_key TEXT,
+    video_youtube_id TEXT NOT NULL,
+    video_title TEXT NOT NULL,
+    video_thumbnail_url TEXT NOT NULL,
+    video_published_at TEXT NOT NULL,
+    video_duration_seconds INTEGER,
+    video_is_short INTEGER NOT NULL DEFAULT 0,
+    video_view_count INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS idx_feed_items_short_published
+ON feed_items(video_is_short, video_published_at DESC, video_id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_feed_items_channel_published
+ON feed_items(channel_id, video_is_short, video_published_at DESC, video_id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_feed_items_category_published
+ON feed_items(category_key, video_is_short, video_published_at DESC, video_id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_feed_items_category_id ON feed_items(channel_category_id);
+
+CREATE TRIGGER IF NOT EXISTS trg_feed_items_video_insert
+AFTER INSERT ON videos
+BEGIN
+    INSERT OR REPLACE INTO feed_items SELECT * FROM eligible_feed_items WHERE video_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_feed_items_video_update
+AFTER UPDATE ON videos
+WHEN OLD.id IS NOT NEW.id
+  OR OLD.channel_id IS NOT NEW.channel_id
+  OR OLD.youtube_id IS NOT NEW.youtube_id
+  OR OLD.title IS NOT NEW.title
+  OR OLD.thumbnail_url IS NOT NEW.thumbnail_url
+  OR OLD.published_at IS NOT NEW.published_at
+  OR OLD.duration_seconds IS NOT NEW.duration_seconds
+  OR OLD.is_short IS NOT NEW.is_short
+  OR OLD.view_count IS NOT NEW.view_count
+BEGIN
+    DELETE FROM feed_items WHERE video_id = OLD.id;
+    INSERT OR REPLACE INTO feed_items SELECT * FROM eligible_feed_items WHERE video_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_feed_items_video_delete
+AFTER DELETE ON videos
+BEGIN
+    DELETE FROM feed_items WHERE video_id = OLD.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_feed_items_channel_update
+AFTER UPDATE ON channels
+WHEN OLD.id IS NOT NEW.id
+  OR OLD.youtube_id IS NOT NEW.youtube_id
+  OR OLD.title IS NOT NEW.title
+  OR OLD.avatar_url IS NOT NEW.avatar_url
+  OR OLD.category IS NOT NEW.category
+  OR OLD.category_id IS NOT NEW.category_id
+  OR OLD.enabled IS NOT NEW.enabled
+  OR OLD.allowed IS NOT NEW.allowed
+  OR OLD.blocked IS NOT NEW.blocked
+BEGIN
+    DELETE FROM feed_items WHERE channel_id = OLD.id;
+    INSERT OR REPLACE INTO feed_items SELECT * FROM eligible_feed_items WHERE channel_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_feed_items_channel_delete
+AFTER DELETE ON channels
+BEGIN
+    DELETE FROM feed_items WHERE channel_id = OLD.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_feed_items_category_insert
+AFTER INSERT ON categories
+BEGIN
+    INSERT OR REPLACE INTO feed_items
+    SELECT * FROM eligible_feed_items WHERE channel_category_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_feed_items_category_update
+AFTER UPDATE ON categories
+WHEN OLD.id IS NOT NEW.id OR OLD.name IS NOT NEW.name OR OLD.enabled IS NOT NEW.enabled
+BEGIN
+    DELETE FROM feed_items WHERE channel_category_id = OLD.id;
+    INSERT OR REPLACE INTO feed_items
+    SELECT * FROM eligible_feed_items WHERE channel_category_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_feed_items_category_delete
+AFTER DELETE ON categories
+BEGIN
+    DELETE FROM feed_items WHERE channel_category_id = OLD.id;
+END;
+
+INSERT OR REPLACE INTO feed_items SELECT * FROM eligible_feed_items;
@@ -0,0 +1,48 @@
+-- Each channel points at its newest non-short feed item, so latest-per-channel is a primary
+-- key lookup per channel instead of an index seek. The pointer follows feed_items, which the
+-- 0021 triggers already keep in step with videos, channels and categories: an insert only
+-- moves it forward, and deleting the item it points at re-seeks the channel's next newest.
+ALTER TABLE channels ADD COLUMN latest_video_id INTEGER;
+
+CREATE TRIGGER IF NOT EXISTS trg_channel_latest_video_insert
+AFTER INSERT ON feed_items
+WHEN NEW.video_is_short = 0
+BEGIN
+    UPDATE channels
+    SET latest_video_id = NEW.video_id
+    WHERE id = NEW.channel_id
+      AND NOT EXISTS (
+        SELECT 1
+        FROM feed_items latest
+        WHERE latest.video_id = channels.latest_video_id
+          AND (latest.video_published_at, latest.video_id)
+              >= (NEW.video_published_at, NEW.video_id)
+      );
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_channel_latest_video_delete
+AFTER DELETE ON feed_items
+WHEN OLD.video_is_short = 0
+BEGIN
+    UPDATE channels
+    SET latest_video_id = (
+        SELECT latest.video_id
+        FROM feed_items latest
+        WHERE latest.channel_id = OLD.channel_id
+          AND latest.video_is_short = 0
+        ORDER BY latest.video_published_at DESC, latest.video_id DESC
+        LIMIT 1
+    )
+    WHERE id = OLD.channel_id
+      AND latest_video_id = OLD.video_id;
+END;
+
+UPDATE channels
+SET latest_video_id = (
+    SELECT latest.video_id
+    FROM feed_items latest
+    WHERE latest.channel_id = channels.id
+      AND latest.video_is_short = 0
+    ORDER BY latest.video_published_at DESC, latest.video_id DESC
+    LIMIT 1
+);
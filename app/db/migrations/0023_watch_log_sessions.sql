@@ -0,0 +1,84 @@
+-- Heartbeats extend one watch_log row per viewing session instead of adding a row each.
+-- A session stays open while heartbeats for the same kid, video and category keep arriving
+-- within WATCH_SESSION_IDLE_SECONDS (default 300) on the same UTC day.
+ALTER TABLE watch_log ADD COLUMN last_heartbeat_at TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_watch_log_kid_video_heartbeat
+ON watch_log(kid_id, video_id, last_heartbeat_at DESC);
+
+-- Compact existing history: rows of one kid, video and category that are less than 300 s
+-- apart on the same UTC day fold into the earliest row of their run.
+CREATE TEMP TABLE watch_log_compaction AS
+WITH timed AS (
+    SELECT
+        id,
+        kid_id,
+        video_id,
+        category_id,
+        COALESCE(seconds_watched, 0) AS seconds_watched,
+        datetime(COALESCE(started_at, created_at)) AS at
+    FROM watch_log
+    WHERE datetime(COALESCE(started_at, created_at)) IS NOT NULL
+),
+marked AS (
+    SELECT
+        *,
+        CASE
+            WHEN LAG(at) OVER run IS NULL
+              OR date(LAG(at) OVER run) <> date(at)
+              OR (julianday(at) - julianday(LAG(at) OVER run)) * 86400 > 300
+            THEN 1
+            ELSE 0
+        END AS starts_session
+    FROM timed
+    WINDOW run AS (PARTITION BY kid_id, video_id, category_id ORDER BY at, id)
+),
+numbered AS (
+    SELECT
+        *,
+        SUM(starts_session) OVER (
+            PARTITION BY kid_id, video_id, category_id
+            ORDER BY at, id
+            ROWS UNBOUNDED PRECEDING
+        ) AS session_no
+    FROM marked
+)
+SELECT
+    id,
+    MIN(id) OVER session AS keep_id,
+    SUM(seconds_watched) OVER session AS total_seconds,
+    MIN(at) OVER session AS first_at,
+    MAX(at) OVER session AS last_at
+FROM numbered
+WINDOW session AS (PARTITION BY kid_id, video_id, category_id, session_no);
+
+UPDATE watch_log
+SET
+    seconds_watched = (
+        SELECT total_seconds FROM watch_log_compaction c WHERE c.id = watch_log.id
+    ),
+    started_at = (SELECT first_at FROM watch_log_compaction c WHERE c.id = watch_log.id),
+    last_heartbeat_at = (SELECT last_at FROM watch_log_compaction c WHERE c.id = watch_log.id)
+WHERE id IN (SELECT keep_id FROM watch_log_compaction);
+
+DELETE FROM watch_log
+WHERE id IN (SELECT id FROM watch_log_compaction WHERE id <> keep_id);
+
+DROP TABLE watch_log_compaction;
+
+-- kid_daily_usage already holds these seconds, so the extend trigger is created afterwards.
+CREATE TRIGGER IF NOT EXISTS trg_watch_log_daily_usage_extend
+AFTER UPDATE OF seconds_watched ON watch_log
+WHEN date(COALESCE(NEW.started_at, NEW.created_at)) IS NOT NULL
+  AND NEW.seconds_watched IS NOT OLD.seconds_watched
+BEGIN
+    INSERT INTO kid_daily_usage(kid_id, day, category_id, seconds)
+    VALUES (
+        NEW.kid_id,
+        date(COALESCE(NEW.started_at, NEW.created_at)),
+        NEW.category_id,
+        COALESCE(NEW.seconds_watched, 0) - COALESCE(OLD.seconds_watched, 0)
+    )
+    ON CONFLICT(kid_id, day, COALESCE(category_id, 0))
+    DO UPDATE SET seconds = seconds + excluded.seconds;
+END;
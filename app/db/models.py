@@ -29,6 +29,7 @@ class Channel(SQLModel, table=True):
     banner_url: str | None = None
     description: str | None = None
     subscriber_count: int | None = None
+    uploads_playlist_id: str | None = None
     category: str | None = None
     category_id: int | None = Field(default=None, foreign_key="categories.id")
     allowed: bool = True
@@ -68,6 +69,8 @@ class WatchLog(SQLModel, table=True):
     category_id: int | None = Field(default=None, foreign_key="categories.id")
     started_at: datetime = Field(default_factory=datetime.utcnow)
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Set on heartbeat sessions; discrete playback logs leave it empty.
+    last_heartbeat_at: datetime | None = None
 
 
 class Category(SQLModel, table=True):
@@ -18,12 +18,14 @@ from app.api.router import api_router
 from app.api.routes_discord import router as discord_router
 from app.api.routes_health import router as health_router
 from app.core.config import settings
+from app.core.http_client import close_http_client, start_http_client
 from app.core.logging import setup_logging
 from app.core.request_context import request_logging_middleware
 from app.core.version import get_version_payload
 from app.db.migrate import run_migrations
 from app.db.paths import ensure_db_parent_writable, format_dir_diagnostics
 from app.db.session import engine
+from app.services import watch_buffer, youtube_cache, youtube_quota
 from app.services.daily_stats import send_daily_stats
 from app.services.sync import periodic_sync
 from app.ui import router as ui_router
@@ -117,6 +119,7 @@ async def lifespan(app: FastAPI):
 
     run_migrations(engine, Path(__file__).parent / "db" / "migrations")
     app.state.started_at = time.time()
+    await start_http_client()
 
     stop_event = asyncio.Event()
     sync_task: asyncio.Task[None] | None = None
@@ -124,6 +127,7 @@ async def lifespan(app: FastAPI):
     if settings.sync_enabled:
         sync_task = asyncio.create_task(periodic_sync(stop_event))
     daily_stats_task = asyncio.create_task(periodic_daily_stats(stop_event))
+    watch_flush_task = asyncio.create_task(watch_buffer.periodic_flush(stop_event))
 
     try:
         yield
@@ -143,6 +147,17 @@ async def lifespan(app: FastAPI):
             except asyncio.CancelledError:
                 pass
 
+        watch_flush_task.cancel()
+        try:
+            await watch_flush_task
+        except asyncio.CancelledError:
+            pass
+        watch_buffer.flush()
+        youtube_quota.flush()
+        youtube_cache.flush()
+
+        await close_http_client()
+
 
 app = FastAPI(title=settings.app_name, version=settings.app_version, lifespan=lifespan)
 app.add_middleware(SessionMiddleware, secret_key=settings.secret_key)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import bindparam, text
+from sqlmodel import Session
+
+ALLOWED = "allowed"
+PENDING = "pending"
+NEEDS_REQUEST = "needs_request"
+
+
+def resolve_access_statuses(
+    session: Session,
+    kid_id: int,
+    items: Sequence[Mapping[str, Any]],
+    video_key: str = "video_id",
+    channel_key: str = "channel_id",
+) -> list[str]:
+    channel_ids = {str(item[channel_key]) for item in items if item.get(channel_key)}
+    allowed_channels: set[str] = set()
+    if channel_ids:
+        allowed_channels = set(
+            session.execute(
+                text(
+                    """
+                    SELECT youtube_id
+                    FROM channels
+                    WHERE youtube_id IN :channel_ids
+                      AND allowed = 1
+                      AND blocked = 0
+                      AND enabled = 1
+                    """
+                ).bindparams(bindparam("channel_ids", expanding=True)),
+                {"channel_ids": sorted(channel_ids)},
+            ).scalars()
+        )
+
+    request_ids: set[str] = set()
+    for item in items:
+        if item.get(channel_key) and str(item[channel_key]) in allowed_channels:
+            continue
+        if item.get(video_key):
+            request_ids.add(str(item[video_key]))
+        if item.get(channel_key):
+            request_ids.add(str(item[channel_key]))
+
+    pending_ids: set[str] = set()
+    if request_ids:
+        pending_ids = set(
+            session.execute(
+                text(
+                    """
+                    SELECT DISTINCT youtube_id
+                    FROM requests
+                    WHERE kid_id = :kid_id
+                      AND status = 'pending'
+                      AND youtube_id IN :youtube_ids
+                    """
+                ).bindparams(bindparam("youtube_ids", expanding=True)),
+                {"kid_id": kid_id, "youtube_ids": sorted(request_ids)},
+            ).scalars()
+        )
+
+    statuses: list[str] = []
+    for item in items:
+        channel_id = str(item.get(channel_key) or "")
+        video_id = str(item.get(video_key) or "")
+        if channel_id and channel_id in allowed_channels:
+            statuses.append(ALLOWED)
+        elif (video_id and video_id in pending_ids) or (channel_id and channel_id in pending_ids):
+            statuses.append(PENDING)
+        else:
+            statuses.append(NEEDS_REQUEST)
+    return statuses
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import time
+from email.utils import formatdate
+
+from fastapi import Request, Response
+
+from app.services import policy_cache
+
+# Feed, channel and category listings only change when sync stores videos or an admin edits
+# channels or categories. Those writers call bump(); the listing routes turn the counter into a
+# weak ETag and answer a matching If-None-Match with 304 before querying. The boot stamp keeps
+# tags issued by an earlier process from matching after a restart.
+_boot = f"{time.time_ns():x}"
+_version = 0
+_modified_at = time.time()
+
+
+def bump() -> None:
+    global _version, _modified_at
+    _version += 1
+    _modified_at = time.time()
+
+
+def current() -> int:
+    return _version
+
+
+def etag(kid_scoped: bool = False) -> str:
+    tag = f"{_boot}-{_version}"
+    if kid_scoped:
+        # Kid responses also drop titles matching the parent's blocked words.
+        generation, parent_version = policy_cache.version(policy_cache.PARENT_KEY)
+        tag += f"-p{generation}.{parent_version}"
+    return f'W/"{tag}"'
+
+
+def _matches(if_none_match: str | None, tag: str) -> bool:
+    if not if_none_match:
+        return False
+    # Weak comparison: W/ prefixes are ignored on both sides.
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or tag.removeprefix("W/") in candidates
+
+
+def not_modified(request: Request, response: Response, kid_scoped: bool = False) -> Response | None:
+    """Return a 304 response when the client already holds the current content version.
+
+    Otherwise the validators are set on ``response`` and the caller builds the body. Kid routes
+    must only call this after their access gate has passed.
+    """
+    tag = etag(kid_scoped)
+    headers = {
+        "ETag": tag,
+        "Last-Modified": formatdate(_modified_at, usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+    if _matches(request.headers.get("if-none-match"), tag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
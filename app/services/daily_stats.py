@@ -3,11 +3,11 @@ from __future__ import annotations
 import logging
 from datetime import datetime, timezone
 
-import httpx
 from sqlalchemy import text
 from sqlmodel import Session
 
 from app.core.config import settings
+from app.core.http_client import http_client
 
 logger = logging.getLogger(__name__)
 
@@ -32,13 +32,13 @@ async def send_daily_stats(session: Session) -> None:
         watch = session.execute(
             text(
                 """
-                SELECT COALESCE(SUM(wl.seconds_watched), 0) AS watched_seconds
-                FROM watch_log wl
-                WHERE wl.kid_id = :kid_id
-                  AND wl.created_at >= :today_start
+                SELECT COALESCE(SUM(seconds), 0) AS watched_seconds
+                FROM kid_daily_usage
+                WHERE kid_id = :kid_id
+                  AND day = :today
                 """
             ),
-            {"kid_id": kid_id, "today_start": today_start},
+            {"kid_id": kid_id, "today": today_start.date().isoformat()},
         ).mappings().first()
         watched_minutes = round((int(watch["watched_seconds"]) if watch else 0) / 60, 1)
 
@@ -108,7 +108,7 @@ async def send_daily_stats(session: Session) -> None:
             embed["footer"] = {"text": f"{today_start.date().isoformat()} · Powered by KidTube"}
 
     try:
-        async with httpx.AsyncClient(timeout=settings.http_timeout_seconds) as client:
+        async with http_client() as client:
             response = await client.post(settings.discord_approval_webhook_url, json=payload)
             response.raise_for_status()
     except Exception:
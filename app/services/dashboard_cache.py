@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import Any
+
+from app.services import content_version
+
+# The kid-independent half of /api/dashboard (categories, allowed channels, latest per channel,
+# shorts) only changes when the content version is bumped, so one copy is kept for the current
+# version. Kid gating and word filtering are applied per request on top of it.
+_entry: tuple[int, dict[str, Any]] | None = None
+_counters = {"hits": 0, "misses": 0}
+
+
+def get() -> dict[str, Any] | None:
+    if _entry is not None and _entry[0] == content_version.current():
+        _counters["hits"] += 1
+        return _entry[1]
+    _counters["misses"] += 1
+    return None
+
+
+def put(loaded_version: int, shared: dict[str, Any]) -> None:
+    # A bump that landed while the lists were loading makes them stale already.
+    global _entry
+    if loaded_version == content_version.current():
+        _entry = (loaded_version, shared)
+
+
+def clear() -> None:
+    global _entry
+    _entry = None
+    _counters.update(hits=0, misses=0)
+
+
+def dashboard_cache_metrics() -> dict[str, int | float | None]:
+    lookups = _counters["hits"] + _counters["misses"]
+    return {
+        "version": _entry[0] if _entry is not None else None,
+        "hits": _counters["hits"],
+        "misses": _counters["misses"],
+        "hit_rate": round(_counters["hits"] / lookups, 3) if lookups else 0.0,
+    }
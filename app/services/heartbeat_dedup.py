@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from app.core.config import settings
+
+# watch.js can double-fire heartbeats (tab refocus, player state changes), so one accepted
+# heartbeat per kid and video per DEDUP_WINDOW_SECONDS is kept. The last accepted time lives
+# here instead of being re-read from watch_log: entries older than the window are evicted
+# because they can no longer suppress anything, and the map is capped at
+# HEARTBEAT_DEDUP_MAX_ENTRIES. A miss is only ambiguous right after startup, or when the cap
+# pushed out an entry that was still inside the window; only then is the DB asked.
+DEDUP_WINDOW_SECONDS = 8
+
+_DedupKey = tuple[Engine, int, int]
+
+_last_accepted: OrderedDict[_DedupKey, datetime] = OrderedDict()
+_lock = threading.Lock()
+_started_at = datetime.now(timezone.utc)  # noqa: UP017
+_evicted_until: datetime | None = None
+_counters = {"accepted": 0, "suppressed": 0, "db_fallbacks": 0, "evictions": 0}
+
+
+def _bind(session: Session) -> Engine:
+    bind = session.get_bind()
+    return bind.engine if hasattr(bind, "engine") else bind
+
+
+def _within_window(then: datetime, now: datetime) -> bool:
+    return (now - then).total_seconds() < DEDUP_WINDOW_SECONDS
+
+
+def _evict_expired(now: datetime) -> None:
+    # Entries are kept in acceptance order, so expired ones sit at the front.
+    while _last_accepted:
+        key, then = next(iter(_last_accepted.items()))
+        if _within_window(then, now):
+            break
+        del _last_accepted[key]
+        _counters["evictions"] += 1
+
+
+def _evict_overflow() -> None:
+    global _evicted_until
+    while len(_last_accepted) > max(settings.heartbeat_dedup_max_entries, 1):
+        _, then = _last_accepted.popitem(last=False)
+        _evicted_until = then if _evicted_until is None else max(_evicted_until, then)
+        _counters["evictions"] += 1
+
+
+def admit(
+    session: Session,
+    kid_id: int,
+    video_id: int,
+    now: datetime,
+    load_last_seen: Callable[[], datetime | None],
+) -> bool:
+    """Record a heartbeat and return False if it repeats one accepted within the window.
+
+    ``load_last_seen`` reads the newest logged heartbeat from the DB; it is only called when
+    the in-memory map cannot answer on its own.
+    """
+    key = (_bind(session), kid_id, video_id)
+    with _lock:
+        _evict_expired(now)
+        then = _last_accepted.get(key)
+        ambiguous = then is None and (
+            _within_window(_started_at, now)
+            or (_evicted_until is not None and _within_window(_evicted_until, now))
+        )
+    if ambiguous:
+        _counters["db_fallbacks"] += 1
+        then = load_last_seen()
+
+    with _lock:
+        if then is not None and _within_window(then, now):
+            _counters["suppressed"] += 1
+            return False
+        _last_accepted[key] = now
+        _last_accepted.move_to_end(key)
+        _evict_overflow()
+        _counters["accepted"] += 1
+    return True
+
+
+def clear() -> None:
+    global _evicted_until, _started_at
+    with _lock:
+        _last_accepted.clear()
+        _evicted_until = None
+        _started_at = datetime.now(timezone.utc)  # noqa: UP017
+    _counters.update(accepted=0, suppressed=0, db_fallbacks=0, evictions=0)
+
+
+def heartbeat_dedup_metrics() -> dict[str, int]:
+    with _lock:
+        entries = len(_last_accepted)
+    return {"entries": entries, **_counters}
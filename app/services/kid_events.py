@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+# Remaining-time streams sleep between re-checks. Anything that changes a kid's allowance
+# (bonus grants, limit/schedule/bedtime edits via policy_cache invalidation) calls notify()
+# so open streams re-evaluate at once. Writers run in the threadpool, waiters on the event
+# loop, so waking goes through call_soon_threadsafe.
+
+_Waiter = tuple[int, asyncio.AbstractEventLoop, asyncio.Event]
+
+_versions: dict[int, int] = {}
+_generation = 0
+_waiters: set[_Waiter] = set()
+_lock = threading.Lock()
+_counters = {"notifications": 0, "wakeups": 0}
+
+
+def version(kid_id: int) -> tuple[int, int]:
+    return _generation, _versions.get(kid_id, 0)
+
+
+def _wake(target: int | None) -> None:
+    for kid_id, loop, event in list(_waiters):
+        if target is None or kid_id == target:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The waiter's loop already shut down; its wait() is gone with it.
+                _waiters.discard((kid_id, loop, event))
+                continue
+            _counters["wakeups"] += 1
+
+
+def notify(kid_id: int) -> None:
+    with _lock:
+        _versions[kid_id] = _versions.get(kid_id, 0) + 1
+        _counters["notifications"] += 1
+        _wake(kid_id)
+
+
+def notify_all() -> None:
+    global _generation
+    with _lock:
+        _generation += 1
+        _counters["notifications"] += 1
+        _wake(None)
+
+
+async def wait(kid_id: int, seen_version: tuple[int, int], timeout: float) -> None:
+    """Sleep up to ``timeout`` seconds, returning early once the kid is notified."""
+    event = asyncio.Event()
+    waiter = (kid_id, asyncio.get_running_loop(), event)
+    with _lock:
+        if version(kid_id) != seen_version:
+            return
+        _waiters.add(waiter)
+    try:
+        await asyncio.wait_for(event.wait(), timeout=max(timeout, 0))
+    except TimeoutError:
+        pass
+    finally:
+        with _lock:
+            _waiters.discard(waiter)
+
+
+def clear() -> None:
+    global _generation
+    with _lock:
+        _versions.clear()
+        _generation = 0
+    _counters.update(notifications=0, wakeups=0)
+
+
+def kid_events_metrics() -> dict[str, int]:
+    with _lock:
+        listeners = len(_waiters)
+    return {"listeners": listeners, **_counters}
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+import json
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
 
 from fastapi import HTTPException
 from sqlalchemy import text
 from sqlmodel import Session
 
+from app.services import policy_cache, watch_buffer
+from app.services.schedule_timeline import WeeklyTimeline, compile_timeline
+from app.services.word_filter import BlockedWordMatcher, compile_blocked_words
+
 ACCESS_REASON_DAILY_LIMIT = "daily_limit"
 ACCESS_REASON_CATEGORY_LIMIT = "category_limit"
 ACCESS_REASON_SCHEDULE = "schedule"
@@ -16,7 +24,7 @@ ACCESS_REASON_WORD_FILTER = "word_filter"
 ACCESS_REASON_SHORTS_DISABLED = "shorts_disabled"
 
 
-def _utc_day_bounds(now: datetime) -> tuple[datetime, datetime]:
+def _utc_day(now: datetime) -> str:
     now_utc = (
         now.astimezone(timezone.utc)  # noqa: UP017
         if now.tzinfo
@@ -24,95 +32,29 @@ def _utc_day_bounds(now: datetime) -> tuple[datetime, datetime]:
             tzinfo=timezone.utc  # noqa: UP017
         )
     )
-    day_start = now_utc.replace(hour=0, minute=0, second=0, microsecond=0)
-    day_end = day_start + timedelta(days=1)
-    return day_start, day_end
-
-
-def _time_to_minutes(value: str) -> int:
-    hours_str, minutes_str = value.split(":", 1)
-    hours = int(hours_str)
-    minutes = int(minutes_str)
-    if not (0 <= hours <= 23 and 0 <= minutes <= 59):
-        raise ValueError("Invalid time value")
-    return (hours * 60) + minutes
+    return now_utc.date().isoformat()
 
 
-def _is_within_window(now_minutes: int, start_minutes: int, end_minutes: int) -> bool:
-    if start_minutes <= end_minutes:
-        return start_minutes <= now_minutes <= end_minutes
-    return now_minutes >= start_minutes or now_minutes <= end_minutes
+def load_kid_timeline(session: Session, kid_id: int) -> WeeklyTimeline:
+    kid = load_kid_policy(session, kid_id)
+    if not kid.kid_found:
+        raise HTTPException(status_code=404, detail="Kid not found")
+    return kid.timeline
 
 
 def is_in_any_schedule(session: Session, kid_id: int, now: datetime) -> bool:
-    day_of_week_py = now.weekday()
-    day_of_week_sun_first = (day_of_week_py + 1) % 7
-    rows = session.execute(
-        text(
-            """
-            SELECT start_time, end_time
-            FROM kid_schedules
-            WHERE kid_id = :kid_id
-              AND day_of_week IN (:day_of_week_py, :day_of_week_sun_first)
-            """
-        ),
-        {
-            "kid_id": kid_id,
-            "day_of_week_py": day_of_week_py,
-            "day_of_week_sun_first": day_of_week_sun_first,
-        },
-    ).all()
-
-    if not rows:
-        return True
-
-    now_minutes = (now.hour * 60) + now.minute
-    for start_time, end_time in rows:
-        try:
-            start_minutes = _time_to_minutes(start_time)
-            end_minutes = _time_to_minutes(end_time)
-        except ValueError:
-            continue
-
-        if _is_within_window(now_minutes, start_minutes, end_minutes):
-            return True
-
-    return False
+    return load_kid_policy(session, kid_id).timeline.segment_at(now).in_schedule
 
 
 def is_in_bedtime(session: Session, kid_id: int, now: datetime) -> bool:
-    bedtime = session.execute(
-        text(
-            """
-            SELECT bedtime_start, bedtime_end
-            FROM kids
-            WHERE id = :kid_id
-            LIMIT 1
-            """
-        ),
-        {"kid_id": kid_id},
-    ).first()
-    if not bedtime:
-        raise HTTPException(status_code=404, detail="Kid not found")
-
-    bedtime_start, bedtime_end = bedtime
-    if bedtime_start is None or bedtime_end is None:
-        return False
-
-    try:
-        start_minutes = _time_to_minutes(str(bedtime_start))
-        end_minutes = _time_to_minutes(str(bedtime_end))
-    except ValueError:
-        return False
-
-    now_minutes = (now.hour * 60) + now.minute
-    return _is_within_window(now_minutes, start_minutes, end_minutes)
+    return load_kid_timeline(session, kid_id).segment_at(now).in_bedtime
 
 
 def assert_schedule_allowed(session: Session, kid_id: int, now: datetime) -> None:
-    if not is_in_any_schedule(session, kid_id, now):
+    segment = load_kid_timeline(session, kid_id).segment_at(now)
+    if not segment.in_schedule:
         raise HTTPException(status_code=403, detail="Outside allowed schedule")
-    if is_in_bedtime(session, kid_id, now):
+    if segment.in_bedtime:
         raise HTTPException(status_code=403, detail="Within bedtime window")
 
 
@@ -177,33 +119,26 @@ def remaining_seconds_for(
     if limit_minutes is None:
         return None
 
-    day_start, day_end = _utc_day_bounds(now)
-
     watched_seconds = session.execute(
         text(
             """
-            SELECT COALESCE(SUM(seconds_watched), 0)
-            FROM watch_log
+            SELECT COALESCE(SUM(seconds), 0)
+            FROM kid_daily_usage
             WHERE kid_id = :kid_id
+              AND day = :day
               AND (
                 (:category_id IS NULL AND category_id IS NULL)
                 OR category_id = :category_id
               )
-              AND started_at >= :day_start
-              AND started_at < :day_end
             """
         ),
-        {
-            "kid_id": kid_id,
-            "category_id": category_id,
-            "day_start": day_start.isoformat(),
-            "day_end": day_end.isoformat(),
-        },
+        {"kid_id": kid_id, "category_id": category_id, "day": _utc_day(now)},
     ).one()[0]
 
-    return ((limit_minutes * 60) + active_bonus_seconds(session, kid_id, now)) - int(
-        watched_seconds
-    )
+    watched_seconds = int(watched_seconds) + watch_buffer.pending_seconds(
+        session, kid_id, _utc_day(now)
+    ).get(category_id, 0)
+    return ((limit_minutes * 60) + active_bonus_seconds(session, kid_id, now)) - watched_seconds
 
 
 def assert_under_limit(
@@ -217,149 +152,441 @@ def assert_under_limit(
         raise HTTPException(status_code=403, detail="Daily watch limit reached")
 
 
-def _parent_blocked_words(session: Session) -> list[str]:
-    row = session.execute(text("SELECT blocked_words FROM parent_settings WHERE id = 1")).first()
-    if not row or not row[0]:
-        return []
-    raw = str(row[0]).strip()
+def _parse_blocked_words(raw: object) -> tuple[str, ...]:
     if not raw:
-        return []
-    return [word.strip().lower() for word in raw.split(",") if word.strip()]
+        return ()
+    text_value = str(raw).strip()
+    if not text_value:
+        return ()
+    return tuple(word.strip().lower() for word in text_value.split(",") if word.strip())
+
+
+def _parse_int(value: object) -> int | None:
+    return int(value) if value is not None else None
+
+
+@dataclass(frozen=True)
+class KidPolicy:
+    kid_found: bool
+    bedtime_start: str | None
+    bedtime_end: str | None
+    daily_limit_minutes: int | None
+    schedules: list[tuple[int, str, str]]
+    category_limits: dict[int, int]
+    timeline: WeeklyTimeline
+
+
+@dataclass(frozen=True)
+class ParentPolicy:
+    shorts_disabled: bool
+    word_matcher: BlockedWordMatcher
+
+
+@dataclass
+class PolicySnapshot:
+    kid_found: bool
+    bedtime_start: str | None
+    bedtime_end: str | None
+    daily_limit_minutes: int | None
+    schedules: list[tuple[int, str, str]]
+    category_limits: dict[int, int]
+    timeline: WeeklyTimeline
+    bonus_seconds: int
+    watched_seconds: dict[int | None, int]
+    shorts_disabled: bool
+    word_matcher: BlockedWordMatcher
+
+
+@dataclass
+class VideoFacts:
+    video_title: str | None = None
+    video_is_short: bool = False
+    channel_youtube_id: str | None = None
+    category_id: int | None = None
+    channel_allowed: bool = False
+    resolved: bool = False
+    channel_blocked: bool = False
+    video_approved: bool = False
+    request_status: str | None = None
+
+
+_KID_POLICY_COLUMNS = """
+    k.id AS kid_found,
+    k.bedtime_start AS bedtime_start,
+    k.bedtime_end AS bedtime_end,
+    k.daily_limit_minutes AS daily_limit_minutes,
+    (
+        SELECT json_group_array(json_array(day_of_week, start_time, end_time))
+        FROM kid_schedules
+        WHERE kid_id = target.kid_id
+    ) AS schedules,
+    (
+        SELECT json_group_array(json_array(category_id, daily_limit_minutes))
+        FROM kid_category_limits
+        WHERE kid_id = target.kid_id
+    ) AS category_limits
+"""
+
+_PARENT_POLICY_COLUMNS = """
+    ps.shorts_enabled AS shorts_enabled,
+    ps.blocked_words AS blocked_words
+"""
+
+_USAGE_COLUMNS = """
+    (
+        SELECT COALESCE(SUM(minutes), 0)
+        FROM kid_bonus_time
+        WHERE kid_id = target.kid_id
+          AND (expires_at IS NULL OR expires_at > :now)
+    ) AS bonus_minutes,
+    (
+        SELECT json_group_array(json_array(category_id, seconds))
+        FROM kid_daily_usage
+        WHERE kid_id = target.kid_id AND day = :day
+    ) AS watched
+"""
+
+_VIDEO_COLUMNS = """
+    resolved.video_youtube_id IS NOT NULL AS resolved,
+    resolved.video_title AS video_title,
+    resolved.video_is_short AS video_is_short,
+    resolved.channel_youtube_id AS channel_youtube_id,
+    resolved.category_id AS category_id,
+    resolved.channel_allowed AS channel_allowed,
+    (
+        SELECT blocked FROM channels WHERE youtube_id = target.channel_id LIMIT 1
+    ) AS channel_blocked,
+    EXISTS (
+        SELECT 1 FROM video_approvals WHERE youtube_id = :video_id
+    ) AS video_approved,
+    (
+        SELECT status
+        FROM requests
+        WHERE kid_id = target.kid_id
+          AND (
+            (type = 'video' AND youtube_id = :video_id)
+            OR (type = 'channel' AND youtube_id = target.channel_id)
+          )
+        ORDER BY created_at DESC, id DESC
+        LIMIT 1
+    ) AS request_status
+"""
+
+
+def _access_inputs_statement(include_kid: bool, include_parent: bool, include_video: bool) -> str:
+    columns = [_USAGE_COLUMNS]
+    if include_kid:
+        columns.append(_KID_POLICY_COLUMNS)
+    if include_parent:
+        columns.append(_PARENT_POLICY_COLUMNS)
+    if include_video:
+        columns.append(_VIDEO_COLUMNS)
+    return f"""
+        WITH resolved AS (
+            SELECT
+                v.youtube_id AS video_youtube_id,
+                v.title AS video_title,
+                v.is_short AS video_is_short,
+                c.youtube_id AS channel_youtube_id,
+                c.category_id AS category_id,
+                c.allowed AS channel_allowed
+            FROM videos v
+            JOIN channels c ON c.id = v.channel_id
+            WHERE v.youtube_id = :video_id
+            LIMIT 1
+        ),
+        target AS (
+            SELECT
+                :kid_id AS kid_id,
+                COALESCE(:channel_id, (SELECT channel_youtube_id FROM resolved)) AS channel_id
+        )
+        SELECT {",".join(columns)}
+        FROM target
+        LEFT JOIN kids k ON k.id = target.kid_id
+        LEFT JOIN parent_settings ps ON ps.id = 1
+        LEFT JOIN resolved ON 1 = 1
+    """
+
+
+def _kid_policy_from_row(row: Mapping[str, Any]) -> KidPolicy:
+    schedules = [
+        (int(day), start, end) for day, start, end in json.loads(row["schedules"] or "[]")
+    ]
+    return KidPolicy(
+        kid_found=row["kid_found"] is not None,
+        bedtime_start=row["bedtime_start"],
+        bedtime_end=row["bedtime_end"],
+        daily_limit_minutes=_parse_int(row["daily_limit_minutes"]),
+        schedules=schedules,
+        category_limits={
+            int(category): int(minutes)
+            for category, minutes in json.loads(row["category_limits"] or "[]")
+        },
+        timeline=compile_timeline(schedules, row["bedtime_start"], row["bedtime_end"]),
+    )
 
 
-def check_access(
+def _parent_policy_from_row(row: Mapping[str, Any]) -> ParentPolicy:
+    return ParentPolicy(
+        shorts_disabled=row["shorts_enabled"] is not None and int(row["shorts_enabled"]) == 0,
+        word_matcher=compile_blocked_words(_parse_blocked_words(row["blocked_words"])),
+    )
+
+
+def _snapshot(kid: KidPolicy, parent: ParentPolicy, row: Mapping[str, Any]) -> PolicySnapshot:
+    return PolicySnapshot(
+        kid_found=kid.kid_found,
+        bedtime_start=kid.bedtime_start,
+        bedtime_end=kid.bedtime_end,
+        daily_limit_minutes=kid.daily_limit_minutes,
+        schedules=kid.schedules,
+        category_limits=kid.category_limits,
+        timeline=kid.timeline,
+        bonus_seconds=int(row["bonus_minutes"] or 0) * 60,
+        watched_seconds={
+            _parse_int(category): int(watched or 0)
+            for category, watched in json.loads(row["watched"] or "[]")
+        },
+        shorts_disabled=parent.shorts_disabled,
+        word_matcher=parent.word_matcher,
+    )
+
+
+def _video_facts_from_row(row: Mapping[str, Any]) -> VideoFacts:
+    return VideoFacts(
+        resolved=bool(row["resolved"]),
+        video_title=row["video_title"],
+        video_is_short=bool(row["video_is_short"]),
+        channel_youtube_id=row["channel_youtube_id"],
+        category_id=_parse_int(row["category_id"]),
+        channel_allowed=bool(row["channel_allowed"]),
+        channel_blocked=row["channel_blocked"] is not None and int(row["channel_blocked"]) == 1,
+        video_approved=bool(row["video_approved"]),
+        request_status=row["request_status"],
+    )
+
+
+def _access_params(
+    kid_id: int, now: datetime, video_id: str | None, channel_id: str | None
+) -> dict[str, object]:
+    return {
+        "kid_id": kid_id,
+        "now": now.isoformat(),
+        "day": _utc_day(now),
+        "video_id": video_id,
+        "channel_id": channel_id or None,
+    }
+
+
+def load_access_inputs(
     session: Session,
     kid_id: int,
-    *,
+    now: datetime,
     video_id: str | None = None,
     channel_id: str | None = None,
-    category_id: int | None = None,
-    is_shorts: bool = False,
-    title: str | None = None,
-    now: datetime | None = None,
-) -> tuple[bool, str | None, dict[str, object]]:
-    now = now or datetime.now(timezone.utc)  # noqa: UP017
+) -> tuple[PolicySnapshot, VideoFacts | None]:
+    kid_version = policy_cache.version(kid_id)
+    parent_version = policy_cache.version(policy_cache.PARENT_KEY)
+    kid: KidPolicy | None = policy_cache.get(kid_id)
+    parent: ParentPolicy | None = policy_cache.get(policy_cache.PARENT_KEY)
+    include_video = bool(video_id or channel_id)
+    row = (
+        session.execute(
+            text(
+                _access_inputs_statement(
+                    include_kid=kid is None,
+                    include_parent=parent is None,
+                    include_video=include_video,
+                )
+            ),
+            _access_params(kid_id, now, video_id, channel_id),
+        )
+        .mappings()
+        .one()
+    )
+    if kid is None:
+        kid = _kid_policy_from_row(row)
+        # Unknown kids are not cached so a newly created kid is seen immediately.
+        if kid.kid_found:
+            policy_cache.put(kid_id, kid_version, kid)
+    if parent is None:
+        parent = _parent_policy_from_row(row)
+        policy_cache.put(policy_cache.PARENT_KEY, parent_version, parent)
+    snapshot = _snapshot(kid, parent, row)
+    # Heartbeats accepted since the last watch_buffer flush count against today's limits too.
+    for category, seconds in watch_buffer.pending_seconds(session, kid_id, _utc_day(now)).items():
+        snapshot.watched_seconds[category] = snapshot.watched_seconds.get(category, 0) + seconds
+    return snapshot, _video_facts_from_row(row) if include_video else None
+
+
+def load_policy_snapshot(session: Session, kid_id: int, now: datetime) -> PolicySnapshot:
+    snapshot, _ = load_access_inputs(session, kid_id, now)
+    return snapshot
+
+
+def load_kid_policy(session: Session, kid_id: int) -> KidPolicy:
+    kid_version = policy_cache.version(kid_id)
+    kid: KidPolicy | None = policy_cache.get(kid_id)
+    if kid is None:
+        row = (
+            session.execute(
+                text(
+                    f"""
+                    SELECT {_KID_POLICY_COLUMNS}
+                    FROM (SELECT :kid_id AS kid_id) AS target
+                    LEFT JOIN kids k ON k.id = target.kid_id
+                    """
+                ),
+                {"kid_id": kid_id},
+            )
+            .mappings()
+            .one()
+        )
+        kid = _kid_policy_from_row(row)
+        if kid.kid_found:
+            policy_cache.put(kid_id, kid_version, kid)
+    return kid
 
-    if not is_in_any_schedule(session, kid_id=kid_id, now=now):
-        return False, ACCESS_REASON_SCHEDULE, {}
-    if is_in_bedtime(session, kid_id=kid_id, now=now):
-        return False, ACCESS_REASON_BEDTIME, {}
 
-    resolved = None
-    if video_id:
-        resolved = (
+def load_parent_policy(session: Session) -> ParentPolicy:
+    parent_version = policy_cache.version(policy_cache.PARENT_KEY)
+    parent: ParentPolicy | None = policy_cache.get(policy_cache.PARENT_KEY)
+    if parent is None:
+        row = (
             session.execute(
                 text(
                     """
-                SELECT
-                    v.title AS video_title,
-                    v.is_short AS video_is_short,
-                    c.youtube_id AS channel_youtube_id,
-                    c.category_id AS category_id,
-                    c.allowed AS channel_allowed,
-                    c.blocked AS channel_blocked
-                FROM videos v
-                JOIN channels c ON c.id = v.channel_id
-                WHERE v.youtube_id = :video_id
-                LIMIT 1
-                """
-                ),
-                {"video_id": video_id},
+                    SELECT ps.shorts_enabled AS shorts_enabled, ps.blocked_words AS blocked_words
+                    FROM (SELECT 1) AS base
+                    LEFT JOIN parent_settings ps ON ps.id = 1
+                    """
+                )
             )
             .mappings()
-            .first()
+            .one()
         )
-        if resolved:
-            if category_id is None:
-                category_id = resolved["category_id"]
-            if not channel_id:
-                channel_id = resolved["channel_youtube_id"]
-            if not title:
-                title = resolved["video_title"]
-            is_shorts = bool(resolved["video_is_short"])
-
-    remaining_seconds = remaining_seconds_for(
-        session,
-        kid_id=kid_id,
-        category_id=category_id,
-        now=now,
+        parent = _parent_policy_from_row(row)
+        policy_cache.put(policy_cache.PARENT_KEY, parent_version, parent)
+    return parent
+
+
+def without_blocked_titles(
+    session: Session,
+    items: Sequence[Mapping[str, Any]],
+    title_key: str = "title",
+) -> list[Mapping[str, Any]]:
+    matcher = load_parent_policy(session).word_matcher
+    if not matcher:
+        return list(items)
+    return [item for item in items if matcher.first_match(item.get(title_key)) is None]
+
+
+def _schedule_allows(snapshot: PolicySnapshot, now: datetime) -> bool:
+    return snapshot.timeline.segment_at(now).in_schedule
+
+
+def _bedtime_blocks(snapshot: PolicySnapshot, now: datetime) -> bool:
+    return snapshot.timeline.segment_at(now).in_bedtime
+
+
+def remaining_seconds_in(snapshot: PolicySnapshot, category_id: int | None) -> int | None:
+    if category_id is not None and category_id in snapshot.category_limits:
+        limit_minutes: int | None = snapshot.category_limits[category_id]
+    else:
+        limit_minutes = snapshot.daily_limit_minutes
+    if limit_minutes is None:
+        return None
+    return (
+        (limit_minutes * 60) + snapshot.bonus_seconds - snapshot.watched_seconds.get(category_id, 0)
     )
-    if remaining_seconds is not None and remaining_seconds <= 0:
-        category_limit_exists = False
-        if category_id is not None:
-            category_limit_exists = (
-                session.execute(
-                    text(
-                        """
-                        SELECT 1 FROM kid_category_limits
-                        WHERE kid_id = :kid_id AND category_id = :category_id
-                        LIMIT 1
-                        """
-                    ),
-                    {"kid_id": kid_id, "category_id": category_id},
-                ).first()
-                is not None
-            )
-        return (
-            False,
-            ACCESS_REASON_CATEGORY_LIMIT if category_limit_exists else ACCESS_REASON_DAILY_LIMIT,
-            {"remaining_seconds": int(remaining_seconds)},
+
+
+def evaluate_access(
+    snapshot: PolicySnapshot,
+    facts: VideoFacts | None,
+    *,
+    video_id: str | None = None,
+    channel_id: str | None = None,
+    category_id: int | None = None,
+    is_shorts: bool = False,
+    title: str | None = None,
+    now: datetime,
+) -> tuple[bool, str | None, dict[str, object]]:
+    if not _schedule_allows(snapshot, now):
+        return False, ACCESS_REASON_SCHEDULE, {}
+    if not snapshot.kid_found:
+        raise HTTPException(status_code=404, detail="Kid not found")
+    if _bedtime_blocks(snapshot, now):
+        return False, ACCESS_REASON_BEDTIME, {}
+
+    resolved = facts if video_id and facts and facts.resolved else None
+    if resolved:
+        if category_id is None:
+            category_id = resolved.category_id
+        if not channel_id:
+            channel_id = resolved.channel_youtube_id
+        if not title:
+            title = resolved.video_title
+        is_shorts = resolved.video_is_short
+
+    remaining_seconds = remaining_seconds_in(snapshot, category_id)
+    if remaining_seconds is not None:
+        category_limit_exists = (
+            category_id is not None and category_id in snapshot.category_limits
         )
+        if remaining_seconds <= 0:
+            return (
+                False,
+                ACCESS_REASON_CATEGORY_LIMIT
+                if category_limit_exists
+                else ACCESS_REASON_DAILY_LIMIT,
+                {"remaining_seconds": int(remaining_seconds)},
+            )
 
-    if is_shorts:
-        shorts_enabled = session.execute(
-            text("SELECT shorts_enabled FROM parent_settings WHERE id = 1")
-        ).first()
-        if shorts_enabled and int(shorts_enabled[0]) == 0:
-            return False, ACCESS_REASON_SHORTS_DISABLED, {}
+    if is_shorts and snapshot.shorts_disabled:
+        return False, ACCESS_REASON_SHORTS_DISABLED, {}
 
-    if channel_id:
-        channel_row = session.execute(
-            text(
-                """
-                SELECT allowed, blocked
-                FROM channels
-                WHERE youtube_id = :channel_id
-                LIMIT 1
-                """
-            ),
-            {"channel_id": channel_id},
-        ).first()
-        if channel_row and int(channel_row[1]) == 1:
-            return False, ACCESS_REASON_BLOCKED_CHANNEL, {}
+    if channel_id and facts and facts.channel_blocked:
+        return False, ACCESS_REASON_BLOCKED_CHANNEL, {}
 
-    lowered_title = (title or "").lower()
-    for blocked_word in _parent_blocked_words(session):
-        if blocked_word and blocked_word in lowered_title:
-            return False, ACCESS_REASON_WORD_FILTER, {"word": blocked_word}
+    blocked_word = snapshot.word_matcher.first_match(title)
+    if blocked_word:
+        return False, ACCESS_REASON_WORD_FILTER, {"word": blocked_word}
 
     if video_id:
-        channel_allowed = bool(resolved["channel_allowed"]) if resolved else False
-        video_approved = (
-            session.execute(
-                text("SELECT 1 FROM video_approvals WHERE youtube_id = :youtube_id LIMIT 1"),
-                {"youtube_id": video_id},
-            ).first()
-            is not None
-        )
+        channel_allowed = resolved.channel_allowed if resolved else False
+        video_approved = bool(facts and facts.video_approved)
         if not channel_allowed and not video_approved:
-            request_row = session.execute(
-                text(
-                    """
-                    SELECT status
-                    FROM requests
-                    WHERE kid_id = :kid_id
-                      AND (
-                        (type = 'video' AND youtube_id = :video_id)
-                        OR (type = 'channel' AND youtube_id = :channel_id)
-                      )
-                    ORDER BY created_at DESC, id DESC
-                    LIMIT 1
-                    """
-                ),
-                {"kid_id": kid_id, "video_id": video_id, "channel_id": channel_id},
-            ).first()
-            request_status = str(request_row[0]) if request_row else "none"
+            request_status = (
+                str(facts.request_status) if facts and facts.request_status else "none"
+            )
             return False, ACCESS_REASON_PENDING_APPROVAL, {"request_status": request_status}
 
     return True, None, {}
+
+
+def check_access(
+    session: Session,
+    kid_id: int,
+    *,
+    video_id: str | None = None,
+    channel_id: str | None = None,
+    category_id: int | None = None,
+    is_shorts: bool = False,
+    title: str | None = None,
+    now: datetime | None = None,
+) -> tuple[bool, str | None, dict[str, object]]:
+    now = now or datetime.now(timezone.utc)  # noqa: UP017
+    snapshot, facts = load_access_inputs(
+        session, kid_id, now, video_id=video_id, channel_id=channel_id
+    )
+    return evaluate_access(
+        snapshot,
+        facts,
+        video_id=video_id,
+        channel_id=channel_id,
+        category_id=category_id,
+        is_shorts=is_shorts,
+        title=title,
+        now=now,
+    )
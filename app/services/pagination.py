@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+
+from fastapi import HTTPException
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def keyset_condition(published_column: str = "v.published_at", id_column: str = "v.id") -> str:
+    # For lists ordered by published_column DESC, id_column DESC.
+    return f"({published_column}, {id_column}) < (:cursor_published_at, :cursor_id)"
+
+
+def encode_cursor(published_at: object, video_id: int) -> str:
+    raw = json.dumps([str(published_at), int(video_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        published_at, video_id = json.loads(raw)
+        return str(published_at), int(video_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+
+def cursor_params(cursor: str | None) -> dict[str, object]:
+    if not cursor:
+        return {"cursor_published_at": None, "cursor_id": None}
+    published_at, video_id = decode_cursor(cursor)
+    return {"cursor_published_at": published_at, "cursor_id": video_id}
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from app.core.config import settings
+from app.services import kid_events
+
+# Kid rows, schedules, category limits and parent settings change a few times a week, so
+# check_access keeps them in process. Mutating routes invalidate explicitly; the TTL only
+# bounds staleness from writes that bypass the API (manual SQL, a second process).
+PARENT_KEY = "parent"
+
+_entries: dict[object, tuple[float, Any]] = {}
+_versions: dict[object, int] = {}
+_generation = 0
+_counters = {"hits": 0, "misses": 0, "invalidations": 0}
+
+
+def _enabled() -> bool:
+    return settings.policy_cache_ttl_seconds > 0
+
+
+def version(key: object) -> tuple[int, int]:
+    return _generation, _versions.get(key, 0)
+
+
+def get(key: object) -> Any | None:
+    if not _enabled():
+        return None
+    entry = _entries.get(key)
+    if entry is not None and entry[0] < time.monotonic() - settings.policy_cache_ttl_seconds:
+        _entries.pop(key, None)
+        entry = None
+    if entry is None:
+        _counters["misses"] += 1
+        return None
+    _counters["hits"] += 1
+    return entry[1]
+
+
+def put(key: object, loaded_version: tuple[int, int], value: Any) -> None:
+    # Drop values loaded before an invalidation landed; the next check reloads them.
+    if not _enabled() or version(key) != loaded_version:
+        return
+    _entries[key] = (time.monotonic(), value)
+
+
+def invalidate_kid(kid_id: int) -> None:
+    _versions[kid_id] = _versions.get(kid_id, 0) + 1
+    _entries.pop(kid_id, None)
+    _counters["invalidations"] += 1
+    kid_events.notify(kid_id)
+
+
+def invalidate_parent() -> None:
+    _versions[PARENT_KEY] = _versions.get(PARENT_KEY, 0) + 1
+    _entries.pop(PARENT_KEY, None)
+    _counters["invalidations"] += 1
+    kid_events.notify_all()
+
+
+def invalidate_all() -> None:
+    global _generation
+    _generation += 1
+    _entries.clear()
+    _counters["invalidations"] += 1
+    kid_events.notify_all()
+
+
+def clear() -> None:
+    _entries.clear()
+    _versions.clear()
+    _counters.update(hits=0, misses=0, invalidations=0)
+
+
+def policy_cache_metrics() -> dict[str, int | float]:
+    lookups = _counters["hits"] + _counters["misses"]
+    return {
+        "entries": len(_entries),
+        "hits": _counters["hits"],
+        "misses": _counters["misses"],
+        "invalidations": _counters["invalidations"],
+        "hit_rate": round(_counters["hits"] / lookups, 3) if lookups else 0.0,
+    }
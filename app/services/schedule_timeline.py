@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+# A kid's schedules and bedtime only change when a parent edits them, so they are compiled
+# once into a weekly timeline: contiguous segments keyed by minute of the week (Monday 00:00
+# is minute 0), each recording whether that stretch is inside an allowed schedule window and
+# inside bedtime. Lookups are a binary search over segment starts. The timeline rides along
+# with the cached KidPolicy, so policy_cache invalidation on schedule edits recompiles it.
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+
+def time_to_minutes(value: str) -> int:
+    hours_str, minutes_str = value.split(":", 1)
+    hours = int(hours_str)
+    minutes = int(minutes_str)
+    if not (0 <= hours <= 23 and 0 <= minutes <= 59):
+        raise ValueError("Invalid time value")
+    return (hours * 60) + minutes
+
+
+def is_within_window(now_minutes: int, start_minutes: int, end_minutes: int) -> bool:
+    if start_minutes <= end_minutes:
+        return start_minutes <= now_minutes <= end_minutes
+    return now_minutes >= start_minutes or now_minutes <= end_minutes
+
+
+def _parse_window(start: object, end: object) -> tuple[int, int] | None:
+    try:
+        return time_to_minutes(str(start)), time_to_minutes(str(end))
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class Segment:
+    start: int
+    in_schedule: bool
+    in_bedtime: bool
+
+    @property
+    def allowed(self) -> bool:
+        return self.in_schedule and not self.in_bedtime
+
+
+@dataclass(frozen=True)
+class WeeklyTimeline:
+    starts: tuple[int, ...]
+    segments: tuple[Segment, ...]
+    # Minute of the week at which `allowed` next flips after each segment, or None when it
+    # never does.
+    next_flips: tuple[int | None, ...]
+
+    def _index(self, now: datetime) -> tuple[int, int]:
+        minute = (now.weekday() * MINUTES_PER_DAY) + (now.hour * 60) + now.minute
+        return bisect_right(self.starts, minute) - 1, minute
+
+    def segment_at(self, now: datetime) -> Segment:
+        return self.segments[self._index(now)[0]]
+
+    def next_change(self, now: datetime) -> datetime | None:
+        """When access next switches between allowed and blocked, to the minute."""
+        index, minute = self._index(now)
+        flip = self.next_flips[index]
+        if flip is None:
+            return None
+        minutes_ahead = (flip - minute) % MINUTES_PER_WEEK
+        return now.replace(second=0, microsecond=0) + timedelta(minutes=minutes_ahead)
+
+
+def compile_timeline(
+    schedules: Sequence[tuple[int, str, str]],
+    bedtime_start: str | None,
+    bedtime_end: str | None,
+) -> WeeklyTimeline:
+    bedtime = (
+        _parse_window(bedtime_start, bedtime_end)
+        if bedtime_start is not None and bedtime_end is not None
+        else None
+    )
+    segments: list[Segment] = []
+    for weekday in range(7):
+        # A row's day_of_week matches both Monday-first and Sunday-first numbering, as the
+        # per-request check always has. A day with only unparsable rows allows nothing.
+        rows = [
+            (start, end)
+            for day, start, end in schedules
+            if day in (weekday, (weekday + 1) % 7)
+        ]
+        windows = [window for window in (_parse_window(*row) for row in rows) if window]
+        breakpoints = {0}
+        for start_minutes, end_minutes in [*windows, *([bedtime] if bedtime else [])]:
+            breakpoints.update((start_minutes, end_minutes + 1))
+        for minute in sorted(point for point in breakpoints if point < MINUTES_PER_DAY):
+            segment = Segment(
+                start=(weekday * MINUTES_PER_DAY) + minute,
+                in_schedule=not rows or any(is_within_window(minute, *w) for w in windows),
+                in_bedtime=bedtime is not None and is_within_window(minute, *bedtime),
+            )
+            previous = segments[-1] if segments else None
+            if previous is None or (previous.in_schedule, previous.in_bedtime) != (
+                segment.in_schedule,
+                segment.in_bedtime,
+            ):
+                segments.append(segment)
+
+    count = len(segments)
+    next_flips: list[int | None] = [None] * count
+    upcoming: int | None = None
+    # Walk the week twice backwards so flips after the Sunday/Monday wrap are found too.
+    for position in range((2 * count) - 1, -1, -1):
+        index = position % count
+        following = segments[(index + 1) % count]
+        if following.allowed != segments[index].allowed:
+            upcoming = following.start
+        if position < count:
+            next_flips[index] = upcoming
+    return WeeklyTimeline(
+        starts=tuple(segment.start for segment in segments),
+        segments=tuple(segments),
+        next_flips=tuple(next_flips),
+    )
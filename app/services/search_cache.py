@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_entries: OrderedDict[str, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+_counters = {"hits": 0, "misses": 0}
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.casefold().split())
+
+
+def _enabled() -> bool:
+    return settings.search_cache_ttl_seconds > 0 and settings.search_cache_max_entries > 0
+
+
+def _remember(key: str, cached_at: float, results: list[dict[str, Any]]) -> None:
+    _entries[key] = (cached_at, results)
+    _entries.move_to_end(key)
+    while len(_entries) > settings.search_cache_max_entries:
+        _entries.popitem(last=False)
+
+
+def get(session: Session, query: str) -> list[dict[str, Any]] | None:
+    if not _enabled():
+        return None
+    key = normalize_query(query)
+    cutoff = time.time() - settings.search_cache_ttl_seconds
+
+    entry = _entries.get(key)
+    if entry is not None and entry[0] < cutoff:
+        del _entries[key]
+        entry = None
+    if entry is None and settings.search_cache_persist:
+        try:
+            row = session.execute(
+                text(
+                    "SELECT cached_at, results FROM search_cache "
+                    "WHERE query = :query AND cached_at >= :cutoff"
+                ),
+                {"query": key, "cutoff": cutoff},
+            ).first()
+        except SQLAlchemyError:
+            logger.debug("search_cache_load_failed", exc_info=True)
+            row = None
+        if row is not None:
+            entry = (float(row[0]), json.loads(row[1]))
+            _remember(key, *entry)
+
+    if entry is None:
+        _counters["misses"] += 1
+        return None
+    _entries.move_to_end(key)
+    _counters["hits"] += 1
+    return entry[1]
+
+
+def put(session: Session, query: str, results: list[dict[str, Any]]) -> None:
+    if not _enabled() or not results:
+        return
+    key = normalize_query(query)
+    now = time.time()
+    _remember(key, now, results)
+    if not settings.search_cache_persist:
+        return
+    try:
+        session.execute(
+            text(
+                """
+                INSERT INTO search_cache (query, results, cached_at)
+                VALUES (:query, :results, :cached_at)
+                ON CONFLICT(query) DO UPDATE SET
+                    results = excluded.results,
+                    cached_at = excluded.cached_at
+                """
+            ),
+            {"query": key, "results": json.dumps(results), "cached_at": now},
+        )
+        session.execute(
+            text("DELETE FROM search_cache WHERE cached_at < :cutoff"),
+            {"cutoff": now - settings.search_cache_ttl_seconds},
+        )
+    except SQLAlchemyError:
+        logger.debug("search_cache_store_failed", exc_info=True)
+
+
+def clear() -> None:
+    _entries.clear()
+    _counters.update(hits=0, misses=0)
+
+
+def search_cache_metrics() -> dict[str, int | float]:
+    lookups = _counters["hits"] + _counters["misses"]
+    return {
+        "entries": len(_entries),
+        "hits": _counters["hits"],
+        "misses": _counters["misses"],
+        "hit_rate": round(_counters["hits"] / lookups, 3) if lookups else 0.0,
+    }
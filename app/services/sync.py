@@ -2,21 +2,27 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, insert, text, update
 from sqlmodel import Session, select
 
 from app.core.config import settings
 from app.db.models import Channel, Video
 from app.db.session import engine
+from app.services import content_version, youtube_cache, youtube_quota
+from app.services.sync_schedule import SyncScheduler
 from app.services.youtube import (
     YouTubeResolveError,
     fetch_channel_metadata,
+    fetch_channels_metadata,
     fetch_latest_videos,
     fetch_videos_before,
     resolve_channel,
 )
+from app.services.youtube_quota import BACKGROUND, quota_priority
 from app.services.youtube_ytdlp import fetch_channel_videos
 
 logger = logging.getLogger(__name__)
@@ -45,12 +51,17 @@ def select_eligible_channels(session: Session) -> list[Channel]:
 
 async def _fetch_channel_videos_with_fallback(
     channel_youtube_id: str,
+    uploads_playlist_id: str | None = None,
+    published_after: datetime | None = None,
 ) -> list[dict[str, str | int | bool | None]]:
     if settings.youtube_api_key:
         try:
             api_videos = await fetch_latest_videos(
                 channel_youtube_id,
                 max_results=settings.sync_max_videos_per_channel,
+                uploads_playlist_id=uploads_playlist_id,
+                published_after=published_after,
+                conditional=True,
             )
             logger.debug("sync_backend=api")
             return api_videos
@@ -89,7 +100,9 @@ async def sync_channel_deep(session: Session, channel: Channel) -> int:
     oldest_published_at = oldest_row[0] if oldest_row else None
 
     if oldest_published_at is None:
-        videos = await _fetch_channel_videos_with_fallback(channel.youtube_id)
+        videos = await _fetch_channel_videos_with_fallback(
+            channel.youtube_id, channel.uploads_playlist_id
+        )
     else:
         videos = await fetch_videos_before(
             channel.youtube_id,
@@ -99,7 +112,8 @@ async def sync_channel_deep(session: Session, channel: Channel) -> int:
 
     if not videos:
         return 0
-    return store_videos(session, channel.id, videos)
+    with session.begin_nested():
+        return store_videos(session, channel.id, videos).added
 
 
 async def refresh_enabled_channels_deep() -> dict[str, int | list[dict[str, str | int | None]]]:
@@ -111,24 +125,31 @@ async def refresh_enabled_channels_deep() -> dict[str, int | list[dict[str, str
         "failures": [],
     }
 
-    with Session(engine) as session:
+    content_changed = False
+    with Session(engine, expire_on_commit=False) as session, quota_priority(BACKGROUND):
         channels = select_eligible_channels(session)
         for channel in channels:
             summary["channels_seen"] = int(summary["channels_seen"]) + 1
             try:
                 added = await sync_channel_deep(session, channel)
-                channel.last_sync = datetime.now(timezone.utc)  # noqa: UP017
                 if added > 0:
+                    channel.last_sync = datetime.now(timezone.utc)  # noqa: UP017
+                    content_changed = True
                     summary["synced"] = int(summary["synced"]) + 1
             except Exception as exc:
-                channel.resolve_error = str(exc)
+                if _assign_changed(channel, {"resolve_error": str(exc)}):
+                    content_changed = True
                 summary["failed"] = int(summary["failed"]) + 1
                 failures = summary["failures"]
                 assert isinstance(failures, list)
                 failures.append({"id": channel.id, "input": channel.input, "error": str(exc)})
             finally:
                 session.add(channel)
-        session.commit()
+                _flush_api_usage(session)
+                # Commit before the next channel's fetch so no write lock is held across it.
+                session.commit()
+    if content_changed:
+        content_version.bump()
 
     return summary
 
@@ -147,29 +168,208 @@ async def refresh_channel(channel_id: int) -> int:
 
         try:
             metadata = await fetch_channel_metadata(channel.youtube_id)
-            videos = await _fetch_channel_videos_with_fallback(channel.youtube_id)
+            videos = await _fetch_channel_videos_with_fallback(
+                channel.youtube_id,
+                metadata.get("uploads_playlist_id") or channel.uploads_playlist_id,
+            )
             if not videos:
                 raise RuntimeError("No videos returned from API or yt-dlp fallback")
         except Exception as exc:
             channel.resolve_error = str(exc)
             session.add(channel)
+            _flush_api_usage(session)
             session.commit()
             return
 
-        channel.title = metadata.get("title")
-        channel.avatar_url = metadata.get("avatar_url")
-        channel.banner_url = metadata.get("banner_url")
-        channel.resolve_status = "ok"
-        channel.resolve_error = None
-        channel.resolved_at = datetime.now(timezone.utc)  # noqa: UP017
-        channel.last_sync = datetime.now(timezone.utc)  # noqa: UP017
+        changed = _assign_changed(
+            channel,
+            {
+                "title": metadata.get("title"),
+                "avatar_url": metadata.get("avatar_url"),
+                "banner_url": metadata.get("banner_url"),
+                "uploads_playlist_id": (
+                    metadata.get("uploads_playlist_id") or channel.uploads_playlist_id
+                ),
+                "resolve_status": "ok",
+                "resolve_error": None,
+            },
+        )
+        changed = store_videos(session, channel.id, videos).changed or changed
+        if changed:
+            channel.resolved_at = datetime.now(timezone.utc)  # noqa: UP017
+            channel.last_sync = datetime.now(timezone.utc)  # noqa: UP017
         session.add(channel)
-
-        store_videos(session, channel.id, videos)
+        _flush_api_usage(session)
         session.commit()
+    if changed:
+        content_version.bump()
+
+
+def _flush_api_usage(session: Session) -> None:
+    # API bookkeeping recorded during the fetches joins the writer's transaction rather than
+    # opening its own from the fetch path.
+    youtube_quota.flush(session)
+    youtube_cache.flush(session)
+
+
+async def _fetch_metadata_batch(channel_ids: list[str]) -> dict[str, dict[str, str | None]]:
+    if not channel_ids:
+        return {}
+    try:
+        return await fetch_channels_metadata(channel_ids, conditional=True)
+    except Exception:
+        logger.warning("channel_metadata_batch_failed", exc_info=True)
+        return {}
+
+
+def _latest_published_by_channel(
+    session: Session, channel_ids: list[int]
+) -> dict[int, datetime]:
+    if not settings.sync_incremental or not channel_ids:
+        return {}
+    rows = session.execute(
+        text(
+            "SELECT channel_id, MAX(published_at) FROM videos "
+            "WHERE channel_id IN :channel_ids GROUP BY channel_id"
+        ).bindparams(bindparam("channel_ids", expanding=True)),
+        {"channel_ids": channel_ids},
+    ).all()
+    latest: dict[int, datetime] = {}
+    for channel_id, published_at in rows:
+        if isinstance(published_at, str):
+            published_at = datetime.fromisoformat(published_at)
+        if published_at is not None:
+            latest[int(channel_id)] = published_at
+    return latest
+
+
+@dataclass
+class _ChannelFetch:
+    channel_id: int
+    resolved: dict[str, str | None] | None = None
+    metadata: dict[str, str | None] | None = None
+    videos: list[dict[str, str | int | bool | None]] = field(default_factory=list)
+    error: Exception | None = None
+
+
+async def _fetch_channel(
+    channel_id: int,
+    youtube_id: str,
+    source_input: str | None,
+    needs_resolve: bool,
+    uploads_playlist_id: str | None,
+    metadata: dict[str, str | None] | None,
+    published_after: datetime | None = None,
+) -> _ChannelFetch:
+    result = _ChannelFetch(channel_id=channel_id)
+    try:
+        if needs_resolve:
+            result.resolved = await resolve_channel(source_input or youtube_id)
+            youtube_id = result.resolved["channel_id"] or youtube_id
+            uploads_playlist_id = result.resolved.get("uploads_playlist_id")
+            metadata = result.resolved
+        elif metadata is None:
+            metadata = await fetch_channel_metadata(youtube_id)
+
+        result.metadata = metadata
+        result.videos = await _fetch_channel_videos_with_fallback(
+            youtube_id,
+            result.metadata.get("uploads_playlist_id") or uploads_playlist_id,
+            published_after,
+        )
+        # An empty incremental fetch just means nothing new was uploaded.
+        if not result.videos and published_after is None:
+            raise RuntimeError("No videos returned from API or yt-dlp fallback")
+    except Exception as exc:
+        result.error = exc
+    return result
+
+
+def _assign_changed(channel: Channel, values: dict[str, object]) -> bool:
+    changed = False
+    for name, value in values.items():
+        if getattr(channel, name) != value:
+            setattr(channel, name, value)
+            changed = True
+    return changed
+
+
+def _apply_channel_fetch(
+    session: Session,
+    channel: Channel,
+    result: _ChannelFetch,
+    summary: dict[str, int | list[dict[str, str | int | None]]],
+) -> bool:
+    """Apply one channel's fetch result; returns whether the channel or its videos changed."""
+    now = datetime.now(timezone.utc)  # noqa: UP017
+    changed = result.resolved is not None
+    if result.resolved is not None:
+        channel.youtube_id = result.resolved["channel_id"] or channel.youtube_id
+        channel.title = result.resolved.get("title")
+        channel.avatar_url = result.resolved.get("avatar_url")
+        channel.banner_url = result.resolved.get("banner_url")
+        channel.uploads_playlist_id = result.resolved.get("uploads_playlist_id")
+        channel.resolve_status = "ok"
+        channel.resolve_error = None
+        channel.resolved_at = now
+        summary["resolved"] = int(summary["resolved"]) + 1
+
+    exc = result.error
+    if exc is None and result.metadata is not None:
+        changes: dict[str, object] = {
+            "title": result.metadata.get("title"),
+            "avatar_url": result.metadata.get("avatar_url"),
+            "banner_url": result.metadata.get("banner_url"),
+            "uploads_playlist_id": (
+                result.metadata.get("uploads_playlist_id") or channel.uploads_playlist_id
+            ),
+            "resolve_status": "ok",
+            "resolve_error": None,
+        }
+        if result.metadata.get("subscriber_count") is not None:
+            changes["subscriber_count"] = result.metadata.get("subscriber_count")
+        changed = _assign_changed(channel, changes) or changed
+        try:
+            if result.videos:
+                # A savepoint, so a store that fails partway leaves no half-written rows and
+                # the session stays usable for recording the failure and the next channel.
+                with session.begin_nested():
+                    stored = store_videos(session, channel.id, result.videos)
+                changed = stored.changed or changed
+            summary["synced"] = int(summary["synced"]) + 1
+        except Exception as store_exc:
+            exc = store_exc
+        # A pass that changes nothing writes nothing, so last_sync records the last pass
+        # that changed the channel or its videos rather than every pass.
+        if changed:
+            channel.last_sync = now
+
+    if exc is not None:
+        failure: dict[str, object] = {"resolve_error": str(exc)}
+        if isinstance(exc, YouTubeResolveError):
+            failure["resolve_status"] = "failed"
+        changed = _assign_changed(channel, failure) or changed
+        summary["failed"] = int(summary["failed"]) + 1
+        failures = summary["failures"]
+        assert isinstance(failures, list)
+        failures.append(
+            {
+                "id": channel.id,
+                "input": channel.input,
+                "error": str(exc),
+            }
+        )
+        logger.error(
+            "channel_sync_failed",
+            extra={"channel_id": channel.id, "error": str(exc)},
+        )
+    session.add(channel)
+    return changed
 
 
-async def refresh_enabled_channels() -> dict[str, int | list[dict[str, str | int | None]]]:
+async def refresh_enabled_channels(
+    channel_ids: list[int] | None = None,
+) -> dict[str, int | list[dict[str, str | int | None]]]:
     summary: dict[str, int | list[dict[str, str | int | None]]] = {
         "channels_seen": 0,
         "resolved": 0,
@@ -178,127 +378,225 @@ async def refresh_enabled_channels() -> dict[str, int | list[dict[str, str | int
         "failures": [],
     }
 
-    with Session(engine) as session:
+    with Session(engine, expire_on_commit=False) as session, quota_priority(BACKGROUND):
         channels = select_eligible_channels(session)
-
-        for channel in channels:
-            summary["channels_seen"] = int(summary["channels_seen"]) + 1
-            try:
-                if channel.resolve_status != "ok":
-                    source_input = channel.input or channel.youtube_id
-                    metadata = await resolve_channel(source_input)
-                    channel.youtube_id = metadata["channel_id"] or channel.youtube_id
-                    channel.title = metadata.get("title")
-                    channel.avatar_url = metadata.get("avatar_url")
-                    channel.banner_url = metadata.get("banner_url")
-                    channel.resolve_status = "ok"
-                    channel.resolve_error = None
-                    channel.resolved_at = datetime.now(timezone.utc)  # noqa: UP017
-                    summary["resolved"] = int(summary["resolved"]) + 1
-
-                metadata = await fetch_channel_metadata(channel.youtube_id)
-                videos = await _fetch_channel_videos_with_fallback(channel.youtube_id)
-                if not videos:
-                    raise RuntimeError("No videos returned from API or yt-dlp fallback")
-                channel.title = metadata.get("title")
-                channel.avatar_url = metadata.get("avatar_url")
-                channel.banner_url = metadata.get("banner_url")
-                channel.resolve_status = "ok"
-                channel.resolve_error = None
-                channel.last_sync = datetime.now(timezone.utc)  # noqa: UP017
-                store_videos(session, channel.id, videos)
-                summary["synced"] = int(summary["synced"]) + 1
-            except Exception as exc:
-                if isinstance(exc, YouTubeResolveError):
-                    channel.resolve_status = "failed"
-                channel.resolve_error = str(exc)
-                summary["failed"] = int(summary["failed"]) + 1
-                failures = summary["failures"]
-                assert isinstance(failures, list)
-                failures.append(
-                    {
-                        "id": channel.id,
-                        "input": channel.input,
-                        "error": str(exc),
-                    }
-                )
-                logger.error(
-                    "channel_sync_failed",
-                    extra={"channel_id": channel.id, "error": str(exc)},
-                )
-            finally:
-                session.add(channel)
-
+        if channel_ids is not None:
+            wanted = set(channel_ids)
+            channels = [channel for channel in channels if channel.id in wanted]
+        summary["channels_seen"] = len(channels)
+        channels_by_id = {channel.id: channel for channel in channels}
+        latest_by_id = _latest_published_by_channel(
+            session, [channel.id for channel in channels if channel.resolve_status == "ok"]
+        )
+        metadata_by_id = await _fetch_metadata_batch(
+            [channel.youtube_id for channel in channels if channel.resolve_status == "ok"]
+        )
+        targets = [
+            (
+                channel.id,
+                channel.youtube_id,
+                channel.input,
+                channel.resolve_status != "ok",
+                channel.uploads_playlist_id,
+                metadata_by_id.get(channel.youtube_id),
+                latest_by_id.get(channel.id),
+            )
+            for channel in channels
+        ]
+
+        # Fetches run concurrently; only the writer task touches the session. It commits each
+        # channel as soon as it is applied, without awaiting in between, so SQLite's write lock
+        # is never held while fetches, heartbeat flushes or admin edits are waiting on it.
+        results: asyncio.Queue[_ChannelFetch | None] = asyncio.Queue()
+        semaphore = asyncio.Semaphore(max(1, settings.sync_concurrency))
+
+        async def fetch(
+            target: tuple[
+                int,
+                str,
+                str | None,
+                bool,
+                str | None,
+                dict[str, str | None] | None,
+                datetime | None,
+            ],
+        ) -> None:
+            async with semaphore:
+                results.put_nowait(await _fetch_channel(*target))
+
+        content_changed = False
+
+        async def write() -> None:
+            nonlocal content_changed
+            while (result := await results.get()) is not None:
+                channel = channels_by_id[result.channel_id]
+                if _apply_channel_fetch(session, channel, result, summary):
+                    content_changed = True
+                _flush_api_usage(session)
+                session.commit()
+
+        writer = asyncio.create_task(write())
+        try:
+            await asyncio.gather(*(fetch(target) for target in targets))
+        finally:
+            results.put_nowait(None)
+            await writer
+        # Usage from the metadata batch, or from a pass with nothing to apply.
+        _flush_api_usage(session)
         session.commit()
+    # An unchanged pass leaves feed and channel ETags (and the dashboard cache) valid.
+    if content_changed:
+        content_version.bump()
 
+    youtube_cache.prune()
     return summary
 
 
+@dataclass
+class VideoStoreResult:
+    added: int = 0
+    updated: int = 0
+    shorts_marked: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.updated or self.shorts_marked)
+
+
+_STORE_CHUNK_SIZE = 500
+
+
+def _existing_videos(session: Session, youtube_ids: list[str]) -> dict[str, dict[str, object]]:
+    existing: dict[str, dict[str, object]] = {}
+    for start in range(0, len(youtube_ids), _STORE_CHUNK_SIZE):
+        chunk = youtube_ids[start : start + _STORE_CHUNK_SIZE]
+        rows = session.execute(
+            select(
+                Video.youtube_id,
+                Video.id,
+                Video.duration_seconds,
+                Video.is_short,
+                Video.view_count,
+            ).where(Video.youtube_id.in_(chunk))
+        ).all()
+        for row in rows:
+            existing[row.youtube_id] = {
+                "id": row.id,
+                "duration_seconds": row.duration_seconds,
+                "is_short": bool(row.is_short),
+                "view_count": row.view_count,
+            }
+    return existing
+
+
 def store_videos(
     session: Session, channel_db_id: int | None, videos: list[dict[str, str | int | bool | None]]
-) -> None:
-    if channel_db_id is None:
-        return 0
+) -> VideoStoreResult:
+    result = VideoStoreResult()
+    if channel_db_id is None or not videos:
+        return result
+
+    existing = _existing_videos(session, list({str(item["youtube_id"]) for item in videos}))
+    original = {youtube_id: dict(row) for youtube_id, row in existing.items()}
+    pending: dict[str, dict[str, object]] = {}
+    now = datetime.now(timezone.utc)  # noqa: UP017
 
-    shorts_marked = 0
-    added_count = 0
     for item in videos:
-        existing = session.exec(select(Video).where(Video.youtube_id == item["youtube_id"])).first()
+        youtube_id = str(item["youtube_id"])
         duration_seconds = item.get("duration_seconds")
         normalized_duration = int(duration_seconds) if isinstance(duration_seconds, int) else None
         is_short = bool(item.get("is_short", False))
-
-        if existing:
-            should_update = existing.duration_seconds is None or not bool(existing.is_short)
-            if should_update:
-                was_short = bool(existing.is_short)
-                existing.duration_seconds = normalized_duration
-                existing.is_short = is_short
-                session.add(existing)
-                if is_short and not was_short:
-                    shorts_marked += 1
-            incoming_view_count = item.get("view_count")
+        incoming_view_count = item.get("view_count")
+
+        # Later duplicates in the same batch update the row the first one created.
+        row = existing.get(youtube_id) or pending.get(youtube_id)
+        if row is not None:
+            if row["duration_seconds"] is None or not row["is_short"]:
+                if is_short and not row["is_short"]:
+                    result.shorts_marked += 1
+                row["duration_seconds"] = normalized_duration
+                row["is_short"] = is_short
             if isinstance(incoming_view_count, int):
-                existing.view_count = incoming_view_count or existing.view_count
-                session.add(existing)
+                row["view_count"] = incoming_view_count or row["view_count"]
             continue
 
-        published_at = datetime.fromisoformat(item["published_at"].replace("Z", "+00:00"))
         if is_short:
-            shorts_marked += 1
-        session.add(
-            Video(
-                youtube_id=str(item["youtube_id"]),
-                channel_id=channel_db_id,
-                title=str(item["title"]),
-                thumbnail_url=str(item["thumbnail_url"]),
-                published_at=published_at,
-                duration_seconds=normalized_duration,
-                is_short=is_short,
-                view_count=(
-                    item.get("view_count")
-                    if isinstance(item.get("view_count"), int)
-                    else None
-                ),
-            )
-        )
-        added_count += 1
+            result.shorts_marked += 1
+        pending[youtube_id] = {
+            "youtube_id": youtube_id,
+            "channel_id": channel_db_id,
+            "title": str(item["title"]),
+            "thumbnail_url": str(item["thumbnail_url"]),
+            "published_at": datetime.fromisoformat(
+                str(item["published_at"]).replace("Z", "+00:00")
+            ),
+            "duration_seconds": normalized_duration,
+            "is_short": is_short,
+            "view_count": incoming_view_count if isinstance(incoming_view_count, int) else None,
+            "created_at": now,
+        }
+
+    changed = [row for youtube_id, row in existing.items() if row != original[youtube_id]]
+    if pending:
+        session.execute(insert(Video), list(pending.values()))
+    if changed:
+        session.execute(update(Video), changed)
+    result.added = len(pending)
+    result.updated = len(changed)
 
     logger.info(
         "sync_shorts_marked",
-        extra={"channel_db_id": channel_db_id, "shorts_marked": shorts_marked},
+        extra={
+            "channel_db_id": channel_db_id,
+            "shorts_marked": result.shorts_marked,
+            "videos_added": result.added,
+            "videos_updated": result.updated,
+        },
     )
-    return added_count
+    return result
 
 
 async def periodic_sync(stop_event: asyncio.Event) -> None:
+    scheduler = SyncScheduler() if settings.sync_adaptive else None
     while not stop_event.is_set():
+        timeout = float(settings.sync_interval_seconds)
         try:
-            summary = await refresh_enabled_channels()
-            logger.info("Periodic sync completed", extra={"sync_summary": summary})
+            if scheduler is None:
+                summary = await refresh_enabled_channels()
+                logger.info("Periodic sync completed", extra={"sync_summary": summary})
+            else:
+                timeout = await _run_scheduled_sync(scheduler)
         except Exception as exc:
             logger.warning("Periodic sync failed: %s", exc)
         try:
-            await asyncio.wait_for(stop_event.wait(), timeout=settings.sync_interval_seconds)
+            await asyncio.wait_for(stop_event.wait(), timeout=timeout)
         except TimeoutError:
             continue
+
+
+async def _run_scheduled_sync(scheduler: SyncScheduler) -> float:
+    with Session(engine) as session:
+        scheduler.refresh(session, time.time())
+    due_ids = scheduler.pop_due(time.time())
+    if due_ids:
+        try:
+            summary = await refresh_enabled_channels(due_ids)
+        except Exception:
+            for channel_id in due_ids:
+                scheduler.record(channel_id, failed=True, now=time.time())
+            raise
+        failures = summary["failures"]
+        assert isinstance(failures, list)
+        failed_ids = {failure["id"] for failure in failures}
+        finished_at = time.time()
+        for channel_id in due_ids:
+            scheduler.record(channel_id, failed=channel_id in failed_ids, now=finished_at)
+        logger.info(
+            "Periodic sync completed",
+            extra={"sync_summary": summary, "channels_due": len(due_ids)},
+        )
+
+    # Wake up for the next due channel, but still look for new channels every interval.
+    next_due = scheduler.seconds_until_next_due(time.time())
+    interval = float(settings.sync_interval_seconds)
+    return interval if next_due is None else max(1.0, min(next_due, interval))
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import heapq
+import statistics
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.core.config import settings
+
+CADENCE_SAMPLE_SIZE = 20
+# Check a channel this many times per typical gap between its uploads.
+CHECKS_PER_UPLOAD_GAP = 24
+
+
+def _as_timestamp(value: object) -> float | None:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)  # noqa: UP017
+    return value.timestamp()
+
+
+def load_sync_state(session: Session) -> dict[int, tuple[list[float], bool]]:
+    rows = session.execute(
+        text(
+            """
+            SELECT c.id, c.resolve_error, recent.published_at
+            FROM channels c
+            LEFT JOIN (
+                SELECT channel_id, published_at,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY channel_id ORDER BY published_at DESC
+                       ) AS position
+                FROM videos
+            ) recent ON recent.channel_id = c.id AND recent.position <= :sample_size
+            WHERE c.enabled = 1 AND c.allowed = 1 AND c.blocked = 0
+            """
+        ),
+        {"sample_size": CADENCE_SAMPLE_SIZE},
+    ).all()
+
+    state: dict[int, tuple[list[float], bool]] = {}
+    for channel_id, resolve_error, published_at in rows:
+        uploads, _ = state.setdefault(int(channel_id), ([], bool(resolve_error)))
+        timestamp = _as_timestamp(published_at)
+        if timestamp is not None:
+            uploads.append(timestamp)
+    return state
+
+
+def cadence_interval(uploads: list[float], now: float) -> float:
+    floor = float(settings.sync_interval_seconds)
+    ceiling = float(max(settings.sync_max_interval_seconds, settings.sync_interval_seconds))
+    if len(uploads) < 2:
+        return floor
+
+    ordered = sorted(uploads)
+    typical_gap = statistics.median(b - a for a, b in zip(ordered, ordered[1:], strict=False))
+    # A channel that has been quiet for longer than its usual gap is treated as slower.
+    gap = max(typical_gap, now - ordered[-1])
+    return min(ceiling, max(floor, gap / CHECKS_PER_UPLOAD_GAP))
+
+
+def backoff_interval(failures: int) -> float:
+    floor = float(settings.sync_interval_seconds)
+    ceiling = float(max(settings.sync_max_interval_seconds, settings.sync_interval_seconds))
+    return min(ceiling, floor * 2 ** max(0, failures))
+
+
+class SyncScheduler:
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int]] = []
+        self._due: dict[int, float] = {}
+        self._intervals: dict[int, float] = {}
+        self._failures: dict[int, int] = {}
+
+    def refresh(self, session: Session, now: float) -> None:
+        state = load_sync_state(session)
+        for channel_id in list(self._due):
+            if channel_id not in state:
+                self._forget(channel_id)
+
+        for channel_id, (uploads, has_error) in state.items():
+            self._intervals[channel_id] = cadence_interval(uploads, now)
+            if channel_id in self._due:
+                continue
+            if has_error:
+                self._failures[channel_id] = 1
+            self._push(channel_id, now)
+
+    def pop_due(self, now: float) -> list[int]:
+        due: list[int] = []
+        while self._heap and self._heap[0][0] <= now:
+            due_at, channel_id = heapq.heappop(self._heap)
+            if self._due.get(channel_id) != due_at:
+                continue
+            del self._due[channel_id]
+            due.append(channel_id)
+        return due
+
+    def record(self, channel_id: int, failed: bool, now: float) -> None:
+        if failed:
+            failures = self._failures.get(channel_id, 0) + 1
+            self._failures[channel_id] = failures
+            delay = backoff_interval(failures)
+        else:
+            self._failures.pop(channel_id, None)
+            delay = self._intervals.get(channel_id, float(settings.sync_interval_seconds))
+        self._push(channel_id, now + delay)
+
+    def seconds_until_next_due(self, now: float) -> float | None:
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - now)
+
+    def due_at(self, channel_id: int) -> float | None:
+        return self._due.get(channel_id)
+
+    def _push(self, channel_id: int, due_at: float) -> None:
+        self._due[channel_id] = due_at
+        heapq.heappush(self._heap, (due_at, channel_id))
+
+    def _forget(self, channel_id: int) -> None:
+        self._due.pop(channel_id, None)
+        self._intervals.pop(channel_id, None)
+        self._failures.pop(channel_id, None)
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.db.models import WatchLog
+
+logger = logging.getLogger(__name__)
+
+# watch.js sends a heartbeat every ~12 s per playing kid. Instead of committing one watch_log
+# row each, accepted heartbeats are coalesced per (kid, video, category, day) and written in a
+# single transaction every HEARTBEAT_FLUSH_SECONDS and at shutdown. A flush extends the kid's
+# open watch_log session for that video (last heartbeat within WATCH_SESSION_IDLE_SECONDS on
+# the same UTC day) or starts a new one. Limit checks add pending_seconds() so enforcement
+# does not wait for a flush. Entries remember the engine of the session that accepted them
+# and are flushed back to it.
+
+
+@dataclass
+class PendingWatch:
+    bind: Engine
+    kid_id: int
+    video_id: int
+    category_id: int | None
+    seconds: int
+    started_at: datetime
+    first_seen_at: datetime
+    last_seen_at: datetime
+
+    @property
+    def day(self) -> str:
+        return self.started_at.date().isoformat()
+
+
+_PendingKey = tuple[Engine, int, int, int | None, str]
+
+_pending: dict[_PendingKey, PendingWatch] = {}
+_lock = threading.Lock()
+_counters = {"accepted": 0, "flushes": 0, "entries_written": 0, "flush_failures": 0}
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)  # noqa: UP017
+    return value.astimezone(timezone.utc)  # noqa: UP017
+
+
+def _bind(session: Session) -> Engine:
+    bind = session.get_bind()
+    return bind.engine if hasattr(bind, "engine") else bind
+
+
+def add(
+    session: Session,
+    kid_id: int,
+    video_id: int,
+    category_id: int | None,
+    seconds: int,
+    started_at: datetime,
+    now: datetime,
+) -> None:
+    started_at = _utc(started_at)
+    key = (_bind(session), kid_id, video_id, category_id, started_at.date().isoformat())
+    with _lock:
+        entry = _pending.get(key)
+        if entry is None:
+            _pending[key] = PendingWatch(
+                bind=key[0],
+                kid_id=kid_id,
+                video_id=video_id,
+                category_id=category_id,
+                seconds=seconds,
+                started_at=started_at,
+                first_seen_at=now,
+                last_seen_at=now,
+            )
+        else:
+            _merge(entry, seconds, started_at, now, now)
+        _counters["accepted"] += 1
+    if settings.heartbeat_flush_seconds <= 0:
+        flush()
+
+
+def last_seen(session: Session, kid_id: int, video_id: int) -> datetime | None:
+    bind = _bind(session)
+    with _lock:
+        seen = [
+            entry.last_seen_at
+            for entry in _pending.values()
+            if entry.bind is bind and entry.kid_id == kid_id and entry.video_id == video_id
+        ]
+    return max(seen) if seen else None
+
+
+def pending_seconds(session: Session, kid_id: int, day: str) -> dict[int | None, int]:
+    bind = _bind(session)
+    totals: dict[int | None, int] = {}
+    with _lock:
+        for entry in _pending.values():
+            if entry.bind is bind and entry.kid_id == kid_id and entry.day == day:
+                totals[entry.category_id] = totals.get(entry.category_id, 0) + entry.seconds
+    return totals
+
+
+def _merge(
+    entry: PendingWatch,
+    seconds: int,
+    started_at: datetime,
+    first_seen_at: datetime,
+    last_seen_at: datetime,
+) -> None:
+    entry.seconds += seconds
+    entry.started_at = min(entry.started_at, started_at)
+    entry.first_seen_at = min(entry.first_seen_at, first_seen_at)
+    entry.last_seen_at = max(entry.last_seen_at, last_seen_at)
+
+
+def _write(session: Session, entry: PendingWatch) -> None:
+    idle_cutoff = entry.first_seen_at - timedelta(seconds=settings.watch_session_idle_seconds)
+    open_session_id = session.execute(
+        select(WatchLog.id)
+        .where(
+            WatchLog.kid_id == entry.kid_id,
+            WatchLog.video_id == entry.video_id,
+            WatchLog.category_id.is_not_distinct_from(entry.category_id),
+            WatchLog.last_heartbeat_at >= idle_cutoff,
+            func.date(WatchLog.started_at) == entry.day,
+        )
+        .order_by(WatchLog.last_heartbeat_at.desc())
+        .limit(1)
+    ).scalar()
+    if open_session_id is not None:
+        session.execute(
+            update(WatchLog)
+            .where(WatchLog.id == open_session_id)
+            .values(
+                seconds_watched=WatchLog.seconds_watched + entry.seconds,
+                last_heartbeat_at=entry.last_seen_at,
+            )
+        )
+        return
+    session.execute(
+        insert(WatchLog).values(
+            kid_id=entry.kid_id,
+            video_id=entry.video_id,
+            seconds_watched=entry.seconds,
+            category_id=entry.category_id,
+            started_at=entry.started_at,
+            created_at=entry.first_seen_at,
+            last_heartbeat_at=entry.last_seen_at,
+        )
+    )
+
+
+def flush() -> int:
+    with _lock:
+        batch = list(_pending.values())
+        _pending.clear()
+    if not batch:
+        return 0
+
+    by_bind: dict[Engine, list[PendingWatch]] = {}
+    for entry in batch:
+        by_bind.setdefault(entry.bind, []).append(entry)
+
+    written = 0
+    for bind, entries in by_bind.items():
+        try:
+            with Session(bind) as session:
+                for entry in entries:
+                    _write(session, entry)
+                session.commit()
+        except Exception:
+            logger.exception("watch_buffer_flush_failed", extra={"entries": len(entries)})
+            _counters["flush_failures"] += 1
+            _requeue(entries)
+            continue
+        written += len(entries)
+
+    _counters["flushes"] += 1
+    _counters["entries_written"] += written
+    return written
+
+
+def _requeue(entries: list[PendingWatch]) -> None:
+    with _lock:
+        for entry in entries:
+            key = (entry.bind, entry.kid_id, entry.video_id, entry.category_id, entry.day)
+            current = _pending.get(key)
+            if current is None:
+                _pending[key] = entry
+            else:
+                _merge(
+                    current,
+                    entry.seconds,
+                    entry.started_at,
+                    entry.first_seen_at,
+                    entry.last_seen_at,
+                )
+
+
+async def periodic_flush(stop_event: asyncio.Event) -> None:
+    interval = settings.heartbeat_flush_seconds
+    if interval <= 0:
+        return
+    while not stop_event.is_set():
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+        except TimeoutError:
+            pass
+        await asyncio.to_thread(flush)
+
+
+def clear() -> None:
+    with _lock:
+        _pending.clear()
+    _counters.update(accepted=0, flushes=0, entries_written=0, flush_failures=0)
+
+
+def watch_buffer_metrics() -> dict[str, int]:
+    with _lock:
+        pending = len(_pending)
+    return {"pending": pending, **_counters}
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections import deque
+from functools import lru_cache
+
+
+class BlockedWordMatcher:
+    """Aho-Corasick automaton over lower-cased blocked words.
+
+    Scanning a title costs O(len(title) + matches) however many words are configured.
+    When several words occur, the one listed first wins, matching the old per-word loop.
+    """
+
+    def __init__(self, words: tuple[str, ...]) -> None:
+        self.words = words
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Lowest list index of any word ending at each state, following fail links.
+        self._output: list[int | None] = [None]
+        for index, word in enumerate(words):
+            if word:
+                self._add(word, index)
+        self._link()
+
+    def _add(self, word: str, index: int) -> None:
+        state = 0
+        for char in word:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+            state = next_state
+        if self._output[state] is None:
+            self._output[state] = index
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                inherited = self._output[self._fail[next_state]]
+                own = self._output[next_state]
+                if inherited is not None and (own is None or inherited < own):
+                    self._output[next_state] = inherited
+
+    def __bool__(self) -> bool:
+        return len(self._goto) > 1
+
+    def first_match(self, title: str | None) -> str | None:
+        if not title or len(self._goto) == 1:
+            return None
+        goto, fail, output = self._goto, self._fail, self._output
+        best: int | None = None
+        state = 0
+        for char in title.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            found = output[state]
+            if found is not None and (best is None or found < best):
+                best = found
+                if best == 0:
+                    break
+        return self.words[best] if best is not None else None
+
+
+@lru_cache(maxsize=8)
+def compile_blocked_words(words: tuple[str, ...]) -> BlockedWordMatcher:
+    return BlockedWordMatcher(words)
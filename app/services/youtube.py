@@ -9,8 +9,12 @@ from urllib.parse import parse_qs, urlparse
 import httpx
 
 from app.core.config import settings
+from app.core.http_client import http_client
+from app.services import youtube_cache, youtube_quota
 
 YOUTUBE_API_BASE_URL = "https://www.googleapis.com/youtube/v3"
+CHANNEL_METADATA_PARTS = "snippet,brandingSettings,statistics,contentDetails"
+CHANNELS_BATCH_SIZE = 50
 _CHANNEL_ID_PATTERN = re.compile(r"^UC[\w-]{22}$")
 _VIDEO_ID_PATTERN = re.compile(r"^[\w-]{11}$")
 _YOUTUBE_HOSTS = {"youtube.com", "www.youtube.com", "m.youtube.com"}
@@ -58,6 +62,9 @@ async def fetch_latest_videos(
     max_results: int = 10,
     published_before: str | None = None,
     client: httpx.AsyncClient | None = None,
+    uploads_playlist_id: str | None = None,
+    published_after: datetime | None = None,
+    conditional: bool = False,
 ) -> list[dict[str, str | int | bool | None]]:
     api_key = settings.youtube_api_key
     if not api_key:
@@ -65,59 +72,79 @@ async def fetch_latest_videos(
             "YOUTUBE_API_KEY is not configured. Video sync requires a valid API key."
         )
 
-    content_details = await _youtube_get(
-        "/channels",
-        {
-            "part": "contentDetails",
-            "id": channel_id,
-            "key": api_key,
-        },
-        client=client,
-    )
-    items = content_details.get("items", [])
-    if not items:
-        raise YouTubeResolveError(f"No channel found for id '{channel_id}'.")
-
-    uploads_playlist = items[0].get("contentDetails", {}).get("relatedPlaylists", {}).get("uploads")
+    uploads_playlist = uploads_playlist_id
+    if not uploads_playlist:
+        content_details = await _youtube_get(
+            "/channels",
+            {
+                "part": "contentDetails",
+                "id": channel_id,
+                "key": api_key,
+            },
+            client=client,
+            conditional=conditional,
+        )
+        items = content_details.get("items", [])
+        if not items:
+            raise YouTubeResolveError(f"No channel found for id '{channel_id}'.")
+        uploads_playlist = _uploads_playlist_from_item(items[0])
     if not uploads_playlist:
         return []
 
-    payload = await _youtube_get(
-        "/playlistItems",
-        {
+    wanted = max(1, max_results)
+    after = _as_utc(published_after) if published_after is not None else None
+    base_records: list[dict[str, str | None]] = []
+    video_ids: list[str] = []
+    page_token: str | None = None
+    reached_known = False
+    while not reached_known and len(base_records) < wanted:
+        params: dict[str, str | int] = {
             "part": "snippet",
             "playlistId": uploads_playlist,
-            "maxResults": max(1, min(max_results, 50)),
+            "maxResults": min(wanted - len(base_records), 50),
             "key": api_key,
-        },
-        client=client,
-    )
+        }
+        if page_token:
+            params["pageToken"] = page_token
+        payload = await _youtube_get(
+            "/playlistItems", params, client=client, conditional=conditional
+        )
 
-    base_records: list[dict[str, str | None]] = []
-    video_ids: list[str] = []
-    for item in payload.get("items", []):
-        snippet = item.get("snippet", {})
-        resource = snippet.get("resourceId", {})
-        video_id = resource.get("videoId")
-        if not video_id or not _VIDEO_ID_PATTERN.match(video_id):
-            continue
+        for item in payload.get("items", []):
+            snippet = item.get("snippet", {})
+            resource = snippet.get("resourceId", {})
+            video_id = resource.get("videoId")
+            if not video_id or not _VIDEO_ID_PATTERN.match(video_id):
+                continue
 
-        thumbnails = snippet.get("thumbnails", {})
-        thumb = (
-            thumbnails.get("high") or thumbnails.get("medium") or thumbnails.get("default") or {}
-        )
-        published_at = snippet.get("publishedAt")
-        if not published_at:
-            continue
-        base_records.append(
-            {
-                "youtube_id": video_id,
-                "title": snippet.get("title") or "Untitled",
-                "thumbnail_url": thumb.get("url") or "",
-                "published_at": published_at,
-            }
-        )
-        video_ids.append(video_id)
+            thumbnails = snippet.get("thumbnails", {})
+            thumb = (
+                thumbnails.get("high")
+                or thumbnails.get("medium")
+                or thumbnails.get("default")
+                or {}
+            )
+            published_at = snippet.get("publishedAt")
+            if not published_at:
+                continue
+            if after is not None and _parse_timestamp(published_at) <= after:
+                reached_known = True
+                break
+            base_records.append(
+                {
+                    "youtube_id": video_id,
+                    "title": snippet.get("title") or "Untitled",
+                    "thumbnail_url": thumb.get("url") or "",
+                    "published_at": published_at,
+                }
+            )
+            video_ids.append(video_id)
+            if len(base_records) >= wanted:
+                break
+
+        page_token = payload.get("nextPageToken")
+        if not page_token:
+            break
 
     durations: dict[str, int | None] = {}
     view_counts: dict[str, int | None] = {}
@@ -130,6 +157,7 @@ async def fetch_latest_videos(
                 "key": api_key,
             },
             client=client,
+            conditional=conditional,
         )
         for item in details.get("items", []):
             video_id = item.get("id")
@@ -484,21 +512,12 @@ async def fetch_channel_metadata(
 
     effective_key = api_key or settings.youtube_api_key
     if not effective_key:
-        return {
-            "channel_id": channel_id,
-            "title": None,
-            "handle": None,
-            "avatar_url": None,
-            "banner_url": None,
-            "description": None,
-            "subscriber_count": None,
-            "video_count": None,
-        }
+        return _empty_channel_metadata(channel_id)
 
     payload = await _youtube_get(
         "/channels",
         {
-            "part": "snippet,brandingSettings,statistics",
+            "part": CHANNEL_METADATA_PARTS,
             "id": channel_id,
             "key": effective_key,
         },
@@ -508,7 +527,62 @@ async def fetch_channel_metadata(
     if not items:
         raise YouTubeResolveError(f"No channel found for id '{channel_id}'.")
 
-    item = items[0]
+    return _channel_metadata_from_item(items[0], channel_id)
+
+
+async def fetch_channels_metadata(
+    channel_ids: list[str],
+    api_key: str | None = None,
+    client: httpx.AsyncClient | None = None,
+    conditional: bool = False,
+) -> dict[str, dict[str, str | None]]:
+    valid_ids = [
+        channel_id
+        for channel_id in dict.fromkeys(channel_ids)
+        if _CHANNEL_ID_PATTERN.match(channel_id)
+    ]
+    effective_key = api_key or settings.youtube_api_key
+    if not effective_key:
+        return {channel_id: _empty_channel_metadata(channel_id) for channel_id in valid_ids}
+
+    metadata_by_id: dict[str, dict[str, str | None]] = {}
+    for start in range(0, len(valid_ids), CHANNELS_BATCH_SIZE):
+        chunk = valid_ids[start : start + CHANNELS_BATCH_SIZE]
+        payload = await _youtube_get(
+            "/channels",
+            {
+                "part": CHANNEL_METADATA_PARTS,
+                "id": ",".join(chunk),
+                "maxResults": CHANNELS_BATCH_SIZE,
+                "key": effective_key,
+            },
+            client=client,
+            conditional=conditional,
+        )
+        for item in payload.get("items", []):
+            if not item.get("id"):
+                continue
+            metadata = _channel_metadata_from_item(item, str(item["id"]))
+            metadata_by_id[str(metadata["channel_id"])] = metadata
+
+    return metadata_by_id
+
+
+def _empty_channel_metadata(channel_id: str) -> dict[str, str | None]:
+    return {
+        "channel_id": channel_id,
+        "title": None,
+        "handle": None,
+        "avatar_url": None,
+        "banner_url": None,
+        "description": None,
+        "subscriber_count": None,
+        "video_count": None,
+        "uploads_playlist_id": None,
+    }
+
+
+def _channel_metadata_from_item(item: dict[str, Any], channel_id: str) -> dict[str, str | None]:
     snippet = item.get("snippet", {})
     thumbnails = snippet.get("thumbnails", {})
     avatar = thumbnails.get("high") or thumbnails.get("medium") or thumbnails.get("default") or {}
@@ -538,25 +612,55 @@ async def fetch_channel_metadata(
         "description": snippet.get("description"),
         "subscriber_count": subscriber_count_int,
         "video_count": video_count_int,
+        "uploads_playlist_id": _uploads_playlist_from_item(item),
     }
 
 
+def _uploads_playlist_from_item(item: dict[str, Any]) -> str | None:
+    return item.get("contentDetails", {}).get("relatedPlaylists", {}).get("uploads")
+
+
 async def _youtube_get(
     path: str,
     params: dict[str, str | int],
     client: httpx.AsyncClient | None = None,
+    conditional: bool = False,
 ) -> dict:
-    timeout = httpx.Timeout(settings.http_timeout_seconds)
+    cached = youtube_cache.lookup(path, params) if conditional else None
+    headers = {"If-None-Match": cached.etag} if cached else None
+
+    cost = await youtube_quota.acquire(path)
     if client:
-        response = await client.get(f"{YOUTUBE_API_BASE_URL}{path}", params=params)
-        response.raise_for_status()
-        return response.json()
+        response = await client.get(
+            f"{YOUTUBE_API_BASE_URL}{path}", params=params, headers=headers
+        )
+    else:
+        async with http_client() as shared_client:
+            response = await shared_client.get(
+                f"{YOUTUBE_API_BASE_URL}{path}", params=params, headers=headers
+            )
+    youtube_quota.record(path, cost)
 
-    async with httpx.AsyncClient(timeout=timeout) as local_client:
-        response = await local_client.get(f"{YOUTUBE_API_BASE_URL}{path}", params=params)
-        response.raise_for_status()
-        return response.json()
+    if cached and response.status_code == 304:
+        youtube_cache.record_not_modified(path, params)
+        return cached.body
+    response.raise_for_status()
+    payload = response.json()
+    if conditional:
+        etag = response.headers.get("ETag") or payload.get("etag")
+        youtube_cache.store(path, params, etag, payload)
+    return payload
 
 
 def utcnow() -> datetime:
     return datetime.now(timezone.utc)  # noqa: UP017
+
+
+def _parse_timestamp(value: str) -> datetime:
+    return _as_utc(datetime.fromisoformat(value.replace("Z", "+00:00")))
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)  # noqa: UP017
+    return value
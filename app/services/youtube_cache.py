@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlencode
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+_counters = {"hits": 0, "misses": 0, "not_modified": 0}
+
+# New ETags are held in memory until flush(), which the sync writer runs inside its
+# per-channel transaction, so storing from the fetch path never waits on SQLite's write lock.
+# lookup() consults pending entries before the table. A 304 queues a touch the same way so
+# prune() only evicts entries YouTube has stopped confirming.
+_pending: dict[str, tuple[str, str]] = {}
+_touched: set[str] = set()
+_pending_lock = threading.Lock()
+
+_UPSERT_ENTRY = text(
+    """
+    INSERT INTO youtube_etag_cache (cache_key, etag, body, updated_at)
+    VALUES (:cache_key, :etag, :body, CURRENT_TIMESTAMP)
+    ON CONFLICT(cache_key) DO UPDATE SET
+        etag = excluded.etag,
+        body = excluded.body,
+        updated_at = excluded.updated_at
+    """
+)
+
+_TOUCH_ENTRY = text(
+    "UPDATE youtube_etag_cache SET updated_at = CURRENT_TIMESTAMP WHERE cache_key = :cache_key"
+)
+
+
+@dataclass
+class CachedResponse:
+    etag: str
+    body: dict[str, Any]
+
+
+def cache_key(path: str, params: dict[str, str | int]) -> str:
+    return f"{path}?{urlencode(sorted((k, str(v)) for k, v in params.items() if k != 'key'))}"
+
+
+def lookup(path: str, params: dict[str, str | int]) -> CachedResponse | None:
+    if not settings.youtube_etag_cache_enabled:
+        return None
+    key = cache_key(path, params)
+    with _pending_lock:
+        row = _pending.get(key)
+    try:
+        if row is None:
+            with engine.connect() as conn:
+                row = conn.execute(
+                    text("SELECT etag, body FROM youtube_etag_cache WHERE cache_key = :cache_key"),
+                    {"cache_key": key},
+                ).first()
+    except SQLAlchemyError:
+        logger.debug("youtube_etag_cache_lookup_failed", exc_info=True)
+        return None
+
+    if row is None:
+        _counters["misses"] += 1
+        return None
+    _counters["hits"] += 1
+    return CachedResponse(etag=row[0], body=json.loads(row[1]))
+
+
+def record_not_modified(path: str, params: dict[str, str | int]) -> None:
+    _counters["not_modified"] += 1
+    with _pending_lock:
+        _touched.add(cache_key(path, params))
+
+
+def store(path: str, params: dict[str, str | int], etag: str | None, body: dict) -> None:
+    if not settings.youtube_etag_cache_enabled or not etag:
+        return
+    with _pending_lock:
+        _pending[cache_key(path, params)] = (etag, json.dumps(body))
+
+
+def flush(session: Session | None = None) -> int:
+    """Write pending entries; with ``session`` it joins that transaction and the caller commits."""
+    with _pending_lock:
+        batch = dict(_pending)
+        touched = _touched - batch.keys()
+        _pending.clear()
+        _touched.clear()
+    if not batch and not touched:
+        return 0
+    rows = [{"cache_key": key, "etag": etag, "body": body} for key, (etag, body) in batch.items()]
+    touches = [{"cache_key": key} for key in touched]
+    if session is not None:
+        _write(session, rows, touches)
+        return len(rows) + len(touches)
+    try:
+        with engine.begin() as conn:
+            _write(conn, rows, touches)
+    except SQLAlchemyError:
+        logger.debug("youtube_etag_cache_flush_failed", exc_info=True)
+        with _pending_lock:
+            for key, entry in batch.items():
+                _pending.setdefault(key, entry)
+            _touched.update(touched)
+        return 0
+    return len(rows) + len(touches)
+
+
+def _write(conn: Any, rows: list[dict[str, str]], touches: list[dict[str, str]]) -> None:
+    if rows:
+        conn.execute(_UPSERT_ENTRY, rows)
+    if touches:
+        conn.execute(_TOUCH_ENTRY, touches)
+
+
+def prune() -> int:
+    try:
+        with engine.begin() as conn:
+            result = conn.execute(
+                text(
+                    "DELETE FROM youtube_etag_cache "
+                    "WHERE updated_at < datetime('now', :max_age)"
+                ),
+                {"max_age": f"-{max(0, settings.youtube_etag_cache_max_age_days)} days"},
+            )
+    except SQLAlchemyError:
+        logger.debug("youtube_etag_cache_prune_failed", exc_info=True)
+        return 0
+    return result.rowcount or 0
+
+
+def clear() -> None:
+    with _pending_lock:
+        _pending.clear()
+        _touched.clear()
+
+
+def youtube_cache_metrics() -> dict[str, int | bool]:
+    with _pending_lock:
+        pending = len(_pending) + len(_touched)
+    return {"enabled": settings.youtube_etag_cache_enabled, "pending": pending, **_counters}
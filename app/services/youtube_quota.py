@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+ENDPOINT_COSTS = {"/search": 100}
+DEFAULT_ENDPOINT_COST = 1
+
+_priority: ContextVar[str] = ContextVar("youtube_quota_priority", default=INTERACTIVE)
+_spent: dict[str, object] = {"key": None, "units": 0}
+
+# Calls are tallied in memory and written to youtube_quota_usage by flush(): the sync writer
+# flushes inside its per-channel transaction, and quota_report() and shutdown flush the rest.
+# Recording from the fetch path never opens a write transaction of its own, so it cannot
+# queue behind (or drop under) the sync pass's write lock. spent_today() counts pending units.
+_pending: dict[tuple[str, str], list[int]] = {}
+_pending_lock = threading.Lock()
+
+_UPSERT_USAGE = text(
+    """
+    INSERT INTO youtube_quota_usage (day, endpoint, units, calls)
+    VALUES (:day, :endpoint, :units, :calls)
+    ON CONFLICT(day, endpoint) DO UPDATE SET
+        units = units + excluded.units,
+        calls = calls + excluded.calls
+    """
+)
+
+try:
+    # YouTube resets the daily quota at midnight Pacific time.
+    _QUOTA_TZ: ZoneInfo | None = ZoneInfo("America/Los_Angeles")
+except ZoneInfoNotFoundError:
+    _QUOTA_TZ = None
+
+
+class YouTubeQuotaExceededError(Exception):
+    pass
+
+
+class TokenBucket:
+    def __init__(self, capacity: float, rate: float) -> None:
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def reserve(self, cost: float) -> float:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        self.tokens -= cost
+        if self.tokens >= 0:
+            return 0.0
+        if self.rate <= 0:
+            return float("inf")
+        return -self.tokens / self.rate
+
+    def refund(self, cost: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + cost)
+
+
+_bucket: TokenBucket | None = None
+
+
+@contextmanager
+def quota_priority(priority: str) -> Iterator[None]:
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> str:
+    return _priority.get()
+
+
+def endpoint_cost(path: str) -> int:
+    return ENDPOINT_COSTS.get(path, DEFAULT_ENDPOINT_COST)
+
+
+def quota_day() -> str:
+    return datetime.now(_QUOTA_TZ).date().isoformat()
+
+
+def _background_budget() -> int:
+    return max(0, settings.youtube_daily_quota - settings.youtube_quota_interactive_reserve)
+
+
+def _background_bucket() -> TokenBucket:
+    global _bucket
+    capacity = float(settings.youtube_quota_burst)
+    rate = _background_budget() / 86400
+    if _bucket is None or (_bucket.capacity, _bucket.rate) != (capacity, rate):
+        _bucket = TokenBucket(capacity, rate)
+    return _bucket
+
+
+def spent_today() -> int:
+    day = quota_day()
+    key = (str(engine.url), day)
+    if _spent["key"] != key:
+        try:
+            with engine.connect() as conn:
+                units = conn.execute(
+                    text(
+                        "SELECT COALESCE(SUM(units), 0) FROM youtube_quota_usage "
+                        "WHERE day = :day"
+                    ),
+                    {"day": day},
+                ).scalar_one()
+        except SQLAlchemyError:
+            logger.debug("youtube_quota_load_failed", exc_info=True)
+            units = 0
+        with _pending_lock:
+            units += sum(
+                entry[0] for (pending_day, _), entry in _pending.items() if pending_day == day
+            )
+        _spent["key"] = key
+        _spent["units"] = int(units)
+    return int(_spent["units"])
+
+
+async def acquire(path: str) -> int:
+    cost = endpoint_cost(path)
+    if settings.youtube_daily_quota <= 0:
+        return cost
+
+    priority = current_priority()
+    limit = settings.youtube_daily_quota if priority == INTERACTIVE else _background_budget()
+    if spent_today() + cost > limit:
+        raise YouTubeQuotaExceededError(
+            f"YouTube API quota budget for {priority} requests is exhausted for today."
+        )
+    if priority == INTERACTIVE:
+        return cost
+
+    bucket = _background_bucket()
+    delay = bucket.reserve(cost)
+    if delay > settings.youtube_quota_max_wait_seconds:
+        bucket.refund(cost)
+        raise YouTubeQuotaExceededError("Background YouTube API requests are being throttled.")
+    if delay > 0:
+        await asyncio.sleep(delay)
+    return cost
+
+
+def record(path: str, cost: int) -> None:
+    day = quota_day()
+    spent_today()
+    with _pending_lock:
+        _spent["units"] = int(_spent["units"]) + cost
+        entry = _pending.setdefault((day, path), [0, 0])
+        entry[0] += cost
+        entry[1] += 1
+
+
+def _requeue(rows: list[dict[str, str | int]]) -> None:
+    with _pending_lock:
+        for row in rows:
+            entry = _pending.setdefault((str(row["day"]), str(row["endpoint"])), [0, 0])
+            entry[0] += int(row["units"])
+            entry[1] += int(row["calls"])
+
+
+def flush(session: Session | None = None) -> int:
+    """Write pending usage; with ``session`` it joins that transaction and the caller commits."""
+    with _pending_lock:
+        rows: list[dict[str, str | int]] = [
+            {"day": day, "endpoint": endpoint, "units": units, "calls": calls}
+            for (day, endpoint), (units, calls) in _pending.items()
+        ]
+        _pending.clear()
+    if not rows:
+        return 0
+    if session is not None:
+        session.execute(_UPSERT_USAGE, rows)
+        return len(rows)
+    try:
+        with engine.begin() as conn:
+            conn.execute(_UPSERT_USAGE, rows)
+    except SQLAlchemyError:
+        logger.debug("youtube_quota_flush_failed", exc_info=True)
+        _requeue(rows)
+        return 0
+    return len(rows)
+
+
+def clear() -> None:
+    with _pending_lock:
+        _pending.clear()
+    _spent.update(key=None, units=0)
+
+
+def quota_report(days: int = 7) -> dict[str, object]:
+    flush()
+    day = quota_day()
+    with engine.connect() as conn:
+        endpoints = conn.execute(
+            text(
+                """
+                SELECT endpoint, units, calls
+                FROM youtube_quota_usage
+                WHERE day = :day
+                ORDER BY units DESC, endpoint
+                """
+            ),
+            {"day": day},
+        ).mappings().all()
+        history = conn.execute(
+            text(
+                """
+                SELECT day, SUM(units) AS units, SUM(calls) AS calls
+                FROM youtube_quota_usage
+                GROUP BY day
+                ORDER BY day DESC
+                LIMIT :days
+                """
+            ),
+            {"days": days},
+        ).mappings().all()
+
+    spent = sum(int(row["units"]) for row in endpoints)
+    return {
+        "day": day,
+        "daily_quota": settings.youtube_daily_quota,
+        "interactive_reserve": settings.youtube_quota_interactive_reserve,
+        "spent": spent,
+        "remaining": max(0, settings.youtube_daily_quota - spent),
+        "endpoints": [dict(row) for row in endpoints],
+        "history": [dict(row) for row in history],
+    }
@@ -13,7 +13,7 @@ export function formatDate(value) {
   return new Date(value).toLocaleString();
 }
 
-export async function requestJson(url, options = {}) {
+async function request(url, options = {}) {
   const response = await fetch(url, {
     headers: { 'Content-Type': 'application/json', ...(options.headers || {}) },
     ...options,
@@ -29,11 +29,20 @@ export async function requestJson(url, options = {}) {
     }
     throw new Error(detail || `Request failed: ${response.status}`);
   }
+  return response;
+}
 
+export async function requestJson(url, options = {}) {
+  const response = await request(url, options);
   if (response.status === 204) return null;
   return response.json();
 }
 
+export async function requestPage(url, options = {}) {
+  const response = await request(url, options);
+  return { rows: await response.json(), nextCursor: response.headers.get('X-Next-Cursor') };
+}
+
 function setActiveNav() {
   const path = window.location.pathname;
   document.querySelectorAll('.nav-link').forEach((link) => {
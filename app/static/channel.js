@@ -1,4 +1,4 @@
-import { requestJson, showToast } from '/static/app.js';
+import { requestJson, requestPage, showToast } from '/static/app.js';
 
 const grid = document.getElementById('channel-video-grid');
 const channelHeader = document.getElementById('channel-header');
@@ -6,7 +6,7 @@ const channelId = grid?.dataset.channelId;
 const sentinel = document.getElementById('channel-feed-sentinel');
 const spinner = sentinel?.querySelector('.feed-spinner');
 
-const state = { observer: null, kidId: null, limit: 24, offset: 0, hasMore: true, loading: false, contentType: 'videos' };
+const state = { observer: null, kidId: null, limit: 24, cursor: null, hasMore: true, loading: false, contentType: 'videos' };
 let thumbPreviewInitialized = false;
 
 function escapeHtml(value) {
@@ -73,15 +73,16 @@ async function loadMore() {
   state.loading = true;
   updateSentinelUi();
   try {
-    const params = new URLSearchParams({ limit: String(state.limit), offset: String(state.offset), content_type: state.contentType });
-    const rows = await requestJson(`/api/channels/${encodeURIComponent(channelId)}/videos?${params.toString()}`);
+    const params = new URLSearchParams({ limit: String(state.limit), content_type: state.contentType });
+    if (state.cursor) params.set('cursor', state.cursor);
+    const { rows, nextCursor } = await requestPage(`/api/channels/${encodeURIComponent(channelId)}/videos?${params.toString()}`);
     if (rows.length) grid.insertAdjacentHTML('beforeend', rows.map(card).join(''));
     if (!thumbPreviewInitialized && rows.length) {
       window.initThumbPreview?.({ containerId: 'channel-video-grid', cardSelector: '.video-card', thumbClass: 'video-thumbnail' });
       thumbPreviewInitialized = true;
     }
-    state.offset += rows.length;
-    state.hasMore = rows.length === state.limit;
+    state.cursor = nextCursor;
+    state.hasMore = Boolean(nextCursor);
     if (!state.hasMore && state.observer) state.observer.disconnect();
   } finally {
     state.loading = false;
@@ -145,7 +146,7 @@ async function load() {
         const nextType = tab.dataset.contentType || 'videos';
         if (nextType === state.contentType) return;
         state.contentType = nextType;
-        state.offset = 0;
+        state.cursor = null;
         state.hasMore = true;
         grid.innerHTML = '';
         document.querySelectorAll('.channel-tab').forEach((btn) => btn.classList.toggle('active', btn.dataset.contentType === state.contentType));
@@ -1,4 +1,4 @@
-import { requestJson, showToast } from '/static/app.js';
+import { requestJson, requestPage, showToast } from '/static/app.js';
 
 const grid = document.getElementById('dashboard-grid');
 const latestGrid = document.getElementById('latest-channel-grid');
@@ -19,7 +19,7 @@ const state = {
   items: [], latestPerChannel: [], allowedChannels: [], shorts: [],
   categories: [{ id: null, name: 'all', enabled: true }], categoryId: null,
   kidId: null, channelFilter: queryParams.get('channel_id') || null,
-  offset: 0, limit: 30, hasMore: true, loadingMore: false, searchResults: [],
+  cursor: null, limit: 30, hasMore: true, loadingMore: false, searchResults: [],
 };
 let thumbPreviewInitialized = false;
 
@@ -162,17 +162,17 @@ async function loadMore() {
   try {
     const params = new URLSearchParams({
       limit: String(state.limit),
-      offset: String(state.offset),
       kid_id: String(state.kidId || ''),
+      ...(state.cursor ? { cursor: state.cursor } : {}),
       ...(state.channelFilter ? { channel_id: String(state.channelFilter) } : {}),
     });
-    const rows = await requestJson(`/api/feed?${params.toString()}`);
+    const { rows, nextCursor } = await requestPage(`/api/feed?${params.toString()}`);
     if (rows.length) {
       state.items = [...state.items, ...rows];
-      state.offset += rows.length;
       renderVideos();
     }
-    state.hasMore = rows.length === state.limit;
+    state.cursor = nextCursor;
+    state.hasMore = Boolean(nextCursor);
   } finally {
     state.loadingMore = false;
     updateSentinelUi();
@@ -209,20 +209,18 @@ async function runSearch(query) {
   setFeedVisible(true);
 }
 
-async function loadFeedData() {
+function loadFeedData(bundle) {
   if (!state.kidId) {
     setFeedVisible(false);
     return;
   }
   setFeedVisible(true);
   state.items = [];
-  state.offset = 0;
+  state.cursor = null;
   state.hasMore = true;
-  [state.latestPerChannel, state.allowedChannels, state.shorts] = await Promise.all([
-    requestJson('/api/feed/latest-per-channel'),
-    requestJson('/api/channels/allowed'),
-    requestJson('/api/feed/shorts'),
-  ]);
+  state.latestPerChannel = bundle.latest_per_channel;
+  state.allowedChannels = bundle.allowed_channels;
+  state.shorts = bundle.shorts;
   renderVideos();
   setupRowArrows();
   updateSentinelUi();
@@ -236,14 +234,11 @@ async function loadFeedData() {
 }
 
 async function loadDashboard() {
-  const [sessionState, apiCategories] = await Promise.all([
-    requestJson('/api/session'),
-    requestJson('/api/categories'),
-  ]);
-  state.categories = [{ id: null, name: 'all', enabled: true }, ...apiCategories.map((c) => ({ id: c.id, name: c.name, enabled: c.enabled }))];
-  state.kidId = sessionState.kid_id;
+  const bundle = await requestJson('/api/dashboard');
+  state.categories = [{ id: null, name: 'all', enabled: true }, ...bundle.categories.map((c) => ({ id: c.id, name: c.name, enabled: c.enabled }))];
+  state.kidId = bundle.kid_id;
   renderCategories();
-  await loadFeedData();
+  loadFeedData(bundle);
   setupInfiniteScroll();
   const initialSearch = queryParams.get('search');
   if (initialSearch) await runSearch(initialSearch);
@@ -8,11 +8,21 @@ let lastTick = Date.now();
 let kidId = null;
 let flushBusy = false;
 let heartbeatHandle = null;
+let remainingStream = null;
+let player = null;
 
 let ytApiPromise;
 
 const embedBase = 'https://www.youtube-nocookie.com/embed';
 
+const blockedPages = {
+  daily_limit: '/blocked/time',
+  category_limit: '/blocked/time',
+  schedule: '/blocked/schedule',
+  bedtime: '/blocked/schedule',
+  pending_approval: '/blocked/pending',
+};
+
 function buildNoCookieEmbedUrl(videoId) {
   const params = new URLSearchParams({
     rel: '0',
@@ -120,6 +130,36 @@ function updateNowPlaying(kid, minutesLeftText) {
   overlay.hidden = false;
 }
 
+function formatMinutesLeft(remainingSeconds) {
+  if (typeof remainingSeconds !== 'number') return 'No time limit today';
+  const minutes = Math.max(0, Math.floor(remainingSeconds / 60));
+  return `${minutes} min left today`;
+}
+
+function applyRemainingState(state) {
+  const minutesLeft = document.getElementById('watch-now-playing-minutes');
+  if (minutesLeft) minutesLeft.textContent = formatMinutesLeft(state.remaining_seconds);
+  if (state.allowed) return;
+
+  player?.pauseVideo?.();
+  remainingStream?.close();
+  const blockedPage = blockedPages[state.reason];
+  if (blockedPage) {
+    window.location.assign(blockedPage);
+  } else {
+    showToast(state.detail || 'This video is not available right now', 'error');
+  }
+}
+
+function openRemainingStream() {
+  if (!kidId || !youtubeId || !window.EventSource) return;
+  const params = new URLSearchParams({ kid_id: String(kidId), video_id: youtubeId });
+  remainingStream = new EventSource(`/api/playback/stream?${params.toString()}`);
+  remainingStream.addEventListener('remaining', (event) => {
+    applyRemainingState(JSON.parse(event.data));
+  });
+}
+
 async function loadNowPlaying(sessionState) {
   if (!sessionState?.kid_id) {
     updateNowPlaying(null, 'Session unavailable');
@@ -127,7 +167,6 @@ async function loadNowPlaying(sessionState) {
   }
 
   let kid = null;
-  let minutesLeftText = 'Time left unavailable';
 
   try {
     const kids = await requestJson('/api/kids');
@@ -136,17 +175,8 @@ async function loadNowPlaying(sessionState) {
     // no-op
   }
 
-  try {
-    const limits = await requestJson(`/api/kids/${sessionState.kid_id}/limits`);
-    if (typeof limits.remaining_seconds === 'number') {
-      const minutes = Math.max(0, Math.floor(limits.remaining_seconds / 60));
-      minutesLeftText = `${minutes} min left today`;
-    }
-  } catch {
-    // no-op
-  }
-
-  updateNowPlaying(kid, minutesLeftText);
+  // Time left arrives on the remaining-time stream opened right after this.
+  updateNowPlaying(kid, 'Loading time left…');
 }
 
 async function loadVideo() {
@@ -197,6 +227,7 @@ async function loadVideo() {
     `;
 
     await loadNowPlaying(sessionState);
+    openRemainingStream();
 
     heartbeatHandle = window.setInterval(async () => {
       accrueWatchTime();
@@ -204,7 +235,7 @@ async function loadVideo() {
     }, 12000);
 
     const yt = await loadYoutubeIframeApi();
-    const player = new yt.Player('watch-player', {
+    player = new yt.Player('watch-player', {
       videoId: video.youtube_id,
       playerVars: { rel: 0, modestbranding: 1, playsinline: 1, enablejsapi: 1, origin: embedOrigin || window.location.origin },
       host: 'https://www.youtube-nocookie.com',
@@ -252,6 +283,7 @@ window.addEventListener('pagehide', () => {
     }));
   }
   if (heartbeatHandle) window.clearInterval(heartbeatHandle);
+  remainingStream?.close();
 });
 
 loadVideo();
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import argparse
+import sqlite3
+from pathlib import Path
+
+from app.core.config import settings
+
+REBUILD_SQL = """
+INSERT INTO kid_daily_usage(kid_id, day, category_id, seconds)
+SELECT
+    kid_id,
+    date(COALESCE(started_at, created_at)) AS usage_day,
+    category_id,
+    COALESCE(SUM(seconds_watched), 0)
+FROM watch_log
+WHERE date(COALESCE(started_at, created_at)) IS NOT NULL
+GROUP BY kid_id, usage_day, category_id
+"""
+
+
+def rebuild_daily_usage(conn: sqlite3.Connection) -> int:
+    with conn:
+        conn.execute("DELETE FROM kid_daily_usage")
+        conn.execute(REBUILD_SQL)
+    return int(conn.execute("SELECT COUNT(*) FROM kid_daily_usage").fetchone()[0])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild kid_daily_usage from watch_log")
+    parser.add_argument("--db", default=settings.sqlite_path, help="SQLite DB path")
+    args = parser.parse_args()
+
+    if not args.db:
+        raise SystemExit("No SQLite DB path configured; pass --db")
+    db_path = Path(args.db)
+    if not db_path.exists():
+        raise SystemExit(f"DB does not exist: {db_path}")
+
+    with sqlite3.connect(db_path) as conn:
+        rows = rebuild_daily_usage(conn)
+    print(f"kid_daily_usage_rows={rows}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from pathlib import Path
 
 from fastapi import APIRouter, Request
@@ -9,6 +10,7 @@ from sqlmodel import Session, select
 
 from app.db.models import Kid
 from app.db.session import engine
+from app.services.limits import load_kid_timeline
 
 router = APIRouter()
 
@@ -182,24 +184,33 @@ def ui_blocked_time(request: Request) -> HTMLResponse | RedirectResponse:
     )
 
 
+def _format_unlock_time(unlock_at: datetime | None, now: datetime) -> str:
+    if unlock_at is None:
+        return "later"
+    if unlock_at.date() == now.date():
+        return unlock_at.strftime("%H:%M")
+    return unlock_at.strftime("%A %H:%M")
+
+
 @router.get("/blocked/schedule", response_class=HTMLResponse, response_model=None)
-def ui_blocked_schedule(
-    request: Request, unlock_time: str = "later"
-) -> HTMLResponse | RedirectResponse:
+def ui_blocked_schedule(request: Request) -> HTMLResponse | RedirectResponse:
     kid_id = request.session.get("kid_id")
     if not kid_id:
         return RedirectResponse(url="/", status_code=307)
 
+    now = datetime.now(timezone.utc)  # noqa: UP017
     with Session(engine) as session:
         kid = session.get(Kid, kid_id)
+        timeline = load_kid_timeline(session, kid_id) if kid else None
 
-    if not kid:
+    # Nothing to wait for once schedules and bedtime allow watching again.
+    if not kid or timeline is None or timeline.segment_at(now).allowed:
         return RedirectResponse(url="/", status_code=307)
 
     return render_page(
         request,
         "blocked_schedule.html",
-        unlock_time=unlock_time,
+        unlock_time=_format_unlock_time(timeline.next_change(now), now),
         current_kid={"name": kid.name, "avatar_url": _kid_avatar_url(kid.id or 0, kid.avatar_url)},
     )
 
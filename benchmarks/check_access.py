@@ -0,0 +1,537 @@
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from fastapi import HTTPException
+from sqlalchemy import event, text
+from sqlmodel import Session, create_engine
+
+from app.db.migrate import run_migrations
+from app.services.limits import (
+    ACCESS_REASON_BEDTIME,
+    ACCESS_REASON_BLOCKED_CHANNEL,
+    ACCESS_REASON_CATEGORY_LIMIT,
+    ACCESS_REASON_DAILY_LIMIT,
+    ACCESS_REASON_PENDING_APPROVAL,
+    ACCESS_REASON_SCHEDULE,
+    ACCESS_REASON_SHORTS_DISABLED,
+    ACCESS_REASON_WORD_FILTER,
+    check_access,
+)
+
+# The per-check query path check_access used before the policy snapshot, kept for comparison.
+# The schedule, bedtime and limit helpers are copied as they were too: the app's versions now
+# read the snapshot and kid_daily_usage, so calling them would compare the new path to itself.
+
+
+def _utc_day_bounds(now: datetime) -> tuple[datetime, datetime]:
+    now_utc = (
+        now.astimezone(timezone.utc)  # noqa: UP017
+        if now.tzinfo
+        else now.replace(  # noqa: UP017
+            tzinfo=timezone.utc  # noqa: UP017
+        )
+    )
+    day_start = now_utc.replace(hour=0, minute=0, second=0, microsecond=0)
+    day_end = day_start + timedelta(days=1)
+    return day_start, day_end
+
+
+def _time_to_minutes(value: str) -> int:
+    hours_str, minutes_str = value.split(":", 1)
+    hours = int(hours_str)
+    minutes = int(minutes_str)
+    if not (0 <= hours <= 23 and 0 <= minutes <= 59):
+        raise ValueError("Invalid time value")
+    return (hours * 60) + minutes
+
+
+def _is_within_window(now_minutes: int, start_minutes: int, end_minutes: int) -> bool:
+    if start_minutes <= end_minutes:
+        return start_minutes <= now_minutes <= end_minutes
+    return now_minutes >= start_minutes or now_minutes <= end_minutes
+
+
+def is_in_any_schedule(session: Session, kid_id: int, now: datetime) -> bool:
+    day_of_week_py = now.weekday()
+    day_of_week_sun_first = (day_of_week_py + 1) % 7
+    rows = session.execute(
+        text(
+            """
+            SELECT start_time, end_time
+            FROM kid_schedules
+            WHERE kid_id = :kid_id
+              AND day_of_week IN (:day_of_week_py, :day_of_week_sun_first)
+            """
+        ),
+        {
+            "kid_id": kid_id,
+            "day_of_week_py": day_of_week_py,
+            "day_of_week_sun_first": day_of_week_sun_first,
+        },
+    ).all()
+
+    if not rows:
+        return True
+
+    now_minutes = (now.hour * 60) + now.minute
+    for start_time, end_time in rows:
+        try:
+            start_minutes = _time_to_minutes(start_time)
+            end_minutes = _time_to_minutes(end_time)
+        except ValueError:
+            continue
+
+        if _is_within_window(now_minutes, start_minutes, end_minutes):
+            return True
+
+    return False
+
+
+def is_in_bedtime(session: Session, kid_id: int, now: datetime) -> bool:
+    bedtime = session.execute(
+        text(
+            """
+            SELECT bedtime_start, bedtime_end
+            FROM kids
+            WHERE id = :kid_id
+            LIMIT 1
+            """
+        ),
+        {"kid_id": kid_id},
+    ).first()
+    if not bedtime:
+        raise HTTPException(status_code=404, detail="Kid not found")
+
+    bedtime_start, bedtime_end = bedtime
+    if bedtime_start is None or bedtime_end is None:
+        return False
+
+    try:
+        start_minutes = _time_to_minutes(str(bedtime_start))
+        end_minutes = _time_to_minutes(str(bedtime_end))
+    except ValueError:
+        return False
+
+    now_minutes = (now.hour * 60) + now.minute
+    return _is_within_window(now_minutes, start_minutes, end_minutes)
+
+
+def _resolve_limit_minutes(session: Session, kid_id: int, category_id: int | None) -> int | None:
+    if category_id is not None:
+        kid_category_limit = session.execute(
+            text(
+                """
+                SELECT daily_limit_minutes
+                FROM kid_category_limits
+                WHERE kid_id = :kid_id AND category_id = :category_id
+                LIMIT 1
+                """
+            ),
+            {"kid_id": kid_id, "category_id": category_id},
+        ).first()
+        if kid_category_limit:
+            return int(kid_category_limit[0])
+
+    kid_limit = session.execute(
+        text(
+            """
+            SELECT daily_limit_minutes
+            FROM kids
+            WHERE id = :kid_id
+            LIMIT 1
+            """
+        ),
+        {"kid_id": kid_id},
+    ).first()
+    if not kid_limit:
+        raise HTTPException(status_code=404, detail="Kid not found")
+
+    return int(kid_limit[0]) if kid_limit[0] is not None else None
+
+
+def active_bonus_seconds(session: Session, kid_id: int, now: datetime) -> int:
+    active_bonus_minutes = session.execute(
+        text(
+            """
+            SELECT COALESCE(SUM(minutes), 0)
+            FROM kid_bonus_time
+            WHERE kid_id = :kid_id
+              AND (expires_at IS NULL OR expires_at > :now)
+            """
+        ),
+        {
+            "kid_id": kid_id,
+            "now": now.isoformat(),
+        },
+    ).one()[0]
+    return int(active_bonus_minutes) * 60
+
+
+def remaining_seconds_for(
+    session: Session,
+    kid_id: int,
+    category_id: int | None,
+    now: datetime,
+) -> int | None:
+    limit_minutes = _resolve_limit_minutes(session, kid_id, category_id)
+    if limit_minutes is None:
+        return None
+
+    day_start, day_end = _utc_day_bounds(now)
+
+    watched_seconds = session.execute(
+        text(
+            """
+            SELECT COALESCE(SUM(seconds_watched), 0)
+            FROM watch_log
+            WHERE kid_id = :kid_id
+              AND (
+                (:category_id IS NULL AND category_id IS NULL)
+                OR category_id = :category_id
+              )
+              AND started_at >= :day_start
+              AND started_at < :day_end
+            """
+        ),
+        {
+            "kid_id": kid_id,
+            "category_id": category_id,
+            "day_start": day_start.isoformat(),
+            "day_end": day_end.isoformat(),
+        },
+    ).one()[0]
+
+    return ((limit_minutes * 60) + active_bonus_seconds(session, kid_id, now)) - int(
+        watched_seconds
+    )
+
+
+def _parent_blocked_words(session: Session) -> list[str]:
+    row = session.execute(text("SELECT blocked_words FROM parent_settings WHERE id = 1")).first()
+    if not row or not row[0]:
+        return []
+    raw = str(row[0]).strip()
+    if not raw:
+        return []
+    return [word.strip().lower() for word in raw.split(",") if word.strip()]
+
+
+def legacy_check_access(
+    session: Session,
+    kid_id: int,
+    *,
+    video_id: str | None = None,
+    channel_id: str | None = None,
+    category_id: int | None = None,
+    is_shorts: bool = False,
+    title: str | None = None,
+    now: datetime | None = None,
+) -> tuple[bool, str | None, dict[str, object]]:
+    now = now or datetime.now(timezone.utc)  # noqa: UP017
+
+    if not is_in_any_schedule(session, kid_id=kid_id, now=now):
+        return False, ACCESS_REASON_SCHEDULE, {}
+    if is_in_bedtime(session, kid_id=kid_id, now=now):
+        return False, ACCESS_REASON_BEDTIME, {}
+
+    resolved = None
+    if video_id:
+        resolved = (
+            session.execute(
+                text(
+                    """
+                SELECT
+                    v.title AS video_title,
+                    v.is_short AS video_is_short,
+                    c.youtube_id AS channel_youtube_id,
+                    c.category_id AS category_id,
+                    c.allowed AS channel_allowed,
+                    c.blocked AS channel_blocked
+                FROM videos v
+                JOIN channels c ON c.id = v.channel_id
+                WHERE v.youtube_id = :video_id
+                LIMIT 1
+                """
+                ),
+                {"video_id": video_id},
+            )
+            .mappings()
+            .first()
+        )
+        if resolved:
+            if category_id is None:
+                category_id = resolved["category_id"]
+            if not channel_id:
+                channel_id = resolved["channel_youtube_id"]
+            if not title:
+                title = resolved["video_title"]
+            is_shorts = bool(resolved["video_is_short"])
+
+    remaining_seconds = remaining_seconds_for(
+        session,
+        kid_id=kid_id,
+        category_id=category_id,
+        now=now,
+    )
+    if remaining_seconds is not None and remaining_seconds <= 0:
+        category_limit_exists = False
+        if category_id is not None:
+            category_limit_exists = (
+                session.execute(
+                    text(
+                        """
+                        SELECT 1 FROM kid_category_limits
+                        WHERE kid_id = :kid_id AND category_id = :category_id
+                        LIMIT 1
+                        """
+                    ),
+                    {"kid_id": kid_id, "category_id": category_id},
+                ).first()
+                is not None
+            )
+        return (
+            False,
+            ACCESS_REASON_CATEGORY_LIMIT if category_limit_exists else ACCESS_REASON_DAILY_LIMIT,
+            {"remaining_seconds": int(remaining_seconds)},
+        )
+
+    if is_shorts:
+        shorts_enabled = session.execute(
+            text("SELECT shorts_enabled FROM parent_settings WHERE id = 1")
+        ).first()
+        if shorts_enabled and int(shorts_enabled[0]) == 0:
+            return False, ACCESS_REASON_SHORTS_DISABLED, {}
+
+    if channel_id:
+        channel_row = session.execute(
+            text(
+                """
+                SELECT allowed, blocked
+                FROM channels
+                WHERE youtube_id = :channel_id
+                LIMIT 1
+                """
+            ),
+            {"channel_id": channel_id},
+        ).first()
+        if channel_row and int(channel_row[1]) == 1:
+            return False, ACCESS_REASON_BLOCKED_CHANNEL, {}
+
+    lowered_title = (title or "").lower()
+    for blocked_word in _parent_blocked_words(session):
+        if blocked_word and blocked_word in lowered_title:
+            return False, ACCESS_REASON_WORD_FILTER, {"word": blocked_word}
+
+    if video_id:
+        channel_allowed = bool(resolved["channel_allowed"]) if resolved else False
+        video_approved = (
+            session.execute(
+                text("SELECT 1 FROM video_approvals WHERE youtube_id = :youtube_id LIMIT 1"),
+                {"youtube_id": video_id},
+            ).first()
+            is not None
+        )
+        if not channel_allowed and not video_approved:
+            request_row = session.execute(
+                text(
+                    """
+                    SELECT status
+                    FROM requests
+                    WHERE kid_id = :kid_id
+                      AND (
+                        (type = 'video' AND youtube_id = :video_id)
+                        OR (type = 'channel' AND youtube_id = :channel_id)
+                      )
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT 1
+                    """
+                ),
+                {"kid_id": kid_id, "video_id": video_id, "channel_id": channel_id},
+            ).first()
+            request_status = str(request_row[0]) if request_row else "none"
+            return False, ACCESS_REASON_PENDING_APPROVAL, {"request_status": request_status}
+
+    return True, None, {}
+
+
+def seed(session: Session, rng: random.Random, kids: int, videos: int) -> list[str]:
+    session.execute(
+        text("UPDATE parent_settings SET shorts_enabled = 0, blocked_words = 'scary, zombie'")
+    )
+    session.execute(
+        text("INSERT INTO categories(name, enabled) VALUES ('Education', 1), ('Fun', 1)")
+    )
+    for index in range(6):
+        session.execute(
+            text(
+                "INSERT INTO channels(youtube_id, title, category_id, allowed, blocked, "
+                "enabled, resolve_status) "
+                "VALUES (:yt, :title, :category, :allowed, :blocked, 1, 'ok')"
+            ),
+            {
+                "yt": f"UCbench{index}",
+                "title": f"Channel {index}",
+                "category": (index % 3) or None,
+                "allowed": int(index != 4),
+                "blocked": int(index == 5),
+            },
+        )
+    video_ids: list[str] = []
+    titles = ["Counting", "Scary stories", "Zombie dance", "Planets", "Trains"]
+    for index in range(videos):
+        youtube_id = f"bench{index:06d}"
+        video_ids.append(youtube_id)
+        session.execute(
+            text(
+                "INSERT INTO videos(youtube_id, channel_id, title, thumbnail_url, published_at, "
+                "is_short) VALUES (:yt, :channel, :title, 'x', '2024-01-01', :short)"
+            ),
+            {
+                "yt": youtube_id,
+                "channel": index % 6 + 1,
+                "title": titles[index % len(titles)],
+                "short": int(index % 7 == 0),
+            },
+        )
+    for kid in range(1, kids + 1):
+        session.execute(
+            text(
+                "INSERT INTO kids(name, daily_limit_minutes, bedtime_start, bedtime_end) "
+                "VALUES (:name, :limit, :bed_start, :bed_end)"
+            ),
+            {
+                "name": f"Kid {kid}",
+                "limit": rng.choice([None, 30, 60, 1]),
+                "bed_start": rng.choice([None, "20:00", "bad"]),
+                "bed_end": "07:00",
+            },
+        )
+        for day in rng.sample(range(7), 3):
+            session.execute(
+                text(
+                    "INSERT INTO kid_schedules(kid_id, day_of_week, start_time, end_time) "
+                    "VALUES (:kid, :day, :start, :end)"
+                ),
+                {"kid": kid, "day": day, "start": rng.choice(["07:00", "22:00"]), "end": "21:00"},
+            )
+        if rng.random() < 0.5:
+            session.execute(
+                text(
+                    "INSERT INTO kid_category_limits(kid_id, category_id, daily_limit_minutes) "
+                    "VALUES (:kid, 1, :limit)"
+                ),
+                {"kid": kid, "limit": rng.choice([1, 45])},
+            )
+        session.execute(
+            text("INSERT INTO kid_bonus_time(kid_id, minutes, expires_at) VALUES (:kid, 5, :exp)"),
+            {"kid": kid, "exp": rng.choice([None, "2000-01-01T00:00:00+00:00"])},
+        )
+        for _ in range(20):
+            session.execute(
+                text(
+                    "INSERT INTO watch_log(kid_id, video_id, seconds_watched, category_id, "
+                    "started_at, created_at) VALUES (:kid, :video, :seconds, :category, "
+                    ":started, :started)"
+                ),
+                {
+                    "kid": kid,
+                    "video": rng.randint(1, videos),
+                    "seconds": rng.randint(10, 400),
+                    "category": rng.choice([None, 1, 2]),
+                    "started": rng.choice(["2024-06-03T10:00:00+00:00", "2024-06-02T10:00:00"]),
+                },
+            )
+        for youtube_id in rng.sample(video_ids, min(5, len(video_ids))):
+            session.execute(
+                text(
+                    "INSERT INTO requests(type, youtube_id, kid_id, status) "
+                    "VALUES ('video', :yt, :kid, :status)"
+                ),
+                {"yt": youtube_id, "kid": kid, "status": rng.choice(["pending", "denied"])},
+            )
+    for youtube_id in rng.sample(video_ids, min(5, len(video_ids))):
+        session.execute(
+            text("INSERT INTO video_approvals(youtube_id) VALUES (:yt)"), {"yt": youtube_id}
+        )
+    session.commit()
+    return video_ids
+
+
+def _outcome(fn, session: Session, kid_id: int, **kwargs):  # type: ignore[no-untyped-def]
+    try:
+        return fn(session, kid_id, **kwargs)
+    except HTTPException as exc:
+        return ("http", exc.status_code, exc.detail)
+
+
+def run(kids: int, videos: int, iterations: int) -> None:
+    rng = random.Random(12)
+    base = datetime(2024, 6, 3, tzinfo=timezone.utc)  # noqa: UP017
+    moments = [base + timedelta(hours=hour, minutes=17) for hour in (3, 8, 12, 21, 23)]
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        run_migrations(engine, Path(__file__).resolve().parents[1] / "app" / "db" / "migrations")
+        with Session(engine) as session:
+            video_ids = seed(session, rng, kids, videos)
+            cases = [
+                {"video_id": video_id, "now": now}
+                for video_id in video_ids[:40] + ["missing0001"]
+                for now in moments
+            ] + [{"channel_id": "UCbench5", "now": base}, {"is_shorts": True, "now": base}]
+
+            reasons: dict[str | None, int] = {}
+            for kid_id in range(1, kids + 2):
+                for case in cases:
+                    legacy = _outcome(legacy_check_access, session, kid_id, **case)
+                    current = _outcome(check_access, session, kid_id, **case)
+                    if legacy != current:
+                        raise SystemExit(
+                            f"mismatch kid={kid_id} case={case}: {legacy} != {current}"
+                        )
+                    reason = current[1] if len(current) == 3 and current[0] != "http" else "http"
+                    reasons[reason] = reasons.get(reason, 0) + 1
+            print(f"parity_ok cases={sum(reasons.values())} reasons={reasons}")
+
+            for label, fn in (("legacy", legacy_check_access), ("snapshot", check_access)):
+                queries = 0
+
+                def count(*_args) -> None:  # type: ignore[no-untyped-def]
+                    nonlocal queries
+                    queries += 1
+
+                event.listen(engine, "before_cursor_execute", count)
+                started = time.perf_counter()
+                for index in range(iterations):
+                    fn(
+                        session,
+                        index % kids + 1,
+                        video_id=video_ids[index % len(video_ids)],
+                        now=moments[2],
+                    )
+                elapsed = time.perf_counter() - started
+                event.remove(engine, "before_cursor_execute", count)
+                print(
+                    f"{label}: checks={iterations} seconds={elapsed:.3f} "
+                    f"per_check_us={elapsed / iterations * 1_000_000:.1f} "
+                    f"queries_per_check={queries / iterations:.1f}"
+                )
+        engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark check_access against the legacy path")
+    parser.add_argument("--kids", type=int, default=8)
+    parser.add_argument("--videos", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+    run(args.kids, args.videos, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
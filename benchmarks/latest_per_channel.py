@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+from app.api.routes_feed import LATEST_PER_CHANNEL_SQL
+from app.db.migrate import run_migrations
+
+# The query latest_per_channel ran before feed_items existed, kept for comparison.
+LEGACY_SQL = """
+SELECT
+    c.id AS channel_id,
+    c.youtube_id AS channel_youtube_id,
+    c.title AS channel_title,
+    c.avatar_url AS channel_avatar_url,
+    c.category AS channel_category,
+    c.category_id AS channel_category_id,
+    cat.name AS channel_category_name,
+    v.youtube_id AS video_youtube_id,
+    v.title AS video_title,
+    v.thumbnail_url AS video_thumbnail_url,
+    v.published_at AS video_published_at,
+    v.duration_seconds AS video_duration_seconds,
+    v.is_short AS video_is_short,
+    v.view_count AS video_view_count
+FROM channels c
+JOIN videos v ON v.channel_id = c.id
+LEFT JOIN categories cat ON cat.id = c.category_id
+WHERE c.enabled = 1
+  AND c.allowed = 1
+  AND c.blocked = 0
+  AND (c.category_id IS NULL OR cat.enabled = 1)
+  AND v.is_short = 0
+  AND v.id = (
+    SELECT vv.id
+    FROM videos vv
+    WHERE vv.channel_id = c.id
+      AND vv.is_short = 0
+    ORDER BY vv.published_at DESC
+    LIMIT 1
+  )
+ORDER BY v.published_at DESC
+"""
+
+# The feed_items version without the channel pointer: one index seek per channel.
+CHANNEL_SEEK_SQL = """
+SELECT f.*
+FROM channels c
+JOIN feed_items f ON f.video_id = (
+    SELECT latest.video_id
+    FROM feed_items latest
+    WHERE latest.channel_id = c.id
+      AND latest.video_is_short = 0
+    ORDER BY latest.video_published_at DESC, latest.video_id DESC
+    LIMIT 1
+)
+ORDER BY f.video_published_at DESC, f.video_id DESC
+"""
+
+
+def seed(conn: sqlite3.Connection, channels: int, videos_per_channel: int) -> None:
+    with conn:
+        conn.executemany(
+            "INSERT INTO channels(id, youtube_id, title, allowed, blocked, enabled, "
+            "resolve_status) VALUES (?, ?, ?, 1, 0, 1, 'ok')",
+            [(index + 1, f"UCbench{index:04d}", f"Channel {index}") for index in range(channels)],
+        )
+        conn.executemany(
+            "INSERT INTO videos(youtube_id, channel_id, title, thumbnail_url, published_at, "
+            "is_short) VALUES (?, ?, ?, 'x', ?, ?)",
+            (
+                (
+                    f"bench{channel:04d}-{index:05d}",
+                    channel + 1,
+                    f"Benchmark video {index}",
+                    f"2024-{index % 12 + 1:02d}-{index % 28 + 1:02d}T{index % 24:02d}:00:00Z",
+                    int(index % 7 == 0),
+                )
+                for channel in range(channels)
+                for index in range(videos_per_channel)
+            ),
+        )
+        conn.execute("ANALYZE")
+
+
+def timed(conn: sqlite3.Connection, sql: str, iterations: int) -> tuple[float, list[int]]:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        rows = conn.execute(sql).fetchall()
+    elapsed = (time.perf_counter() - started) / iterations
+    return elapsed, sorted(row["channel_id"] for row in rows)
+
+
+def run(channels: int, videos_per_channel: int, iterations: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        engine = create_engine(f"sqlite:///{db_path}")
+        run_migrations(engine, Path(__file__).resolve().parents[1] / "app" / "db" / "migrations")
+        engine.dispose()
+
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        started = time.perf_counter()
+        seed(conn, channels, videos_per_channel)
+        print(
+            f"seed: channels={channels} videos={channels * videos_per_channel} "
+            f"seconds={time.perf_counter() - started:.1f}"
+        )
+
+        results = {}
+        timings = {}
+        for label, sql in (
+            ("legacy", LEGACY_SQL),
+            ("channel_seek", CHANNEL_SEEK_SQL),
+            ("latest_pointer", LATEST_PER_CHANNEL_SQL),
+        ):
+            elapsed, channel_ids = timed(conn, sql, iterations)
+            results[label] = channel_ids
+            timings[label] = elapsed
+            print(f"{label}: rows={len(channel_ids)} ms_per_call={elapsed * 1000:.2f}")
+        conn.close()
+        print(f"latest_pointer/legacy: {timings['latest_pointer'] / timings['legacy']:.2f}x time")
+
+        if len({tuple(channel_ids) for channel_ids in results.values()}) != 1:
+            raise SystemExit("Query variants returned different channels")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the latest-per-channel feed query")
+    parser.add_argument("--channels", type=int, default=500, help="Channels to seed")
+    parser.add_argument("--videos", type=int, default=2000, help="Videos per channel")
+    parser.add_argument("--iterations", type=int, default=3, help="Timed calls per variant")
+    args = parser.parse_args()
+    run(args.channels, args.videos, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
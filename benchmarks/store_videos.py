@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from sqlmodel import Session, create_engine
+
+from app.db.migrate import run_migrations
+from app.db.models import Channel
+from app.services.sync import store_videos
+
+
+def build_videos(count: int, view_count: int) -> list[dict[str, str | int | bool | None]]:
+    return [
+        {
+            "youtube_id": f"bench{index:06d}",
+            "title": f"Benchmark video {index}",
+            "thumbnail_url": f"https://i.ytimg.com/vi/bench{index:06d}/hqdefault.jpg",
+            "published_at": f"2024-01-{index % 28 + 1:02d}T00:00:00Z",
+            "duration_seconds": 60 + index % 600,
+            "is_short": index % 600 <= 120,
+            "view_count": view_count + index,
+        }
+        for index in range(count)
+    ]
+
+
+def run(count: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        run_migrations(engine, Path(__file__).resolve().parents[1] / "app" / "db" / "migrations")
+
+        with Session(engine) as session:
+            channel = Channel(youtube_id="UCbenchmark", resolve_status="ok")
+            session.add(channel)
+            session.commit()
+            session.refresh(channel)
+
+            for label, view_count in (("insert", 100), ("update", 200), ("unchanged", 200)):
+                videos = build_videos(count, view_count)
+                started = time.perf_counter()
+                result = store_videos(session, channel.id, videos)
+                session.commit()
+                elapsed = time.perf_counter() - started
+                print(
+                    f"{label}: videos={count} added={result.added} updated={result.updated} "
+                    f"seconds={elapsed:.3f} per_video_us={elapsed / count * 1_000_000:.1f}"
+                )
+        engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark store_videos bulk upsert")
+    parser.add_argument("--count", type=int, default=10_000, help="Videos per pass")
+    args = parser.parse_args()
+    run(args.count)
+
+
+if __name__ == "__main__":
+    main()
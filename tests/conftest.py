@@ -3,7 +3,34 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
+import pytest
+
 
 def pytest_configure() -> None:
     db_path = Path.cwd() / ".pytest-kidtube.db"
     os.environ.setdefault("KIDTUBE_DB_PATH", str(db_path))
+    # The shared test DB keeps its quota ledger between runs; only quota tests enforce it.
+    os.environ.setdefault("YOUTUBE_DAILY_QUOTA", "0")
+
+
+@pytest.fixture(autouse=True)
+def _clear_process_caches() -> None:
+    from app.services import (
+        dashboard_cache,
+        heartbeat_dedup,
+        kid_events,
+        policy_cache,
+        search_cache,
+        watch_buffer,
+        youtube_cache,
+        youtube_quota,
+    )
+
+    search_cache.clear()
+    policy_cache.clear()
+    dashboard_cache.clear()
+    watch_buffer.clear()
+    heartbeat_dedup.clear()
+    kid_events.clear()
+    youtube_quota.clear()
+    youtube_cache.clear()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from sqlalchemy import event, text
+from sqlmodel import Session, create_engine
+
+from app.db.migrate import run_migrations
+from app.services.access_status import resolve_access_statuses
+
+
+def test_resolve_access_statuses_uses_two_queries(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'access.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+    with Session(engine) as session:
+        session.execute(text("INSERT INTO kids(name) VALUES ('Ava'), ('Ben')"))
+        session.execute(
+            text(
+                """
+                INSERT INTO channels(youtube_id, allowed, blocked, enabled, resolve_status)
+                VALUES
+                    ('UCallowed', 1, 0, 1, 'ok'),
+                    ('UCblocked', 1, 1, 1, 'ok'),
+                    ('UCdisabled', 1, 0, 0, 'ok')
+                """
+            )
+        )
+        session.execute(
+            text(
+                """
+                INSERT INTO requests(type, youtube_id, kid_id, status)
+                VALUES
+                    ('video', 'vidpending1', 1, 'pending'),
+                    ('channel', 'UCrequested', 1, 'pending'),
+                    ('video', 'viddenied01', 1, 'denied'),
+                    ('video', 'vidotherkid', 2, 'pending')
+                """
+            )
+        )
+        session.commit()
+
+        items = [
+            {"video_id": "vidallowed1", "channel_id": "UCallowed"},
+            {"video_id": "vidblocked1", "channel_id": "UCblocked"},
+            {"video_id": "vidpending1", "channel_id": "UCdisabled"},
+            {"video_id": "vidchannel1", "channel_id": "UCrequested"},
+            {"video_id": "viddenied01", "channel_id": "UCunknown"},
+            {"video_id": "vidotherkid", "channel_id": None},
+        ] + [{"video_id": f"vidfiller{i:02d}", "channel_id": "UCallowed"} for i in range(6)]
+
+        statements: list[str] = []
+
+        def count(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            statuses = resolve_access_statuses(session, 1, items)
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+    assert statuses[:6] == [
+        "allowed",
+        "needs_request",
+        "pending",
+        "pending",
+        "needs_request",
+        "needs_request",
+    ]
+    assert statuses[6:] == ["allowed"] * 6
+    assert len(statements) == 2
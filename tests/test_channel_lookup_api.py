@@ -38,7 +38,7 @@ def test_channel_lookup_known_handle_returns_preview(monkeypatch) -> None:
         }
 
     async def fake_fetch_latest_videos(
-        _channel_id: str, max_results: int = 10
+        _channel_id: str, max_results: int = 10, uploads_playlist_id: str | None = None
     ) -> list[dict[str, str]]:
         assert max_results == 6
         return [
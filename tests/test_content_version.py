@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from sqlmodel import Session, create_engine
+
+from app.db.migrate import run_migrations
+from app.db.session import get_session
+from app.main import app
+
+
+def test_listings_answer_if_none_match_until_content_changes(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("app.main.settings.sync_enabled", False)
+    engine = create_engine(f"sqlite:///{tmp_path / 'content-version.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+    now = datetime.now(timezone.utc)  # noqa: UP017
+    with Session(engine) as session:
+        session.execute(text("INSERT INTO kids(name) VALUES ('Ava')"))
+        session.execute(text("INSERT INTO kids(name, daily_limit_minutes) VALUES ('Ben', 1)"))
+        session.execute(
+            text(
+                "INSERT INTO channels(youtube_id, title, allowed, blocked, enabled, "
+                "resolve_status) VALUES ('UCetag', 'Etag', 1, 0, 1, 'ok')"
+            )
+        )
+        session.execute(
+            text(
+                "INSERT INTO videos(youtube_id, channel_id, title, thumbnail_url, published_at) "
+                "VALUES ('vid-etag-01', 1, 'Planets', 'x', :now)"
+            ),
+            {"now": now.isoformat()},
+        )
+        session.execute(
+            text(
+                "INSERT INTO watch_log(kid_id, video_id, seconds_watched, started_at, created_at) "
+                "VALUES (2, 1, 120, :now, :now)"
+            ),
+            {"now": now.isoformat()},
+        )
+        session.commit()
+
+    statements: list[str] = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda _conn, _cursor, statement, *_args: statements.append(statement),
+    )
+
+    def get_test_session():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_test_session
+    try:
+        with TestClient(app) as client:
+            first = {
+                path: client.get(path)
+                for path in (
+                    "/api/feed",
+                    "/api/feed/latest-per-channel",
+                    "/api/feed/shorts",
+                    "/api/channels/allowed",
+                    "/api/categories",
+                )
+            }
+            statements.clear()
+            revalidated = {
+                path: client.get(path, headers={"If-None-Match": response.headers["etag"]})
+                for path, response in first.items()
+            }
+            queries_for_304s = len(statements)
+
+            kid_feed = client.get("/api/feed", params={"kid_id": 1})
+            kid_cached = client.get(
+                "/api/feed",
+                params={"kid_id": 1},
+                headers={"If-None-Match": kid_feed.headers["etag"]},
+            )
+            # Ben is over the daily limit, so a stale tag must not turn into a 304.
+            limited_kid = client.get(
+                "/api/feed",
+                params={"kid_id": 2},
+                headers={"If-None-Match": kid_feed.headers["etag"]},
+            )
+
+            client.patch("/api/channels/1", json={"category": "science"})
+            after_edit = client.get(
+                "/api/channels/allowed",
+                headers={"If-None-Match": first["/api/channels/allowed"].headers["etag"]},
+            )
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+
+    for path, response in first.items():
+        assert response.status_code == 200, path
+        assert response.headers["etag"].startswith('W/"')
+        assert response.headers["cache-control"] == "no-cache"
+        assert revalidated[path].status_code == 304, path
+        assert revalidated[path].content == b""
+    assert queries_for_304s == 0
+
+    assert [item["video_title"] for item in kid_feed.json()] == ["Planets"]
+    assert kid_cached.status_code == 304
+    assert limited_kid.status_code == 200
+    assert limited_kid.json() == []
+    assert "etag" not in limited_kid.headers
+
+    assert after_edit.status_code == 200
+    assert after_edit.json()[0]["category"] == "science"
+    assert after_edit.headers["etag"] != first["/api/channels/allowed"].headers["etag"]
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+
+from app.db.migrate import run_migrations
+from app.db.session import get_session
+from app.main import app
+from app.services import watch_buffer
+from app.services.limits import remaining_seconds_for
+from app.tools.rebuild_daily_usage import rebuild_daily_usage
+
+
+def _usage(db_path: Path) -> list[tuple[int, str, int | None, int]]:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            "SELECT kid_id, day, category_id, seconds FROM kid_daily_usage "
+            "ORDER BY day, category_id"
+        ).fetchall()
+
+
+def test_watch_log_inserts_maintain_daily_usage(tmp_path: Path) -> None:
+    db_path = tmp_path / "daily-usage.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    run_migrations(engine, Path("app/db/migrations"))
+    today = datetime.now(timezone.utc).date().isoformat()  # noqa: UP017
+    with Session(engine) as session:
+        session.execute(text("INSERT INTO categories(name, enabled) VALUES ('Education', 1)"))
+        session.execute(text("INSERT INTO kids(name, daily_limit_minutes) VALUES ('Ava', 5)"))
+        session.execute(
+            text(
+                "INSERT INTO channels(youtube_id, category_id, allowed, blocked, enabled, "
+                "resolve_status) VALUES ('UCusage', 1, 1, 0, 1, 'ok')"
+            )
+        )
+        session.execute(
+            text(
+                "INSERT INTO videos(youtube_id, channel_id, title, thumbnail_url, published_at) "
+                "VALUES ('vid-usage-1', 1, 'Counting', 'x', '2024-01-01'), "
+                "('vid-usage-2', 1, 'Planets', 'x', '2024-01-01')"
+            )
+        )
+        for seconds, started_at in (
+            (30, "2024-06-03T10:00:00+00:00"),
+            (15, "2024-06-03T23:30:00-05:00"),
+            (45, "2024-06-02 08:00:00.000000"),
+        ):
+            session.execute(
+                text(
+                    "INSERT INTO watch_log(kid_id, video_id, seconds_watched, category_id, "
+                    "started_at, created_at) VALUES (1, 1, :seconds, NULL, :started, :started)"
+                ),
+                {"seconds": seconds, "started": started_at},
+            )
+        session.commit()
+
+    def get_test_session():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_test_session
+    try:
+        with TestClient(app) as client:
+            logged = client.post(
+                "/api/playback/log",
+                json={"kid_id": 1, "youtube_id": "vid-usage-1", "seconds_watched": 40},
+            )
+            heartbeat = client.post(
+                "/api/playback/watch/log",
+                json={"kid_id": 1, "video_id": "vid-usage-2", "seconds_delta": 20},
+            )
+            # Heartbeats are written behind; stats read the table once they are flushed.
+            watch_buffer.flush()
+            stats = client.get("/api/stats", params={"kid_id": 1})
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+
+    assert logged.status_code == 200
+    assert heartbeat.status_code == 200
+    maintained = _usage(db_path)
+    assert maintained == [
+        (1, "2024-06-02", None, 45),
+        (1, "2024-06-03", None, 30),
+        (1, "2024-06-04", None, 15),
+        (1, today, 1, 60),
+    ]
+    assert stats.json()["today_seconds"] == 60
+    assert stats.json()["lifetime_seconds"] == 150
+
+    with Session(engine) as session:
+        remaining = remaining_seconds_for(
+            session, 1, None, datetime(2024, 6, 3, 18, 0, tzinfo=timezone.utc)  # noqa: UP017
+        )
+    assert remaining == 300 - 30
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DELETE FROM kid_daily_usage")
+        conn.commit()
+        rows = rebuild_daily_usage(conn)
+    assert rows == 4
+    assert _usage(db_path) == maintained
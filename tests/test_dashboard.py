@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+
+from app.db.migrate import run_migrations
+from app.db.session import get_session
+from app.main import app
+from app.services.dashboard_cache import dashboard_cache_metrics
+
+
+def test_dashboard_bundle_is_cached_and_gated_per_kid(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("app.main.settings.sync_enabled", False)
+    engine = create_engine(f"sqlite:///{tmp_path / 'dashboard.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+    now = datetime.now(timezone.utc)  # noqa: UP017
+    with Session(engine) as session:
+        session.execute(text("INSERT INTO kids(name) VALUES ('Ava')"))
+        session.execute(text("UPDATE parent_settings SET blocked_words = 'zombie'"))
+        session.execute(
+            text(
+                "INSERT INTO channels(youtube_id, title, allowed, blocked, enabled, "
+                "resolve_status) VALUES ('UCdash', 'Dash', 1, 0, 1, 'ok')"
+            )
+        )
+        for index, (title, is_short) in enumerate(
+            (("Zombie dance", 0), ("Planets", 0), ("Quick trick", 1))
+        ):
+            session.execute(
+                text(
+                    "INSERT INTO videos(youtube_id, channel_id, title, thumbnail_url, "
+                    "published_at, is_short) VALUES (:youtube_id, 1, :title, 'x', :published, "
+                    ":is_short)"
+                ),
+                {
+                    "youtube_id": f"vid-dash-0{index}",
+                    "title": title,
+                    "published": (now - timedelta(hours=index)).isoformat(),
+                    "is_short": is_short,
+                },
+            )
+        session.commit()
+
+    def get_test_session():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_test_session
+    try:
+        with TestClient(app) as client:
+            anonymous = client.get("/api/dashboard")
+            client.post("/api/session/kid", json={"kid_id": 1})
+            kid = client.get("/api/dashboard")
+            shorts_feed = client.get("/api/feed/shorts", params={"kid_id": 1})
+            client.put("/api/settings/shorts", json={"enabled": False})
+            shorts_off = client.get("/api/dashboard")
+            shorts_feed_off = client.get("/api/feed/shorts", params={"kid_id": 1})
+            cached_metrics = dashboard_cache_metrics()
+            client.patch("/api/categories/2", json={"enabled": False})
+            after_edit = client.get("/api/dashboard")
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+
+    assert anonymous.json()["kid_id"] is None
+    assert [item["video_title"] for item in anonymous.json()["latest_per_channel"]] == [
+        "Zombie dance"
+    ]
+
+    payload = kid.json()
+    assert payload["kid_id"] == 1
+    assert [category["name"] for category in payload["categories"]] == ["education", "fun"]
+    assert [channel["youtube_id"] for channel in payload["allowed_channels"]] == ["UCdash"]
+    # The blocked newest video is dropped, not replaced by the channel's next one.
+    assert payload["latest_per_channel"] == []
+    assert [item["video_title"] for item in payload["shorts"]] == ["Quick trick"]
+
+    assert [item["video_title"] for item in shorts_feed.json()] == ["Quick trick"]
+
+    # The shorts feed follows the same switch as the bundle.
+    assert shorts_off.json()["shorts"] == []
+    assert shorts_feed_off.json() == []
+    assert cached_metrics["misses"] == 1
+    assert cached_metrics["hits"] == 2
+
+    assert [category["name"] for category in after_edit.json()["categories"]] == ["education"]
+    assert dashboard_cache_metrics()["misses"] == 2
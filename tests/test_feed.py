@@ -8,6 +8,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy import text
 from sqlmodel import Session, create_engine
 
+from app.api.routes_feed import LATEST_PER_CHANNEL_SQL
 from app.db.migrate import run_migrations
 from app.db.models import Channel, Video
 from app.db.session import get_session
@@ -470,3 +471,231 @@ def test_feed_returns_empty_when_kid_outside_schedule_window(monkeypatch, tmp_pa
 
     assert response.status_code == 200
     assert response.json() == []
+
+
+def test_feed_and_channel_videos_page_with_keyset_cursor(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'feed-cursor.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+
+    with Session(engine) as session:
+        session.execute(
+            text(
+                "INSERT INTO channels(youtube_id, title, allowed, blocked, enabled, "
+                "resolve_status) VALUES ('UCcursor', 'Cursor', 1, 0, 1, 'ok')"
+            )
+        )
+        for index in range(7):
+            session.execute(
+                text(
+                    "INSERT INTO videos(youtube_id, channel_id, title, thumbnail_url, "
+                    "published_at, is_short) VALUES (:yt, 1, :title, 'x', :published, 0)"
+                ),
+                {
+                    "yt": f"vid-cursor-{index}",
+                    "title": f"Video {index}",
+                    # Pairs of videos share a timestamp so ties are split by id.
+                    "published": f"2024-01-0{index // 2 + 1}T00:00:00+00:00",
+                },
+            )
+        session.commit()
+        plan = " ".join(
+            str(row[-1])
+            for row in session.execute(
+                text(
+                    "EXPLAIN QUERY PLAN SELECT video_id FROM feed_items f "
+                    "WHERE video_is_short = 0 "
+                    "AND (f.video_published_at, f.video_id) < ('2024-01-03', 5) "
+                    "ORDER BY video_published_at DESC, video_id DESC"
+                )
+            )
+        )
+
+    def collect(path: str) -> tuple[list[str], int]:
+        seen: list[str] = []
+        pages = 0
+        cursor: str | None = None
+        while True:
+            params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+            response = client.get(path, params=params)
+            assert response.status_code == 200
+            seen.extend(item["video_youtube_id"] for item in response.json())
+            pages += 1
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                return seen, pages
+
+    try:
+        with _test_client_for_engine(engine) as client:
+            feed, feed_pages = collect("/api/feed")
+            channel, channel_pages = collect("/api/channels/UCcursor/videos")
+            channel_row = client.get("/api/channels/UCcursor/videos", params={"limit": 1}).json()
+            invalid = client.get("/api/feed", params={"cursor": "not-a-cursor"})
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+
+    expected = [f"vid-cursor-{index}" for index in (6, 5, 4, 3, 2, 1, 0)]
+    assert feed == expected
+    assert channel == expected
+    assert feed_pages == channel_pages == 3
+    assert "video_id" not in channel_row[0]
+    assert invalid.status_code == 400
+    assert "idx_feed_items_short_published" in plan
+
+
+def test_feed_items_track_video_channel_and_category_changes(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'feed-items.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+
+    def feed_items(session: Session) -> list[tuple]:
+        return session.execute(
+            text("SELECT * FROM feed_items ORDER BY video_id")
+        ).all()
+
+    def eligible(session: Session) -> list[tuple]:
+        return session.execute(
+            text("SELECT * FROM eligible_feed_items ORDER BY video_id")
+        ).all()
+
+    with Session(engine) as session:
+        # Category 1 is the seeded 'education' category.
+        session.execute(
+            text(
+                "INSERT INTO channels(youtube_id, title, category_id, allowed, blocked, enabled, "
+                "resolve_status) VALUES ('UCitems1', 'One', 1, 1, 0, 1, 'ok'), "
+                "('UCitems2', 'Two', NULL, 0, 0, 1, 'ok')"
+            )
+        )
+        for index in range(4):
+            session.execute(
+                text(
+                    "INSERT INTO videos(youtube_id, channel_id, title, thumbnail_url, "
+                    "published_at, is_short) VALUES (:yt, :channel, :title, 'x', :published, 0)"
+                ),
+                {
+                    "yt": f"vid-items-{index}",
+                    "channel": index % 2 + 1,
+                    "title": f"Video {index}",
+                    "published": f"2024-02-0{index + 1}T00:00:00+00:00",
+                },
+            )
+        session.commit()
+        assert [row.video_youtube_id for row in feed_items(session)] == [
+            "vid-items-0",
+            "vid-items-2",
+        ]
+
+        session.execute(text("UPDATE channels SET allowed = 1, category = 'fun' WHERE id = 2"))
+        session.execute(text("UPDATE videos SET title = 'Renamed', is_short = 1 WHERE id = 1"))
+        session.execute(text("UPDATE categories SET name = 'Nature' WHERE id = 1"))
+        session.commit()
+        assert len(feed_items(session)) == 4
+        assert feed_items(session) == eligible(session)
+
+        session.execute(text("UPDATE categories SET enabled = 0 WHERE id = 1"))
+        session.execute(text("DELETE FROM videos WHERE id = 4"))
+        session.commit()
+        assert [row.video_youtube_id for row in feed_items(session)] == ["vid-items-1"]
+        assert feed_items(session) == eligible(session)
+
+    try:
+        with _test_client_for_engine(engine) as client:
+            fun = client.get("/api/feed", params={"category": "fun"}).json()
+            client.patch("/api/channels/2", json={"blocked": True})
+            after_block = client.get("/api/feed").json()
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+
+    assert [item["video_youtube_id"] for item in fun] == ["vid-items-1"]
+    assert after_block == []
+    with Session(engine) as session:
+        assert feed_items(session) == eligible(session) == []
+
+
+def test_latest_per_channel_reads_the_channel_pointer(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'latest-plan.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+
+    with engine.connect() as conn:
+        plan = [
+            row[3]
+            for row in conn.execute(text(f"EXPLAIN QUERY PLAN {LATEST_PER_CHANNEL_SQL}"))
+        ]
+
+    # No per-channel seek and no scan of feed_items: one primary key lookup per channel.
+    assert not any(step.startswith("SCAN f") for step in plan), plan
+    assert "SEARCH f USING INTEGER PRIMARY KEY (rowid=?)" in plan
+    assert not any("idx_feed_items_channel_published" in step for step in plan), plan
+
+
+def test_channel_latest_video_follows_feed_changes(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'latest-pointer.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+
+    def pointers(session: Session) -> dict[int, int | None]:
+        return dict(
+            session.execute(text("SELECT id, latest_video_id FROM channels ORDER BY id")).all()
+        )
+
+    def seeks(session: Session) -> dict[int, int | None]:
+        return dict(
+            session.execute(
+                text(
+                    """
+                    SELECT c.id, (
+                        SELECT f.video_id FROM feed_items f
+                        WHERE f.channel_id = c.id AND f.video_is_short = 0
+                        ORDER BY f.video_published_at DESC, f.video_id DESC
+                        LIMIT 1
+                    )
+                    FROM channels c
+                    ORDER BY c.id
+                    """
+                )
+            ).all()
+        )
+
+    with Session(engine) as session:
+        session.execute(
+            text(
+                "INSERT INTO channels(youtube_id, title, category_id, allowed, blocked, enabled, "
+                "resolve_status) VALUES ('UCptr1', 'One', 1, 1, 0, 1, 'ok'), "
+                "('UCptr2', 'Two', NULL, 1, 0, 1, 'ok')"
+            )
+        )
+        # Published out of id order, with a tie on channel 1 that the id breaks.
+        for youtube_id, channel, day in (
+            ("vid-ptr-a", 1, 3),
+            ("vid-ptr-b", 1, 5),
+            ("vid-ptr-c", 1, 2),
+            ("vid-ptr-d", 2, 4),
+            ("vid-ptr-e", 1, 5),
+        ):
+            session.execute(
+                text(
+                    "INSERT INTO videos(youtube_id, channel_id, title, thumbnail_url, "
+                    "published_at, is_short) VALUES (:yt, :channel, 'x', 'x', :published, 0)"
+                ),
+                {"yt": youtube_id, "channel": channel, "published": f"2024-03-0{day}"},
+            )
+        session.commit()
+        assert pointers(session) == {1: 5, 2: 4}
+
+        steps = [
+            "UPDATE videos SET is_short = 1 WHERE id = 5",
+            "UPDATE videos SET published_at = '2024-03-01' WHERE id = 2",
+            "DELETE FROM videos WHERE id = 1",
+            "UPDATE channels SET blocked = 1 WHERE id = 2",
+            "UPDATE categories SET enabled = 0 WHERE id = 1",
+            "UPDATE categories SET enabled = 1 WHERE id = 1",
+            "UPDATE channels SET blocked = 0 WHERE id = 2",
+            "UPDATE videos SET is_short = 0 WHERE id = 5",
+        ]
+        for statement in steps:
+            session.execute(text(statement))
+            session.commit()
+            assert pointers(session) == seeks(session), statement
+        assert pointers(session) == {1: 5, 2: 4}
+
+        session.execute(text("UPDATE channels SET allowed = 0 WHERE id = 1"))
+        session.commit()
+        assert pointers(session) == {1: None, 2: 4}
@@ -23,5 +23,12 @@ def test_system_details() -> None:
         response = client.get("/api/system")
     assert response.status_code == 200
     payload = response.json()
-    expected = {"db_path", "db_exists", "db_size_bytes", "uptime_seconds", "app_version"}
+    expected = {
+        "db_path",
+        "db_exists",
+        "db_size_bytes",
+        "uptime_seconds",
+        "app_version",
+        "youtube_cache",
+    }
     assert expected.issubset(payload)
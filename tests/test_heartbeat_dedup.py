@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlmodel import Session, create_engine
+
+from app.services import heartbeat_dedup
+
+
+def test_dedup_answers_from_memory_once_past_startup(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("app.services.heartbeat_dedup.settings.heartbeat_dedup_max_entries", 2)
+    engine = create_engine(f"sqlite:///{tmp_path / 'dedup.db'}")
+    db_reads: list[tuple[int, int]] = []
+    db_last_seen: dict[tuple[int, int], datetime] = {}
+    booted = datetime.now(timezone.utc)  # noqa: UP017
+
+    def admit(session: Session, kid_id: int, video_id: int, at: datetime) -> bool:
+        def load() -> datetime | None:
+            db_reads.append((kid_id, video_id))
+            return db_last_seen.get((kid_id, video_id))
+
+        return heartbeat_dedup.admit(session, kid_id, video_id, at, load)
+
+    with Session(engine) as session:
+        # Right after startup the map is empty, so a heartbeat logged before the restart
+        # still suppresses.
+        db_last_seen[(1, 7)] = booted - timedelta(seconds=2)
+        assert admit(session, 1, 7, booted) is False
+        assert db_reads == [(1, 7)]
+
+        later = booted + timedelta(minutes=5)
+        assert admit(session, 1, 7, later) is True
+        assert admit(session, 1, 7, later + timedelta(seconds=3)) is False
+        assert admit(session, 1, 7, later + timedelta(seconds=12)) is True
+        assert admit(session, 2, 7, later + timedelta(seconds=13)) is True
+        assert db_reads == [(1, 7)]
+
+        # A third pair overflows the cap while (1, 7) is still inside its window, so the
+        # next miss inside that window must ask the DB again.
+        assert admit(session, 3, 7, later + timedelta(seconds=14)) is True
+        db_last_seen[(1, 7)] = later + timedelta(seconds=12)
+        assert admit(session, 1, 7, later + timedelta(seconds=15)) is False
+        assert db_reads == [(1, 7), (1, 7)]
+
+        # Once every entry has aged out, misses are answered without the DB.
+        assert admit(session, 1, 7, later + timedelta(minutes=1)) is True
+        assert db_reads == [(1, 7), (1, 7)]
+
+    metrics = heartbeat_dedup.heartbeat_dedup_metrics()
+    assert metrics["accepted"] == 5
+    assert metrics["suppressed"] == 3
+    assert metrics["db_fallbacks"] == 2
+    assert metrics["entries"] == 1
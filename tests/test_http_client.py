@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.http_client import (
+    close_http_client,
+    get_http_client,
+    http_pool_metrics,
+    start_http_client,
+)
+from app.main import app
+from app.services.youtube import fetch_channel_metadata
+
+CHANNEL_ID = "UC1234567890123456789012"
+
+
+def test_youtube_calls_use_shared_client(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "youtube_api_key", "test-key")
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, json={"items": [{"id": CHANNEL_ID, "snippet": {"title": "A"}}]})
+
+    async def run() -> tuple[dict, dict]:
+        await start_http_client(transport=httpx.MockTransport(handler))
+        try:
+            metadata = await fetch_channel_metadata(CHANNEL_ID)
+            return metadata, http_pool_metrics()
+        finally:
+            await close_http_client()
+
+    before = http_pool_metrics()["requests_total"]
+    metadata, metrics = asyncio.run(run())
+
+    assert metadata["title"] == "A"
+    assert seen == ["/youtube/v3/channels"]
+    assert metrics["active"] is True
+    assert metrics["requests_total"] == before + 1
+    assert get_http_client() is None
+
+
+def test_lifespan_manages_shared_client_and_reports_pool() -> None:
+    with TestClient(app) as client:
+        assert get_http_client() is not None
+        response = client.get("/api/system")
+
+    assert get_http_client() is None
+    pool = response.json()["http_pool"]
+    assert pool["active"] is True
+    assert {"connections_open", "connections_reused", "requests_waiting"}.issubset(pool)
@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from fastapi.testclient import TestClient
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlmodel import Session, create_engine
 
 from app.db.migrate import run_migrations
@@ -13,10 +13,12 @@ from app.db.session import get_session
 from app.main import app
 from app.services.limits import (
     ACCESS_REASON_BLOCKED_CHANNEL,
+    ACCESS_REASON_CATEGORY_LIMIT,
     ACCESS_REASON_DAILY_LIMIT,
     ACCESS_REASON_PENDING_APPROVAL,
     ACCESS_REASON_SCHEDULE,
     ACCESS_REASON_SHORTS_DISABLED,
+    ACCESS_REASON_WORD_FILTER,
     check_access,
 )
 
@@ -247,3 +249,63 @@ def test_approvals_endpoints_and_heartbeat(tmp_path: Path) -> None:
 
     assert int(channel_allowed) == 1
     assert int(log_count) == 1
+
+
+def test_check_access_loads_policy_in_one_query(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'phase1-snapshot.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+
+    now = datetime(2024, 6, 3, 12, 0, tzinfo=timezone.utc)  # noqa: UP017
+    with Session(engine) as session:
+        session.execute(text("INSERT INTO categories(name, enabled) VALUES ('Education', 1)"))
+        session.execute(text("INSERT INTO kids(name, daily_limit_minutes) VALUES ('A', 120)"))
+        session.execute(
+            text(
+                "INSERT INTO kid_category_limits(kid_id, category_id, daily_limit_minutes) "
+                "VALUES (1, 1, 2)"
+            )
+        )
+        session.execute(
+            text("INSERT INTO kid_bonus_time(kid_id, minutes, expires_at) VALUES (1, 1, NULL)")
+        )
+        session.execute(text("UPDATE parent_settings SET blocked_words = ' Scary , ,zombie'"))
+        session.execute(
+            text(
+                "INSERT INTO channels(youtube_id, category_id, allowed, blocked, enabled, "
+                "resolve_status) VALUES ('UCSNAP', 1, 1, 0, 1, 'ok')"
+            )
+        )
+        for youtube_id, title in (("vid-snap-01", "Zombie dance"), ("vid-snap-02", "Planets")):
+            session.execute(
+                text(
+                    "INSERT INTO videos(youtube_id, channel_id, title, thumbnail_url, "
+                    "published_at) VALUES (:youtube_id, 1, :title, 'x', '2024-01-01')"
+                ),
+                {"youtube_id": youtube_id, "title": title},
+            )
+        session.commit()
+
+        statements: list[str] = []
+
+        def count(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            word = check_access(session, 1, video_id="vid-snap-01", now=now)
+            allowed = check_access(session, 1, video_id="vid-snap-02", now=now)
+            session.execute(
+                text(
+                    "INSERT INTO watch_log(kid_id, video_id, seconds_watched, category_id, "
+                    "started_at, created_at) VALUES (1, 2, 200, 1, :now, :now)"
+                ),
+                {"now": now.isoformat()},
+            )
+            limited = check_access(session, 1, video_id="vid-snap-02", now=now)
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+    assert word == (False, ACCESS_REASON_WORD_FILTER, {"word": "zombie"})
+    assert allowed == (True, None, {})
+    assert limited == (False, ACCESS_REASON_CATEGORY_LIMIT, {"remaining_seconds": -20})
+    assert len(statements) == 4
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from sqlmodel import Session, create_engine
+
+from app.db.migrate import run_migrations
+from app.db.session import get_session
+from app.main import app
+from app.services import kid_events, policy_cache
+from app.services.limits import (
+    ACCESS_REASON_CATEGORY_LIMIT,
+    ACCESS_REASON_SCHEDULE,
+    ACCESS_REASON_SHORTS_DISABLED,
+    assert_schedule_allowed,
+    check_access,
+)
+
+
+def test_policy_cache_is_invalidated_by_mutating_routes(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'policy-cache.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+    now = datetime(2024, 6, 3, 12, 0, tzinfo=timezone.utc)  # noqa: UP017
+    with Session(engine) as session:
+        session.execute(text("INSERT INTO categories(name, enabled) VALUES ('Education', 1)"))
+        session.execute(text("INSERT INTO kids(name) VALUES ('Ava')"))
+        session.execute(
+            text(
+                "INSERT INTO watch_log(kid_id, video_id, seconds_watched, category_id, "
+                "started_at, created_at) VALUES (1, 1, 120, 1, :now, :now)"
+            ),
+            {"now": now.isoformat()},
+        )
+        session.commit()
+
+    def get_test_session():
+        with Session(engine) as session:
+            yield session
+
+    def access(**kwargs) -> tuple[bool, str | None, dict[str, object]]:  # type: ignore[no-untyped-def]
+        with Session(engine) as session:
+            return check_access(session, 1, **{"now": now, **kwargs})
+
+    app.dependency_overrides[get_session] = get_test_session
+    try:
+        with TestClient(app) as client:
+            before = access(category_id=1)
+            cached = access(category_id=1)
+            client.put("/api/kids/1/category-limits/1", json={"daily_limit_minutes": 1})
+            limited = access(category_id=1)
+            client.post(
+                "/api/kids/1/schedules",
+                json={"day_of_week": 0, "start_time": "07:00", "end_time": "08:00"},
+            )
+            scheduled = access()
+            shorts_allowed = access(is_shorts=True, now=datetime(2024, 6, 3, 7, 30))
+            seen_events = kid_events.version(1)
+            client.put("/api/settings/shorts", json={"enabled": False})
+            shorts_blocked = access(is_shorts=True, now=datetime(2024, 6, 3, 7, 30))
+            system = client.get("/api/system")
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+
+    assert before == cached == (True, None, {})
+    assert limited == (False, ACCESS_REASON_CATEGORY_LIMIT, {"remaining_seconds": -60})
+    assert scheduled == (False, ACCESS_REASON_SCHEDULE, {})
+    assert shorts_allowed == (True, None, {})
+    assert shorts_blocked == (False, ACCESS_REASON_SHORTS_DISABLED, {})
+    assert kid_events.version(1) != seen_events
+    metrics = system.json()["policy_cache"]
+    assert metrics["invalidations"] == 3
+    assert metrics["hits"] >= 1
+
+
+def test_policy_cache_drops_values_loaded_before_an_invalidation() -> None:
+    loaded_version = policy_cache.version(7)
+    policy_cache.invalidate_kid(7)
+    policy_cache.put(7, loaded_version, "stale")
+    assert policy_cache.get(7) is None
+
+    policy_cache.put(7, policy_cache.version(7), "fresh")
+    generation = policy_cache.version(7)
+    policy_cache.invalidate_all()
+    policy_cache.put(7, generation, "stale")
+    assert policy_cache.get(7) is None
+
+
+def test_schedule_checks_load_only_the_kid_policy(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'schedule-only.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+    now = datetime(2024, 6, 3, 12, 0, tzinfo=timezone.utc)  # noqa: UP017
+    statements: list[str] = []
+
+    def count(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+        statements.append(statement)
+
+    with Session(engine) as session:
+        session.execute(text("INSERT INTO kids(name) VALUES ('Ava')"))
+        session.commit()
+
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            assert_schedule_allowed(session, 1, now)
+            first = list(statements)
+            assert_schedule_allowed(session, 1, now)
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+    assert len(first) == 1
+    assert "kid_daily_usage" not in first[0] and "kid_bonus_time" not in first[0]
+    assert statements == first
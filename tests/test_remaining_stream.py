@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+
+from app.api.routes_playback import remaining_time_events
+from app.db.migrate import run_migrations
+from app.db.session import get_session
+from app.main import app
+
+
+def _next_state(events) -> dict[str, object]:  # type: ignore[no-untyped-def]
+    async def read() -> dict[str, object]:
+        while True:
+            chunk = await events.__anext__()
+            if chunk.startswith("event: remaining"):
+                return json.loads(chunk.split("data: ", 1)[1])
+
+    return asyncio.wait_for(read(), timeout=5)  # type: ignore[return-value]
+
+
+def test_bonus_grant_is_pushed_to_an_open_stream(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("app.main.settings.sync_enabled", False)
+    engine = create_engine(f"sqlite:///{tmp_path / 'stream.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+    with Session(engine) as session:
+        session.execute(text("INSERT INTO kids(name, daily_limit_minutes) VALUES ('Ava', 10)"))
+        session.commit()
+
+    def get_test_session():
+        with Session(engine) as session:
+            yield session
+
+    async def never_disconnected() -> bool:
+        return False
+
+    async def scenario(client: TestClient) -> tuple[dict[str, object], dict[str, object]]:
+        events = remaining_time_events(engine, 1, None, never_disconnected)
+        try:
+            first = await _next_state(events)
+            response = await asyncio.to_thread(
+                client.post, "/api/kids/1/bonus-time", json={"minutes": 15}
+            )
+            assert response.status_code == 201
+            second = await _next_state(events)
+        finally:
+            await events.aclose()
+        return first, second
+
+    app.dependency_overrides[get_session] = get_test_session
+    try:
+        with TestClient(app) as client:
+            missing = client.get("/api/playback/stream", params={"kid_id": 99})
+            first, second = asyncio.run(scenario(client))
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+
+    assert missing.status_code == 404
+    assert first["allowed"] is True
+    assert first["remaining_seconds"] == 600
+    assert first["bonus_seconds"] == 0
+    # The grant wakes the stream; it does not wait for the next minute-boundary re-check.
+    assert second["remaining_seconds"] == 600 + 15 * 60
+    assert second["bonus_seconds"] == 15 * 60
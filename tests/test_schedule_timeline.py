@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+
+from app.db.migrate import run_migrations
+from app.db.session import get_session
+from app.main import app
+from app.services.schedule_timeline import (
+    compile_timeline,
+    is_within_window,
+    time_to_minutes,
+)
+
+MONDAY = datetime(2024, 6, 3, tzinfo=timezone.utc)  # noqa: UP017
+
+
+def _per_minute_state(
+    schedules: list[tuple[int, str, str]], bedtime: tuple[str, str] | None, now: datetime
+) -> tuple[bool, bool]:
+    # The per-request evaluation the timeline replaces.
+    now_minutes = (now.hour * 60) + now.minute
+    rows = [
+        (start, end)
+        for day, start, end in schedules
+        if day in (now.weekday(), (now.weekday() + 1) % 7)
+    ]
+    in_schedule = not rows
+    for start, end in rows:
+        try:
+            if is_within_window(now_minutes, time_to_minutes(start), time_to_minutes(end)):
+                in_schedule = True
+        except ValueError:
+            continue
+    in_bedtime = False
+    if bedtime is not None:
+        try:
+            in_bedtime = is_within_window(
+                now_minutes, time_to_minutes(bedtime[0]), time_to_minutes(bedtime[1])
+            )
+        except ValueError:
+            in_bedtime = False
+    return in_schedule, in_bedtime
+
+
+def _random_time(rng: random.Random) -> str:
+    return f"{rng.randrange(24):02d}:{rng.randrange(60):02d}"
+
+
+def test_timeline_matches_per_minute_evaluation() -> None:
+    rng = random.Random(20240603)
+    cases: list[tuple[list[tuple[int, str, str]], tuple[str, str] | None]] = [
+        ([], None),
+        ([], ("21:00", "07:00")),
+        ([(6, "09:00", "10:00")], None),
+        ([(2, "bad", "10:00")], ("20:00", "06:30")),
+        ([(0, "22:00", "02:00"), (0, "08:00", "09:00")], ("00:00", "23:59")),
+    ]
+    for _ in range(6):
+        schedules = [
+            (rng.randrange(7), _random_time(rng), _random_time(rng))
+            for _ in range(rng.randrange(1, 6))
+        ]
+        cases.append((schedules, (_random_time(rng), _random_time(rng))))
+
+    for schedules, bedtime in cases:
+        timeline = compile_timeline(schedules, *(bedtime or (None, None)))
+        states = []
+        for minute in range(7 * 24 * 60):
+            now = MONDAY + timedelta(minutes=minute)
+            segment = timeline.segment_at(now)
+            state = _per_minute_state(schedules, bedtime, now)
+            assert (segment.in_schedule, segment.in_bedtime) == state, (schedules, bedtime, now)
+            states.append(state[0] and not state[1])
+
+        for minute in range(0, 7 * 24 * 60, 97):
+            now = MONDAY + timedelta(minutes=minute, seconds=30)
+            expected = None
+            for ahead in range(1, 7 * 24 * 60):
+                if states[(minute + ahead) % len(states)] != states[minute]:
+                    expected = MONDAY + timedelta(minutes=minute + ahead)
+                    break
+            assert timeline.next_change(now) == expected, (schedules, bedtime, now)
+
+
+def test_next_unlock_wraps_past_the_end_of_the_week() -> None:
+    # Day 0 restricts Monday and, in Sunday-first numbering, Sunday as well.
+    timeline = compile_timeline([(0, "08:00", "09:00")], None, None)
+    sunday_evening = datetime(2024, 6, 9, 20, 15, 42, tzinfo=timezone.utc)  # noqa: UP017
+    monday_late = datetime(2024, 6, 10, 9, 1, tzinfo=timezone.utc)  # noqa: UP017
+    saturday = datetime(2024, 6, 8, 12, 0, tzinfo=timezone.utc)  # noqa: UP017
+
+    assert timeline.segment_at(sunday_evening).allowed is False
+    assert timeline.next_change(sunday_evening) == datetime(2024, 6, 10, 8, 0, tzinfo=timezone.utc)  # noqa: UP017
+    assert timeline.segment_at(monday_late).allowed is False
+    assert timeline.next_change(monday_late) == datetime(2024, 6, 11, 0, 0, tzinfo=timezone.utc)  # noqa: UP017
+    assert timeline.segment_at(saturday).allowed is True
+    assert timeline.next_change(saturday) == datetime(2024, 6, 9, 0, 0, tzinfo=timezone.utc)  # noqa: UP017
+
+
+def test_schedule_status_api_follows_bedtime_edits(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("app.main.settings.sync_enabled", False)
+    engine = create_engine(f"sqlite:///{tmp_path / 'schedule-status.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+    with Session(engine) as session:
+        session.execute(text("INSERT INTO kids(name) VALUES ('Ava')"))
+        session.commit()
+
+    def get_test_session():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_test_session
+    try:
+        with TestClient(app) as client:
+            open_all_day = client.get("/api/kids/1/schedule-status")
+            client.patch("/api/kids/1", json={"bedtime_start": "00:00", "bedtime_end": "23:59"})
+            bedtime_all_day = client.get("/api/kids/1/schedule-status")
+            missing = client.get("/api/kids/99/schedule-status")
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+
+    assert open_all_day.json() == {
+        "kid_id": 1,
+        "allowed": True,
+        "reason": None,
+        "next_unlock_at": None,
+        "next_lock_at": None,
+    }
+    assert bedtime_all_day.json() == {
+        "kid_id": 1,
+        "allowed": False,
+        "reason": "bedtime",
+        "next_unlock_at": None,
+        "next_lock_at": None,
+    }
+    assert missing.status_code == 404
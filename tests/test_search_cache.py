@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+
+from app.db.migrate import run_migrations
+from app.db.session import get_session
+from app.main import app
+from app.services import search_cache
+
+
+def test_search_results_are_cached_but_access_status_is_per_kid(
+    tmp_path: Path, monkeypatch
+) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'search-cache.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+    with Session(engine) as session:
+        session.execute(text("INSERT INTO kids(name) VALUES ('Ava'), ('Ben')"))
+        session.execute(
+            text(
+                "INSERT INTO requests(type, youtube_id, kid_id, status) "
+                "VALUES ('channel', 'UCcats', 1, 'pending')"
+            )
+        )
+        session.commit()
+
+    calls: list[str] = []
+
+    async def fake_search_videos(query: str, max_results: int = 12, client=None):
+        del max_results, client
+        calls.append(query)
+        return [
+            {
+                "video_id": "abc123xyz99",
+                "title": "Cats",
+                "channel_id": "UCcats",
+                "channel_title": "CatTV",
+                "thumbnail_url": "https://img",
+                "published_at": "2024-01-01T00:00:00Z",
+                "duration_seconds": 50,
+                "is_short": True,
+            }
+        ]
+
+    def get_test_session():
+        with Session(engine) as session:
+            yield session
+
+    monkeypatch.setattr("app.api.routes_search.search_videos", fake_search_videos)
+    app.dependency_overrides[get_session] = get_test_session
+    try:
+        with TestClient(app) as client:
+            first = client.get("/api/search", params={"q": "Cats ", "kid_id": 1})
+            second = client.get("/api/search", params={"q": "  cats", "kid_id": 2})
+            stats = client.get("/api/stats")
+            search_cache.clear()
+            from_disk = client.get("/api/search", params={"q": "CATS", "kid_id": 2})
+            logs = client.get("/api/logs/search")
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+
+    assert calls == ["Cats"]
+    assert first.json()[0]["access_status"] == "pending"
+    assert second.json()[0]["access_status"] == "needs_request"
+    assert from_disk.json() == second.json()
+    assert stats.json()["search_cache"] == {
+        "entries": 1,
+        "hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+    }
+    assert len(logs.json()) == 3
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+from datetime import datetime
 from pathlib import Path
 
+from sqlalchemy import event, text
 from sqlmodel import Session, create_engine
 
 from app.db.migrate import run_migrations
-from app.db.models import Channel
-from app.services.sync import select_sync_channel_ids
+from app.db.models import Channel, Video
+from app.services import content_version
+from app.services.sync import refresh_enabled_channels, select_sync_channel_ids, store_videos
 
 
 def test_select_sync_channel_ids_excludes_blocked_and_not_allowed(tmp_path: Path) -> None:
@@ -66,3 +70,462 @@ def test_select_sync_channel_ids_excludes_blocked_and_not_allowed(tmp_path: Path
         selected = select_sync_channel_ids(session)
 
     assert selected == [allowed_channel_id]
+
+
+def test_refresh_enabled_channels_fetches_concurrently(monkeypatch, tmp_path: Path) -> None:
+    db_path = tmp_path / "sync-concurrent.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    run_migrations(engine, Path("app/db/migrations"))
+
+    with Session(engine) as session:
+        for index in range(6):
+            session.add(
+                Channel(
+                    youtube_id=f"UCconcurrent{index:012d}",
+                    resolve_status="ok",
+                    enabled=True,
+                    allowed=True,
+                    blocked=False,
+                )
+            )
+        session.commit()
+
+    in_flight = 0
+    peak = 0
+
+    metadata_batches: list[list[str]] = []
+
+    async def fake_metadata_batch(
+        channel_ids: list[str], conditional: bool = False
+    ) -> dict[str, dict[str, str | None]]:
+        metadata_batches.append(channel_ids)
+        return {
+            channel_id: {"channel_id": channel_id, "title": f"Title {channel_id[-2:]}"}
+            for channel_id in channel_ids
+        }
+
+    async def fake_videos(
+        channel_id: str,
+        uploads_playlist_id: str | None = None,
+        published_after: datetime | None = None,
+    ) -> list[dict[str, str | int | bool | None]]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if channel_id.endswith("05"):
+            raise RuntimeError("upstream unavailable")
+        return [
+            {
+                "youtube_id": f"v{channel_id[-10:]}",
+                "title": "Video",
+                "thumbnail_url": "https://img.example/v.jpg",
+                "published_at": "2024-01-01T00:00:00Z",
+                "duration_seconds": 300,
+                "is_short": False,
+                "view_count": 5,
+            }
+        ]
+
+    monkeypatch.setattr("app.services.sync.engine", engine)
+    monkeypatch.setattr("app.services.sync.settings.sync_concurrency", 3)
+    monkeypatch.setattr("app.services.sync.fetch_channels_metadata", fake_metadata_batch)
+    monkeypatch.setattr("app.services.sync._fetch_channel_videos_with_fallback", fake_videos)
+
+    summary = asyncio.run(refresh_enabled_channels())
+
+    assert peak == 3
+    assert len(metadata_batches) == 1
+    assert len(metadata_batches[0]) == 6
+    assert summary["channels_seen"] == 6
+    assert summary["synced"] == 5
+    assert summary["failed"] == 1
+    assert summary["failures"][0]["error"] == "upstream unavailable"
+
+    with Session(engine) as session:
+        video_count = session.execute(text("SELECT COUNT(*) FROM videos")).one()[0]
+        synced_titles = session.execute(
+            text("SELECT COUNT(*) FROM channels WHERE title IS NOT NULL AND last_sync IS NOT NULL")
+        ).one()[0]
+    assert video_count == 5
+    assert synced_titles == 5
+
+
+def test_refresh_enabled_channels_is_incremental(monkeypatch, tmp_path: Path) -> None:
+    db_path = tmp_path / "sync-incremental.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    run_migrations(engine, Path("app/db/migrations"))
+
+    with Session(engine) as session:
+        known = Channel(
+            youtube_id="UCincremental000000000001",
+            resolve_status="ok",
+            enabled=True,
+            allowed=True,
+            blocked=False,
+        )
+        fresh = Channel(
+            youtube_id="UCincremental000000000002",
+            resolve_status="ok",
+            enabled=True,
+            allowed=True,
+            blocked=False,
+        )
+        session.add(known)
+        session.add(fresh)
+        session.commit()
+        session.refresh(known)
+        for day in (1, 3):
+            session.add(
+                Video(
+                    youtube_id=f"known000000{day}",
+                    channel_id=known.id,
+                    title="Known",
+                    thumbnail_url="https://img.example/k.jpg",
+                    published_at=datetime(2024, 1, day),
+                )
+            )
+        session.commit()
+
+    marks: dict[str, datetime | None] = {}
+
+    async def fake_metadata_batch(
+        channel_ids: list[str], conditional: bool = False
+    ) -> dict[str, dict[str, str | None]]:
+        return {channel_id: {"channel_id": channel_id, "title": "T"} for channel_id in channel_ids}
+
+    async def fake_videos(
+        channel_id: str,
+        uploads_playlist_id: str | None = None,
+        published_after: datetime | None = None,
+    ) -> list[dict[str, str | int | bool | None]]:
+        marks[channel_id] = published_after
+        if published_after is not None:
+            return []
+        return [
+            {
+                "youtube_id": "fresh000001",
+                "title": "Fresh",
+                "thumbnail_url": "https://img.example/f.jpg",
+                "published_at": "2024-01-05T00:00:00Z",
+                "duration_seconds": 300,
+                "is_short": False,
+                "view_count": 1,
+            }
+        ]
+
+    monkeypatch.setattr("app.services.sync.engine", engine)
+    monkeypatch.setattr("app.services.sync.fetch_channels_metadata", fake_metadata_batch)
+    monkeypatch.setattr("app.services.sync._fetch_channel_videos_with_fallback", fake_videos)
+
+    summary = asyncio.run(refresh_enabled_channels())
+
+    assert marks == {
+        "UCincremental000000000001": datetime(2024, 1, 3),
+        "UCincremental000000000002": None,
+    }
+    assert summary["synced"] == 2
+    assert summary["failed"] == 0
+    with Session(engine) as session:
+        video_count = session.execute(text("SELECT COUNT(*) FROM videos")).one()[0]
+    assert video_count == 3
+
+
+def test_unchanged_sync_pass_writes_nothing(monkeypatch, tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'sync-unchanged.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+    with Session(engine) as session:
+        session.add(
+            Channel(
+                youtube_id="UCunchanged00000000000001",
+                resolve_status="ok",
+                enabled=True,
+                allowed=True,
+                blocked=False,
+            )
+        )
+        session.commit()
+
+    title = {"value": "Same"}
+
+    async def fake_metadata_batch(
+        channel_ids: list[str], conditional: bool = False
+    ) -> dict[str, dict[str, str | None]]:
+        return {
+            channel_id: {"channel_id": channel_id, "title": title["value"]}
+            for channel_id in channel_ids
+        }
+
+    async def fake_videos(
+        channel_id: str,
+        uploads_playlist_id: str | None = None,
+        published_after: datetime | None = None,
+    ) -> list[dict[str, str | int | bool | None]]:
+        return [
+            {
+                "youtube_id": "unchanged01",
+                "title": "Video",
+                "thumbnail_url": "https://img.example/u.jpg",
+                "published_at": "2024-01-05T00:00:00Z",
+                "duration_seconds": 300,
+                "is_short": False,
+                "view_count": 7,
+            }
+        ]
+
+    writes: list[str] = []
+
+    def record_write(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+        if statement.lstrip().split(" ", 1)[0].upper() in {"INSERT", "UPDATE", "DELETE"}:
+            writes.append(statement)
+
+    monkeypatch.setattr("app.services.sync.engine", engine)
+    monkeypatch.setattr("app.services.sync.fetch_channels_metadata", fake_metadata_batch)
+    monkeypatch.setattr("app.services.sync._fetch_channel_videos_with_fallback", fake_videos)
+
+    asyncio.run(refresh_enabled_channels())
+    with Session(engine) as session:
+        first_sync = session.execute(text("SELECT last_sync FROM channels")).scalar_one()
+
+    event.listen(engine, "before_cursor_execute", record_write)
+    version = content_version.current()
+    summary = asyncio.run(refresh_enabled_channels())
+    assert summary["synced"] == 1
+    assert writes == []
+    assert content_version.current() == version
+
+    title["value"] = "Renamed"
+    asyncio.run(refresh_enabled_channels())
+    assert content_version.current() == version + 1
+    event.remove(engine, "before_cursor_execute", record_write)
+    assert any(statement.lstrip().startswith("UPDATE channels") for statement in writes)
+    with Session(engine) as session:
+        row = session.execute(text("SELECT title, last_sync FROM channels")).one()
+    assert row[0] == "Renamed"
+    assert row[1] != first_sync
+
+
+def test_store_videos_bulk_upsert_keeps_semantics(tmp_path: Path) -> None:
+    db_path = tmp_path / "sync-store.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    run_migrations(engine, Path("app/db/migrations"))
+
+    def video(youtube_id: str, **overrides: object) -> dict[str, str | int | bool | None]:
+        item: dict[str, str | int | bool | None] = {
+            "youtube_id": youtube_id,
+            "title": youtube_id,
+            "thumbnail_url": "https://img.example/v.jpg",
+            "published_at": "2024-01-01T00:00:00Z",
+            "duration_seconds": 300,
+            "is_short": False,
+            "view_count": 10,
+        }
+        item.update(overrides)
+        return item
+
+    with Session(engine) as session:
+        channel = Channel(youtube_id="UCstore", resolve_status="ok")
+        session.add(channel)
+        session.commit()
+        session.refresh(channel)
+        channel_id = channel.id
+        session.add(
+            Video(
+                youtube_id="existing001",
+                channel_id=channel_id,
+                title="Long",
+                thumbnail_url="x",
+                published_at=datetime(2023, 12, 1),
+                duration_seconds=600,
+                view_count=50,
+            )
+        )
+        session.add(
+            Video(
+                youtube_id="existing002",
+                channel_id=channel_id,
+                title="Short",
+                thumbnail_url="x",
+                published_at=datetime(2023, 12, 2),
+                duration_seconds=30,
+                is_short=True,
+                view_count=5,
+            )
+        )
+        session.add(
+            Video(
+                youtube_id="existing003",
+                channel_id=channel_id,
+                title="Same",
+                thumbnail_url="x",
+                published_at=datetime(2023, 12, 3),
+                duration_seconds=300,
+                view_count=10,
+            )
+        )
+        session.commit()
+
+        result = store_videos(
+            session,
+            channel_id,
+            [
+                video("existing001", duration_seconds=45, is_short=True, view_count=0),
+                video("existing002", duration_seconds=400, is_short=False, view_count=7),
+                video("existing003"),
+                video("new00000001", duration_seconds=20, is_short=True),
+                video("new00000002"),
+                video("new00000002", view_count=99),
+            ],
+        )
+        session.commit()
+
+        rows = {
+            row[0]: tuple(row[1:])
+            for row in session.execute(
+                text(
+                    "SELECT youtube_id, duration_seconds, is_short, view_count, published_at "
+                    "FROM videos"
+                )
+            ).all()
+        }
+
+    assert (result.added, result.updated, result.shorts_marked) == (2, 2, 2)
+    assert rows["existing001"][:3] == (45, 1, 50)
+    assert rows["existing002"][:3] == (30, 1, 7)
+    assert rows["existing003"][:3] == (300, 0, 10)
+    assert rows["new00000001"][:3] == (20, 1, 10)
+    assert rows["new00000002"] == (300, 0, 99, "2024-01-01 00:00:00.000000")
+
+
+def test_sync_pass_does_not_hold_the_write_lock_across_fetches(
+    monkeypatch, tmp_path: Path
+) -> None:
+    db_path = tmp_path / "sync-write-lock.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    run_migrations(engine, Path("app/db/migrations"))
+    # A second writer that gives up quickly instead of waiting out the busy timeout.
+    other_writer = create_engine(f"sqlite:///{db_path}", connect_args={"timeout": 0.1})
+
+    with Session(engine) as session:
+        for index in range(3):
+            session.add(
+                Channel(
+                    youtube_id=f"UCwritelock{index:013d}",
+                    resolve_status="ok",
+                    enabled=True,
+                    allowed=True,
+                    blocked=False,
+                )
+            )
+        session.commit()
+
+    async def fake_metadata_batch(
+        channel_ids: list[str], conditional: bool = False
+    ) -> dict[str, dict[str, str | None]]:
+        return {channel_id: {"channel_id": channel_id, "title": "T"} for channel_id in channel_ids}
+
+    async def fake_videos(
+        channel_id: str,
+        uploads_playlist_id: str | None = None,
+        published_after: datetime | None = None,
+    ) -> list[dict[str, str | int | bool | None]]:
+        # Runs while earlier channels have already been applied by the writer.
+        await asyncio.sleep(0.01 * int(channel_id[-1]))
+        with other_writer.begin() as conn:
+            conn.execute(text("INSERT INTO kids(name) VALUES (:name)"), {"name": channel_id})
+        return [
+            {
+                "youtube_id": f"v{channel_id[-10:]}",
+                "title": "Video",
+                "thumbnail_url": "https://img.example/v.jpg",
+                "published_at": "2024-01-01T00:00:00Z",
+                "duration_seconds": 300,
+                "is_short": False,
+                "view_count": 5,
+            }
+        ]
+
+    monkeypatch.setattr("app.services.sync.engine", engine)
+    monkeypatch.setattr("app.services.sync.settings.sync_concurrency", 1)
+    monkeypatch.setattr("app.services.sync.fetch_channels_metadata", fake_metadata_batch)
+    monkeypatch.setattr("app.services.sync._fetch_channel_videos_with_fallback", fake_videos)
+
+    summary = asyncio.run(refresh_enabled_channels())
+
+    assert summary["synced"] == 3
+    assert summary["failed"] == 0
+    with Session(engine) as session:
+        assert session.execute(text("SELECT COUNT(*) FROM kids")).one()[0] == 3
+        assert session.execute(text("SELECT COUNT(*) FROM videos")).one()[0] == 3
+
+
+def test_failed_store_only_fails_its_own_channel(monkeypatch, tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'sync-store-failure.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+    with Session(engine) as session:
+        session.execute(
+            text(
+                "CREATE TRIGGER reject_broken BEFORE INSERT ON videos "
+                "WHEN NEW.youtube_id = 'broken00001' "
+                "BEGIN SELECT RAISE(ABORT, 'broken video'); END"
+            )
+        )
+        for index in range(3):
+            session.add(
+                Channel(
+                    youtube_id=f"UCstorefail{index:013d}",
+                    resolve_status="ok",
+                    enabled=True,
+                    allowed=True,
+                    blocked=False,
+                )
+            )
+        session.commit()
+
+    async def fake_metadata_batch(
+        channel_ids: list[str], conditional: bool = False
+    ) -> dict[str, dict[str, str | None]]:
+        return {channel_id: {"channel_id": channel_id, "title": "T"} for channel_id in channel_ids}
+
+    async def fake_videos(
+        channel_id: str,
+        uploads_playlist_id: str | None = None,
+        published_after: datetime | None = None,
+    ) -> list[dict[str, str | int | bool | None]]:
+        videos: list[dict[str, str | int | bool | None]] = [
+            {
+                "youtube_id": f"ok{channel_id[-9:]}",
+                "title": "Video",
+                "thumbnail_url": "https://img.example/v.jpg",
+                "published_at": "2024-01-01T00:00:00Z",
+                "duration_seconds": 300,
+                "is_short": False,
+                "view_count": 5,
+            }
+        ]
+        if channel_id.endswith("1"):
+            # The bulk insert stores the first row, then the second is rejected.
+            videos.append({**videos[0], "youtube_id": "broken00001"})
+        return videos
+
+    monkeypatch.setattr("app.services.sync.engine", engine)
+    monkeypatch.setattr("app.services.sync.settings.sync_concurrency", 1)
+    monkeypatch.setattr("app.services.sync.fetch_channels_metadata", fake_metadata_batch)
+    monkeypatch.setattr("app.services.sync._fetch_channel_videos_with_fallback", fake_videos)
+
+    summary = asyncio.run(refresh_enabled_channels())
+    assert summary["synced"] == 2
+    assert summary["failed"] == 1
+    # Again with nothing else to write, so the savepoint opens the transaction itself.
+    summary = asyncio.run(refresh_enabled_channels())
+    assert summary["synced"] == 2
+    assert summary["failed"] == 1
+
+    with Session(engine) as session:
+        stored = session.execute(text("SELECT youtube_id FROM videos ORDER BY id")).scalars().all()
+        errors = session.execute(
+            text("SELECT youtube_id, resolve_error IS NOT NULL FROM channels ORDER BY id")
+        ).all()
+    assert stored == ["ok000000000", "ok000000002"]
+    assert [bool(failed) for _, failed in errors] == [False, True, False]
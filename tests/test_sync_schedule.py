@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+
+from app.core.config import settings
+from app.db.migrate import run_migrations
+from app.db.models import Channel, Video
+from app.services import sync
+from app.services.sync_schedule import SyncScheduler, cadence_interval
+
+DAY = 86400.0
+
+
+def test_cadence_interval_tracks_upload_frequency(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "sync_interval_seconds", 900)
+    monkeypatch.setattr(settings, "sync_max_interval_seconds", 86400)
+    now = 100 * DAY
+
+    daily = [now - DAY * index for index in range(10)]
+    dormant = [now - DAY * (60 + index) for index in range(10)]
+
+    assert cadence_interval(daily, now) == DAY / 24
+    assert cadence_interval(dormant, now) == 86400
+    assert cadence_interval([now], now) == 900
+
+
+def test_scheduler_orders_channels_by_cadence_and_backs_off(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(settings, "sync_interval_seconds", 900)
+    monkeypatch.setattr(settings, "sync_max_interval_seconds", 86400)
+    engine = create_engine(f"sqlite:///{tmp_path / 'schedule.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+    now_dt = datetime.now(timezone.utc)  # noqa: UP017
+    now = now_dt.timestamp()
+
+    with Session(engine) as session:
+        channels = {
+            name: Channel(youtube_id=f"UCschedule-{name}", resolve_status="ok")
+            for name in ("daily", "dormant", "failing", "new")
+        }
+        channels["failing"].resolve_error = "quota exceeded"
+        for channel in channels.values():
+            session.add(channel)
+        session.commit()
+        ids = {name: channel.id for name, channel in channels.items()}
+        for name, offset_days in (("daily", 0), ("dormant", 90), ("failing", 0)):
+            for index in range(5):
+                session.add(
+                    Video(
+                        youtube_id=f"{name[:4]}{index:07d}",
+                        channel_id=ids[name],
+                        title=name,
+                        thumbnail_url="x",
+                        published_at=now_dt - timedelta(days=offset_days + index),
+                    )
+                )
+        session.commit()
+
+        scheduler = SyncScheduler()
+        scheduler.refresh(session, now)
+        assert sorted(scheduler.pop_due(now)) == sorted(ids.values())
+        assert scheduler.pop_due(now) == []
+
+        for name in ("daily", "dormant", "new"):
+            scheduler.record(ids[name], failed=False, now=now)
+        scheduler.record(ids["failing"], failed=True, now=now)
+
+        assert scheduler.due_at(ids["new"]) == now + 900
+        assert scheduler.due_at(ids["daily"]) == now + DAY / 24
+        assert scheduler.due_at(ids["dormant"]) == now + 86400
+        assert scheduler.due_at(ids["failing"]) == now + 900 * 4
+        assert scheduler.pop_due(now + 1000) == [ids["new"]]
+        assert scheduler.seconds_until_next_due(now + 1000) == DAY / 24 - 1000
+
+        session.execute(
+            text("UPDATE channels SET enabled = 0 WHERE id = :id"), {"id": ids["daily"]}
+        )
+        session.commit()
+        scheduler.refresh(session, now + 1000)
+        assert scheduler.due_at(ids["daily"]) is None
+        assert scheduler.due_at(ids["new"]) == now + 1000
+
+
+def test_scheduled_sync_only_fetches_due_channels(monkeypatch, tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'schedule-run.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+    with Session(engine) as session:
+        first = Channel(youtube_id="UCschedule-first", resolve_status="ok")
+        second = Channel(youtube_id="UCschedule-second", resolve_status="ok")
+        session.add(first)
+        session.add(second)
+        session.commit()
+        first_id, second_id = first.id, second.id
+
+    calls: list[list[int]] = []
+
+    async def fake_refresh(channel_ids: list[int] | None = None) -> dict:
+        calls.append(sorted(channel_ids or []))
+        return {"failures": [{"id": second_id, "input": None, "error": "boom"}]}
+
+    monkeypatch.setattr(sync, "engine", engine)
+    monkeypatch.setattr(sync, "refresh_enabled_channels", fake_refresh)
+    scheduler = SyncScheduler()
+
+    asyncio.run(sync._run_scheduled_sync(scheduler))
+    asyncio.run(sync._run_scheduled_sync(scheduler))
+
+    assert calls == [sorted([first_id, second_id])]
+    assert scheduler.due_at(second_id) > scheduler.due_at(first_id)
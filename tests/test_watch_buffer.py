@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+
+from app.db.migrate import run_migrations
+from app.db.session import get_session
+from app.main import app
+from app.services import watch_buffer
+from app.services.limits import remaining_seconds_for
+
+
+def test_heartbeats_are_enforced_before_they_are_flushed(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("app.main.settings.sync_enabled", False)
+    db_path = tmp_path / "watch-buffer.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    run_migrations(engine, Path("app/db/migrations"))
+    with Session(engine) as session:
+        session.execute(text("INSERT INTO kids(name, daily_limit_minutes) VALUES ('Ava', 1)"))
+        session.execute(
+            text(
+                "INSERT INTO channels(youtube_id, allowed, blocked, enabled, resolve_status) "
+                "VALUES ('UCbuffer', 1, 0, 1, 'ok')"
+            )
+        )
+        session.execute(
+            text(
+                "INSERT INTO videos(youtube_id, channel_id, title, thumbnail_url, published_at) "
+                "VALUES ('vid-buffer-1', 1, 'Counting', 'x', '2024-01-01'), "
+                "('vid-buffer-2', 1, 'Planets', 'x', '2024-01-01')"
+            )
+        )
+        session.commit()
+
+    def get_test_session():
+        with Session(engine) as session:
+            yield session
+
+    def heartbeat(client: TestClient, video_id: str, seconds: int):  # type: ignore[no-untyped-def]
+        return client.post(
+            "/api/playback/watch/log",
+            json={"kid_id": 1, "video_id": video_id, "seconds_delta": seconds},
+        )
+
+    app.dependency_overrides[get_session] = get_test_session
+    try:
+        with TestClient(app) as client:
+            first = heartbeat(client, "vid-buffer-1", 40)
+            second = heartbeat(client, "vid-buffer-2", 30)
+            over_limit = heartbeat(client, "vid-buffer-1", 10)
+            with sqlite3.connect(db_path) as conn:
+                rows_before_flush = conn.execute("SELECT COUNT(*) FROM watch_log").fetchone()[0]
+            with Session(engine) as session:
+                remaining = remaining_seconds_for(session, 1, None, datetime.now(timezone.utc))  # noqa: UP017
+            metrics = watch_buffer.watch_buffer_metrics()
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert over_limit.status_code == 403
+    assert over_limit.json()["detail"] == "Daily watch limit reached"
+    assert rows_before_flush == 0
+    assert remaining == 60 - 70
+    assert metrics["pending"] == 2
+    assert metrics["accepted"] == 2
+
+    # Leaving the client ran the lifespan shutdown flush.
+    with sqlite3.connect(db_path) as conn:
+        logged = conn.execute(
+            "SELECT video_id, seconds_watched FROM watch_log ORDER BY video_id"
+        ).fetchall()
+        usage = conn.execute("SELECT SUM(seconds) FROM kid_daily_usage").fetchone()[0]
+    assert logged == [(1, 40), (2, 30)]
+    assert usage == 70
+    assert watch_buffer.watch_buffer_metrics()["pending"] == 0
+
+
+def test_heartbeats_coalesce_per_kid_and_video(tmp_path: Path) -> None:
+    db_path = tmp_path / "watch-buffer-coalesce.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    run_migrations(engine, Path("app/db/migrations"))
+    started = datetime(2024, 6, 3, 10, 0, tzinfo=timezone.utc)  # noqa: UP017
+
+    with Session(engine) as session:
+        for offset in range(0, 300, 12):
+            at = started + timedelta(seconds=offset)
+            watch_buffer.add(session, 1, 7, 2, 12, started_at=at, now=at)
+        watch_buffer.add(session, 1, 8, 2, 5, started_at=started, now=started)
+        assert watch_buffer.pending_seconds(session, 1, "2024-06-03") == {2: 25 * 12 + 5}
+        assert watch_buffer.last_seen(session, 1, 7) == started + timedelta(seconds=288)
+
+    assert watch_buffer.flush() == 2
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT video_id, seconds_watched, started_at, last_heartbeat_at FROM watch_log "
+            "ORDER BY video_id"
+        ).fetchall()
+    assert [(video_id, seconds) for video_id, seconds, _, _ in rows] == [(7, 300), (8, 5)]
+    assert rows[0][2].startswith("2024-06-03 10:00:00")
+    assert rows[0][3].startswith("2024-06-03 10:04:48")
+
+
+def test_flushes_extend_the_open_session_until_it_goes_idle(tmp_path: Path) -> None:
+    db_path = tmp_path / "watch-buffer-sessions.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    run_migrations(engine, Path("app/db/migrations"))
+    started = datetime(2024, 6, 3, 10, 0, tzinfo=timezone.utc)  # noqa: UP017
+
+    def beat(offset: int) -> None:
+        at = started + timedelta(seconds=offset)
+        with Session(engine) as session:
+            watch_buffer.add(session, 1, 7, 2, 12, started_at=at, now=at)
+        watch_buffer.flush()
+
+    beat(0)
+    beat(12)
+    beat(12 + 299)
+    beat(12 + 299 + 301)
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT seconds_watched, started_at, last_heartbeat_at FROM watch_log ORDER BY id"
+        ).fetchall()
+        usage = conn.execute("SELECT seconds FROM kid_daily_usage").fetchall()
+    assert [seconds for seconds, _, _ in rows] == [36, 12]
+    assert rows[0][1].startswith("2024-06-03 10:00:00")
+    assert rows[0][2].startswith("2024-06-03 10:05:11")
+    assert rows[1][1].startswith("2024-06-03 10:10:12")
+    assert usage == [(48,)]
+
+
+def test_migration_compacts_heartbeat_rows_into_sessions(tmp_path: Path) -> None:
+    migrations_dir = Path("app/db/migrations")
+    before_dir = tmp_path / "before"
+    before_dir.mkdir()
+    for path in sorted(migrations_dir.glob("*.sql")):
+        if path.name < "0023":
+            (before_dir / path.name).write_text(path.read_text())
+
+    db_path = tmp_path / "watch-log-compaction.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    run_migrations(engine, before_dir)
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO watch_log(kid_id, video_id, category_id, seconds_watched, started_at) "
+            "VALUES (1, ?, 2, 10, ?)",
+            [
+                (7, "2024-06-03 10:00:00"),
+                (7, "2024-06-03 10:00:12"),
+                (7, "2024-06-03 10:04:00"),
+                (7, "2024-06-03 10:20:00"),
+                (7, "2024-06-04 00:00:05"),
+                (8, "2024-06-03 10:00:24"),
+            ],
+        )
+        usage_before = conn.execute(
+            "SELECT day, seconds FROM kid_daily_usage ORDER BY day"
+        ).fetchall()
+
+    run_migrations(engine, migrations_dir)
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT video_id, seconds_watched, started_at, last_heartbeat_at FROM watch_log "
+            "ORDER BY video_id, started_at"
+        ).fetchall()
+        usage_after = conn.execute(
+            "SELECT day, seconds FROM kid_daily_usage ORDER BY day"
+        ).fetchall()
+
+    assert rows == [
+        (7, 30, "2024-06-03 10:00:00", "2024-06-03 10:04:00"),
+        (7, 10, "2024-06-03 10:20:00", "2024-06-03 10:20:00"),
+        (7, 10, "2024-06-04 00:00:05", "2024-06-04 00:00:05"),
+        (8, 10, "2024-06-03 10:00:24", "2024-06-03 10:00:24"),
+    ]
+    assert usage_before == usage_after == [("2024-06-03", 50), ("2024-06-04", 10)]
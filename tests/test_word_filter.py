@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+
+from app.db.migrate import run_migrations
+from app.db.session import get_session
+from app.main import app
+from app.services.word_filter import BlockedWordMatcher
+
+
+def test_matcher_reports_first_listed_word() -> None:
+    matcher = BlockedWordMatcher(("zombie", "he", "she", "hers", ""))
+
+    assert matcher.first_match("USHERS") == "he"
+    assert matcher.first_match("Zombie shelter") == "zombie"
+    assert matcher.first_match("Planets") is None
+    assert matcher.first_match(None) is None
+    assert not BlockedWordMatcher(())
+
+
+def test_matcher_handles_thousands_of_words() -> None:
+    words = tuple(f"word{index:05d}" for index in range(5000))
+    matcher = BlockedWordMatcher(words)
+
+    assert matcher.first_match("a title with WORD04999 inside") == "word04999"
+    assert matcher.first_match("word0499") is None
+
+
+def test_blocked_titles_are_dropped_from_kid_lists(tmp_path: Path, monkeypatch) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'word-filter.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+    now = datetime.now(timezone.utc)  # noqa: UP017
+    with Session(engine) as session:
+        session.execute(text("INSERT INTO kids(name) VALUES ('Ava')"))
+        session.execute(text("UPDATE parent_settings SET blocked_words = 'scary, zombie'"))
+        session.execute(
+            text(
+                "INSERT INTO channels(youtube_id, title, allowed, blocked, enabled, "
+                "resolve_status) VALUES ('UCwords', 'Words', 1, 0, 1, 'ok')"
+            )
+        )
+        for youtube_id, title in (("vid-word-01", "Zombie dance"), ("vid-word-02", "Planets")):
+            session.execute(
+                text(
+                    "INSERT INTO videos(youtube_id, channel_id, title, thumbnail_url, "
+                    "published_at) VALUES (:youtube_id, 1, :title, 'x', :now)"
+                ),
+                {"youtube_id": youtube_id, "title": title, "now": now.isoformat()},
+            )
+        session.commit()
+
+    async def fake_search_videos(query: str, max_results: int = 12, client=None):
+        del query, max_results, client
+        return [
+            {
+                "video_id": video_id,
+                "title": title,
+                "channel_id": "UCwords",
+                "channel_title": "Words",
+                "thumbnail_url": "https://img",
+            }
+            for video_id, title in (("vid-search-1", "Scary stories"), ("vid-search-2", "Counting"))
+        ]
+
+    def get_test_session():
+        with Session(engine) as session:
+            yield session
+
+    monkeypatch.setattr("app.api.routes_search.search_videos", fake_search_videos)
+    app.dependency_overrides[get_session] = get_test_session
+    try:
+        with TestClient(app) as client:
+            parent_feed = client.get("/api/feed")
+            kid_feed = client.get("/api/feed", params={"kid_id": 1})
+            channel_videos = client.get("/api/channels/UCwords/videos", params={"kid_id": 1})
+            search = client.get("/api/search", params={"q": "stories", "kid_id": 1})
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+
+    assert sorted(item["video_title"] for item in parent_feed.json()) == [
+        "Planets",
+        "Zombie dance",
+    ]
+    assert [item["video_title"] for item in kid_feed.json()] == ["Planets"]
+    assert [item["video_title"] for item in channel_videos.json()] == ["Planets"]
+    assert [item["title"] for item in search.json()] == ["Counting"]
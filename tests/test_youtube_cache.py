@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import httpx
+from sqlalchemy import text
+from sqlmodel import create_engine
+
+from app.core.config import settings
+from app.db.migrate import run_migrations
+from app.services import youtube_cache
+from app.services.youtube import fetch_channels_metadata
+
+CHANNEL_ID = "UC1234567890123456789012"
+
+
+def test_conditional_requests_reuse_cached_body(monkeypatch, tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'etag.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+    monkeypatch.setattr(youtube_cache, "engine", engine)
+    monkeypatch.setattr(settings, "youtube_api_key", "test-key")
+    before = youtube_cache.youtube_cache_metrics()
+    sent_etags: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_etags.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            headers={"ETag": '"v1"'},
+            json={"items": [{"id": CHANNEL_ID, "snippet": {"title": "Cached title"}}]},
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        first = asyncio.run(fetch_channels_metadata([CHANNEL_ID], client=client, conditional=True))
+        monkeypatch.setattr(settings, "youtube_api_key", "rotated-key")
+        second = asyncio.run(
+            fetch_channels_metadata([CHANNEL_ID], client=client, conditional=True)
+        )
+        uncached = asyncio.run(fetch_channels_metadata([CHANNEL_ID], client=client))
+    finally:
+        asyncio.run(client.aclose())
+
+    assert sent_etags == [None, '"v1"', None]
+    assert first[CHANNEL_ID]["title"] == "Cached title"
+    assert second == first
+    assert uncached == first
+
+    metrics = youtube_cache.youtube_cache_metrics()
+    assert metrics["misses"] == before["misses"] + 1
+    assert metrics["hits"] == before["hits"] + 1
+    assert metrics["not_modified"] == before["not_modified"] + 1
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM youtube_etag_cache")).scalar_one() == 0
+    assert youtube_cache.flush() == 1
+
+    with engine.begin() as conn:
+        keys = conn.execute(text("SELECT cache_key FROM youtube_etag_cache")).scalars().all()
+        conn.execute(text("UPDATE youtube_etag_cache SET updated_at = '2000-01-01 00:00:00'"))
+    assert len(keys) == 1
+    assert "key=" not in keys[0]
+
+    # A 304 confirms the entry is still current, so it survives the next prune.
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        revalidated = asyncio.run(
+            fetch_channels_metadata([CHANNEL_ID], client=client, conditional=True)
+        )
+    finally:
+        asyncio.run(client.aclose())
+    assert revalidated == first
+    assert sent_etags[-1] == '"v1"'
+    assert youtube_cache.flush() == 1
+    assert youtube_cache.prune() == 0
+
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE youtube_etag_cache SET updated_at = '2000-01-01 00:00:00'"))
+    assert youtube_cache.prune() == 1
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import create_engine
+
+from app.core.config import settings
+from app.db.migrate import run_migrations
+from app.main import app
+from app.services import youtube_quota
+from app.services.youtube import fetch_channel_metadata, search_videos
+from app.services.youtube_quota import (
+    BACKGROUND,
+    TokenBucket,
+    YouTubeQuotaExceededError,
+    quota_priority,
+)
+
+CHANNEL_ID = "UC1234567890123456789012"
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/channels"):
+        return httpx.Response(200, json={"items": [{"id": CHANNEL_ID, "snippet": {"title": "A"}}]})
+    return httpx.Response(200, json={"items": []})
+
+
+def test_quota_ledger_reserves_budget_for_interactive_calls(monkeypatch, tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'quota.db'}")
+    run_migrations(engine, Path("app/db/migrations"))
+    monkeypatch.setattr(youtube_quota, "engine", engine)
+    monkeypatch.setattr(settings, "youtube_api_key", "test-key")
+    monkeypatch.setattr(settings, "youtube_daily_quota", 150)
+    monkeypatch.setattr(settings, "youtube_quota_interactive_reserve", 100)
+
+    async def run() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            await search_videos("dinosaurs", client=client)
+            with quota_priority(BACKGROUND):
+                with pytest.raises(YouTubeQuotaExceededError):
+                    await fetch_channel_metadata(CHANNEL_ID, client=client)
+            await fetch_channel_metadata(CHANNEL_ID, client=client)
+            with pytest.raises(YouTubeQuotaExceededError):
+                await search_videos("more dinosaurs", client=client)
+
+    asyncio.run(run())
+
+    with TestClient(app) as client:
+        response = client.get("/api/admin/quota")
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["spent"] == 101
+    assert report["remaining"] == 49
+    assert report["endpoints"] == [
+        {"endpoint": "/search", "units": 100, "calls": 1},
+        {"endpoint": "/channels", "units": 1, "calls": 1},
+    ]
+    assert report["history"] == [{"day": report["day"], "units": 101, "calls": 2}]
+
+
+def test_background_requests_are_paced_by_token_bucket(monkeypatch) -> None:
+    bucket = TokenBucket(capacity=2, rate=1)
+    assert bucket.reserve(1) == 0
+    assert bucket.reserve(1) == 0
+    assert bucket.reserve(1) == pytest.approx(1.0, abs=0.05)
+
+    monkeypatch.setattr(settings, "youtube_daily_quota", 10000)
+    monkeypatch.setattr(settings, "youtube_quota_burst", 100)
+    monkeypatch.setattr(settings, "youtube_quota_max_wait_seconds", 1.0)
+    monkeypatch.setattr(youtube_quota, "spent_today", lambda: 0)
+
+    async def run() -> None:
+        with quota_priority(BACKGROUND):
+            assert await youtube_quota.acquire("/search") == 100
+            with pytest.raises(YouTubeQuotaExceededError):
+                await youtube_quota.acquire("/search")
+        assert await youtube_quota.acquire("/search") == 100
+
+    asyncio.run(run())
+
+
+def test_record_does_not_write_while_another_writer_holds_the_lock(
+    monkeypatch, tmp_path: Path
+) -> None:
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'quota-lock.db'}", connect_args={"timeout": 0.1}
+    )
+    run_migrations(engine, Path("app/db/migrations"))
+    monkeypatch.setattr(youtube_quota, "engine", engine)
+
+    with engine.connect() as writer:
+        writer.exec_driver_sql("BEGIN IMMEDIATE")
+        youtube_quota.record("/videos", 1)
+        youtube_quota.record("/videos", 1)
+        assert youtube_quota.spent_today() == 2
+        # A flush that cannot get the lock keeps the usage for the next attempt.
+        assert youtube_quota.flush() == 0
+        writer.exec_driver_sql("ROLLBACK")
+
+    assert youtube_quota.flush() == 1
+    report = youtube_quota.quota_report()
+    assert report["endpoints"] == [{"endpoint": "/videos", "units": 2, "calls": 2}]
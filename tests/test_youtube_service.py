@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import datetime
 
 import httpx
 
 from app.core.config import settings
-from app.services.youtube import parse_channel_input, resolve_channel, resolve_handle_to_channel_id
+from app.services.youtube import (
+    fetch_channel_metadata,
+    fetch_channels_metadata,
+    fetch_latest_videos,
+    parse_channel_input,
+    resolve_channel,
+    resolve_handle_to_channel_id,
+)
 
 CHANNEL_ID = "UC1234567890123456789012"
 
@@ -103,3 +111,192 @@ def test_resolve_handle_falls_back_to_search() -> None:
         asyncio.run(client.aclose())
 
     assert resolved == CHANNEL_ID
+
+
+def test_fetch_latest_videos_reuses_cached_uploads_playlist(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "youtube_api_key", "test-key")
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path.rsplit("/", 1)[-1])
+        if request.url.path.endswith("/playlistItems"):
+            assert request.url.params.get("playlistId") == "UU1234567890123456789012"
+            return httpx.Response(
+                200,
+                json={
+                    "items": [
+                        {
+                            "snippet": {
+                                "title": "Atoms",
+                                "publishedAt": "2024-01-02T00:00:00Z",
+                                "resourceId": {"videoId": "abc123def45"},
+                            }
+                        }
+                    ]
+                },
+            )
+        if request.url.path.endswith("/videos"):
+            return httpx.Response(
+                200,
+                json={
+                    "items": [
+                        {
+                            "id": "abc123def45",
+                            "contentDetails": {"duration": "PT5M"},
+                            "statistics": {"viewCount": "12"},
+                        }
+                    ]
+                },
+            )
+        return httpx.Response(404)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        videos = asyncio.run(
+            fetch_latest_videos(
+                CHANNEL_ID, client=client, uploads_playlist_id="UU1234567890123456789012"
+            )
+        )
+    finally:
+        asyncio.run(client.aclose())
+
+    assert paths == ["playlistItems", "videos"]
+    assert videos[0]["youtube_id"] == "abc123def45"
+    assert videos[0]["duration_seconds"] == 300
+
+
+def test_channel_metadata_includes_uploads_playlist(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "youtube_api_key", "test-key")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert "contentDetails" in request.url.params.get("part", "")
+        return httpx.Response(
+            200,
+            json={
+                "items": [
+                    {
+                        "id": CHANNEL_ID,
+                        "snippet": {"title": "SciShow Kids"},
+                        "contentDetails": {
+                            "relatedPlaylists": {"uploads": "UU1234567890123456789012"}
+                        },
+                    }
+                ]
+            },
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        metadata = asyncio.run(fetch_channel_metadata(CHANNEL_ID, client=client))
+    finally:
+        asyncio.run(client.aclose())
+
+    assert metadata["uploads_playlist_id"] == "UU1234567890123456789012"
+
+
+def test_fetch_channels_metadata_batches_ids(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "youtube_api_key", "test-key")
+    channel_ids = [f"UC{index:022d}" for index in range(120)]
+    requested: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        ids = request.url.params.get("id", "").split(",")
+        requested.append(len(ids))
+        return httpx.Response(
+            200,
+            json={
+                "items": [
+                    {"id": channel_id, "snippet": {"title": channel_id}} for channel_id in ids
+                ]
+            },
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        metadata = asyncio.run(fetch_channels_metadata(channel_ids, client=client))
+    finally:
+        asyncio.run(client.aclose())
+
+    assert requested == [50, 50, 20]
+    assert len(metadata) == 120
+    assert metadata[channel_ids[-1]]["title"] == channel_ids[-1]
+
+
+def test_fetch_latest_videos_stops_at_known_videos(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "youtube_api_key", "test-key")
+    pages = {
+        None: (["new0000000a", "new0000000b"], "page-2"),
+        "page-2": (["new0000000c", "old0000000a"], "page-3"),
+        "page-3": (["old0000000b"], None),
+    }
+    published = {
+        "new0000000a": "2024-03-05T00:00:00Z",
+        "new0000000b": "2024-03-04T00:00:00Z",
+        "new0000000c": "2024-03-03T00:00:00Z",
+        "old0000000a": "2024-03-01T00:00:00Z",
+        "old0000000b": "2024-02-01T00:00:00Z",
+    }
+    calls: list[tuple[str, str | None]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/playlistItems"):
+            token = request.url.params.get("pageToken")
+            calls.append(("playlistItems", token))
+            video_ids, next_token = pages[token]
+            payload = {
+                "items": [
+                    {
+                        "snippet": {
+                            "title": video_id,
+                            "publishedAt": published[video_id],
+                            "resourceId": {"videoId": video_id},
+                        }
+                    }
+                    for video_id in video_ids
+                ]
+            }
+            if next_token:
+                payload["nextPageToken"] = next_token
+            return httpx.Response(200, json=payload)
+        if request.url.path.endswith("/videos"):
+            calls.append(("videos", request.url.params.get("id")))
+            return httpx.Response(200, json={"items": []})
+        return httpx.Response(404)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        videos = asyncio.run(
+            fetch_latest_videos(
+                CHANNEL_ID,
+                max_results=50,
+                client=client,
+                uploads_playlist_id="UU1234567890123456789012",
+                published_after=datetime(2024, 3, 1),
+            )
+        )
+        assert [video["youtube_id"] for video in videos] == [
+            "new0000000a",
+            "new0000000b",
+            "new0000000c",
+        ]
+        assert calls == [
+            ("playlistItems", None),
+            ("playlistItems", "page-2"),
+            ("videos", "new0000000a,new0000000b,new0000000c"),
+        ]
+
+        calls.clear()
+        unchanged = asyncio.run(
+            fetch_latest_videos(
+                CHANNEL_ID,
+                max_results=50,
+                client=client,
+                uploads_playlist_id="UU1234567890123456789012",
+                published_after=datetime(2024, 3, 5),
+            )
+        )
+    finally:
+        asyncio.run(client.aclose())
+
+    assert unchanged == []
+    assert calls == [("playlistItems", None)]